@@ -9,6 +9,10 @@ class Condition(Protocol):
     Any class implementing this protocol can be used as a condition.
     The check method receives the condition config from config.yaml
     and returns (met: bool, description: str).
+
+    A condition may also define check_fast(config), with the same
+    signature, for when only whether it is met matters. Unlock checks
+    use it in place of check when the condition's class defines it.
     """
 
     def check(self, config: dict[str, Any]) -> tuple[bool, str]:
@@ -4,8 +4,10 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from ..obsidian import ObsidianParser
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class ConditionContext:
     """Context passed to condition factories for initialization.
 
@@ -13,6 +15,9 @@ class ConditionContext:
     - Obsidian vault configuration (for obsidian-based conditions)
     - Secrets from config.secrets.yaml (for external API conditions)
     - Full config for advanced use cases
+
+    The context is immutable once built; create a new one to change it.
+    It hashes on the vault settings, so it can be used as a cache key.
     """
 
     # Obsidian vault access (for obsidian-based conditions)
@@ -20,10 +25,48 @@ class ConditionContext:
     daily_note_pattern: str = "Daily/{date}.md"
 
     # Credentials from config.secrets.yaml
-    secrets: dict[str, Any] = field(default_factory=dict)
+    secrets: dict[str, Any] = field(default_factory=dict, hash=False)
 
     # Full config for advanced conditions
-    full_config: dict[str, Any] = field(default_factory=dict)
+    full_config: dict[str, Any] = field(default_factory=dict, hash=False)
+
+    # Dot-path view of secrets, built once in __post_init__
+    _flat_secrets: dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    # Shared parser, created on first use by get_parser()
+    _parser: ObsidianParser | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Flatten secrets into dot-separated paths for constant-time lookup."""
+        if not isinstance(self.secrets, dict):
+            return
+        stack: list[tuple[str, dict]] = [("", self.secrets)]
+        while stack:
+            prefix, node = stack.pop()
+            for key, value in node.items():
+                if not isinstance(key, str):
+                    continue
+                path = f"{prefix}{key}"
+                self._flat_secrets[path] = value
+                if isinstance(value, dict):
+                    stack.append((f"{path}.", value))
+
+    def get_parser(self) -> ObsidianParser:
+        """Get the ObsidianParser shared by all conditions using this context.
+
+        Sharing one parser lets conditions reuse its cached daily note read.
+
+        Raises:
+            ValueError: If the context has no vault_path
+        """
+        if self._parser is None:
+            if self.vault_path is None:
+                raise ValueError("ObsidianParser requires vault_path in context")
+            # Frozen dataclass: bypass __setattr__ for this internal cache
+            object.__setattr__(
+                self, "_parser", ObsidianParser(self.vault_path, self.daily_note_pattern)
+            )
+        return self._parser
 
     def get_secret(self, path: str, default: Any = None) -> Any:
         """Get a secret by dot-separated path.
@@ -39,11 +82,4 @@ class ConditionContext:
             context.get_secret('strava.client_id')
             context.get_secret('whatsapp.api_key', default='')
         """
-        keys = path.split(".")
-        value = self.secrets
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
-                return default
-        return value
+        return self._flat_secrets.get(path, default)
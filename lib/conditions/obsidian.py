@@ -3,7 +3,6 @@
 from typing import Any
 
 from ..obsidian import ObsidianParser
-from ..wordcount import WordCounter
 from .context import ConditionContext
 from .registry import ConditionRegistry
 
@@ -15,7 +14,7 @@ class ObsidianCondition:
     """
 
     def __init__(self, context: ConditionContext):
-        """Initialize with vault path from context.
+        """Initialize with the context's shared parser.
 
         Args:
             context: The condition context with vault configuration
@@ -23,18 +22,18 @@ class ObsidianCondition:
         if context.vault_path is None:
             raise ValueError("ObsidianCondition requires vault_path in context")
 
-        self.parser = ObsidianParser(
-            context.vault_path,
-            context.daily_note_pattern,
-        )
+        self.parser: ObsidianParser = context.get_parser()
 
     def _read_note(self) -> str | None:
         """Read today's daily note content.
 
+        Uses the parser's cached read so repeated checks don't re-read an
+        unchanged note.
+
         Returns:
             The note content, or None if not found
         """
-        return self.parser.read_daily_note()
+        return self.parser.read_daily_note_cached()
 
 
 class CheckboxCondition(ObsidianCondition):
@@ -129,10 +128,24 @@ class LinkedWordcountCondition(ObsidianCondition):
         minimum: The minimum word count required
     """
 
+    def __init__(self, context: ConditionContext):
+        super().__init__(context)
+        # Deferred: only configs with a linked_wordcount condition need it
+        from ..wordcount import WordCounter
+
+        # Kept across checks so unchanged linked files aren't re-counted
+        self.counter = WordCounter(self.parser)
+
     def check(self, config: dict[str, Any]) -> tuple[bool, str]:
         """Check if word count in linked files meets minimum."""
-        counter = WordCounter(self.parser)
-        met, description, _ = counter.check_wordcount_condition(config)
+        met, description, _ = self.counter.check_wordcount_condition(config)
+        return met, description
+
+    def check_fast(self, config: dict[str, Any]) -> tuple[bool, str]:
+        """Check the word count, stopping once the minimum is reached."""
+        met, description, _ = self.counter.check_wordcount_condition(
+            config, stop_at_minimum=True
+        )
         return met, description
 
 
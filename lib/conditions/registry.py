@@ -77,11 +77,40 @@ class ConditionRegistry:
         Raises:
             ValueError: If condition_type is not registered
         """
-        factory = cls.get(condition_type)
-        if factory is None:
-            raise ValueError(f"Unknown condition type: {condition_type}")
+        try:
+            factory = cls._conditions[condition_type]
+        except KeyError:
+            raise ValueError(f"Unknown condition type: {condition_type}") from None
         return factory(context)
 
+    @classmethod
+    def create_all(
+        cls, configs: dict[str, dict[str, Any]], context: ConditionContext
+    ) -> dict[str, Condition]:
+        """Create condition instances for a whole conditions config in one pass.
+
+        Each condition type is instantiated once and shared by every entry
+        of that type, since conditions receive their settings in check().
+
+        Args:
+            configs: Mapping of condition name to its config dict
+            context: The condition context for initialization
+
+        Returns:
+            Mapping of condition name to Condition instance
+
+        Raises:
+            ValueError: If any condition type is not registered
+        """
+        by_type: dict[str, Condition] = {}
+        instances: dict[str, Condition] = {}
+        for name, condition_config in configs.items():
+            condition_type = condition_config.get("type", "checkbox")
+            if condition_type not in by_type:
+                by_type[condition_type] = cls.create(condition_type, context)
+            instances[name] = by_type[condition_type]
+        return instances
+
     @classmethod
     def list_types(cls) -> list[str]:
         """List all registered condition types.
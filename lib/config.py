@@ -1,9 +1,12 @@
 """Configuration loading and management for block_distractions."""
 
+import copy
 import os
-import yaml
+import tempfile
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 # Default configuration locations
 DEFAULT_CONFIG_PATH = Path(__file__).parent.parent / "config.yaml"
@@ -80,6 +83,8 @@ DEFAULT_CONFIG = {
         "enabled": False,
         "days": 3,
         "started_at": None,
+        # Log daemon_check + daemon_check_complete instead of daemon_cycle
+        "split_cycle_events": False,
     },
     "phone_api": {
         "enabled": False,
@@ -88,6 +93,48 @@ DEFAULT_CONFIG = {
     },
 }
 
+# Snapshot of the defaults taken at import time; load() copies this rather
+# than DEFAULT_CONFIG so callers mutating the public dict can't affect it
+_DEFAULT_TEMPLATE: dict[str, Any] = copy.deepcopy(DEFAULT_CONFIG)
+
+
+@lru_cache(maxsize=128)
+def _compile_path(key: str) -> tuple[str, ...]:
+    """Split a dot-separated key path once and reuse the result."""
+    return tuple(key.split("."))
+
+
+# Parsed YAML files keyed by path, validated by (st_mtime_ns, st_size)
+_YAML_CACHE: dict[Path, tuple[int, int, dict[str, Any]]] = {}
+
+
+def _load_yaml_cached(path: Path) -> dict[str, Any] | None:
+    """Load a YAML file, reusing the parsed result while the file is unchanged.
+
+    Returns:
+        A private copy of the parsed mapping, or None if the file doesn't exist
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        _YAML_CACHE.pop(path, None)
+        return None
+
+    cached = _YAML_CACHE.get(path)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        data = cached[2]
+    else:
+        import yaml  # Deferred: only needed when a file actually changed
+
+        # Prefer libyaml's C loader when PyYAML was built with it
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        with open(path, "r") as f:
+            data = yaml.load(f, Loader=loader) or {}
+        _YAML_CACHE[path] = (st.st_mtime_ns, st.st_size, data)
+
+    # Callers merge and mutate the result, so never hand out the cached object
+    return copy.deepcopy(data)
+
 
 class Config:
     """Configuration manager for block_distractions."""
@@ -95,23 +142,31 @@ class Config:
     def __init__(self, config_path: Path | str | None = None):
         self.config_path = Path(config_path) if config_path else DEFAULT_CONFIG_PATH
         self._config: dict[str, Any] = {}
+        self._blocked_set: frozenset[str] | None = None
+        # Resolved values of hot properties, cleared by set() and load()
+        self._resolved: dict[str, Any] = {}
+        # Unsaved changes made through set(), and nesting depth of batch()
+        self._dirty = False
+        self._batch_depth = 0
         self.load()
 
     def load(self) -> None:
         """Load configuration from file, merging with defaults and secrets."""
-        self._config = DEFAULT_CONFIG.copy()
+        # Deep copy so nested defaults are never shared between instances
+        self._config = copy.deepcopy(_DEFAULT_TEMPLATE)
+        self._blocked_set = None
+        self._resolved.clear()
+        self._dirty = False
 
         # Load main config
-        if self.config_path.exists():
-            with open(self.config_path, "r") as f:
-                user_config = yaml.safe_load(f) or {}
+        user_config = _load_yaml_cached(self.config_path)
+        if user_config is not None:
             self._deep_merge(self._config, user_config)
 
         # Load secrets (contains personal paths, IPs, usernames, API keys)
         secrets_path = self.config_path.parent / "config.secrets.yaml"
-        if secrets_path.exists():
-            with open(secrets_path, "r") as f:
-                secrets_config = yaml.safe_load(f) or {}
+        secrets_config = _load_yaml_cached(secrets_path)
+        if secrets_config is not None:
             self._deep_merge(self._config, secrets_config)
             # Also store secrets separately for condition access
             self._config["secrets"] = secrets_config
@@ -122,33 +177,89 @@ class Config:
             self._config["obsidian"]["vault_path"] = os.path.expanduser(vault_path)
 
     def _deep_merge(self, base: dict, override: dict) -> None:
-        """Deep merge override into base dict."""
-        for key, value in override.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                self._deep_merge(base[key], value)
-            else:
-                base[key] = value
+        """Deep merge override into base dict.
+
+        Walks nested dicts with an explicit stack instead of recursing.
+        """
+        stack = [(base, override)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                if isinstance(value, dict):
+                    existing = target.get(key)
+                    if isinstance(existing, dict):
+                        stack.append((existing, value))
+                        continue
+                target[key] = value
 
     def save(self) -> None:
-        """Save current configuration to file."""
-        self.config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.config_path, "w") as f:
-            yaml.dump(self._config, f, default_flow_style=False, sort_keys=False)
+        """Save current configuration to file.
+
+        Writes a uniquely named temp file next to the real config.yaml
+        (following a symlink) and renames it over it, so a crash mid-write
+        never leaves a truncated config and concurrent saves can't share a
+        temp file. The existing file's permissions are kept.
+        """
+        import yaml
+
+        data = yaml.dump(self._config, default_flow_style=False, sort_keys=False)
+
+        target = self.config_path.resolve()
+        target.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            mode = target.stat().st_mode & 0o7777
+        except FileNotFoundError:
+            mode = 0o644
+        fd, temp_path = tempfile.mkstemp(dir=target.parent, prefix=".config.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(temp_path, mode)
+            os.replace(temp_path, target)
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+        self._dirty = False
+
+    def _save_if_dirty(self) -> None:
+        """Save pending changes unless a batch() is deferring them."""
+        if self._dirty and self._batch_depth == 0:
+            self.save()
+
+    @contextmanager
+    def batch(self) -> Iterator["Config"]:
+        """Defer saves from blocklist edits until the block exits.
+
+        Example:
+            with config.batch():
+                for site in sites:
+                    config.add_blocked_site(site)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+        self._save_if_dirty()
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value by dot-separated key path."""
-        keys = key.split(".")
         value = self._config
-        for k in keys:
-            if isinstance(value, dict) and k in value:
+        try:
+            for k in _compile_path(key):
                 value = value[k]
-            else:
-                return default
+        except (KeyError, TypeError):
+            return default
         return value
 
     def set(self, key: str, value: Any) -> None:
         """Set a configuration value by dot-separated key path."""
-        keys = key.split(".")
+        keys = _compile_path(key)
+        self._dirty = True
+        self._resolved.clear()
+        if keys[0] == "blocked_sites":
+            self._blocked_set = None
         config = self._config
         for k in keys[:-1]:
             if k not in config:
@@ -159,12 +270,22 @@ class Config:
     @property
     def obsidian_vault_path(self) -> Path:
         """Get the Obsidian vault path."""
-        return Path(self.get("obsidian.vault_path", ""))
+        try:
+            return self._resolved["vault_path"]
+        except KeyError:
+            path = self._resolved["vault_path"] = Path(self.get("obsidian.vault_path", ""))
+            return path
 
     @property
     def daily_note_pattern(self) -> str:
         """Get the daily note pattern."""
-        return self.get("obsidian.daily_note_pattern", "Daily/{date}.md")
+        try:
+            return self._resolved["daily_note_pattern"]
+        except KeyError:
+            pattern = self._resolved["daily_note_pattern"] = self.get(
+                "obsidian.daily_note_pattern", "Daily/{date}.md"
+            )
+            return pattern
 
     @property
     def conditions(self) -> dict[str, dict]:
@@ -185,6 +306,16 @@ class Config:
         """Get the list of blocked sites."""
         return self.get("blocked_sites", [])
 
+    @property
+    def blocked_sites_set(self) -> frozenset[str]:
+        """Get the blocked sites as a set for membership tests.
+
+        Cached until blocked_sites is changed through set() or load().
+        """
+        if self._blocked_set is None:
+            self._blocked_set = frozenset(self.blocked_sites)
+        return self._blocked_set
+
     @property
     def unlock_settings(self) -> dict[str, Any]:
         """Get unlock settings."""
@@ -227,19 +358,19 @@ class Config:
 
     def add_blocked_site(self, site: str) -> None:
         """Add a site to the blocklist."""
-        sites = self.blocked_sites
-        if site not in sites:
+        if site not in self.blocked_sites_set:
+            sites = self.blocked_sites
             sites.append(site)
             self.set("blocked_sites", sites)
-            self.save()
+            self._save_if_dirty()
 
     def remove_blocked_site(self, site: str) -> None:
         """Remove a site from the blocklist."""
-        sites = self.blocked_sites
-        if site in sites:
+        if site in self.blocked_sites_set:
+            sites = self.blocked_sites
             sites.remove(site)
             self.set("blocked_sites", sites)
-            self.save()
+            self._save_if_dirty()
 
 
 def get_config(config_path: Path | str | None = None) -> Config:
@@ -2,10 +2,11 @@
 
 import time
 import signal
-import sys
+import threading
 import logging
-from logging.handlers import RotatingFileHandler
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 from .config import get_config
@@ -14,6 +15,7 @@ from .hosts import get_hosts_manager, get_remote_sync_manager
 from .obsidian import get_obsidian_parser
 from .unlock import get_unlock_manager
 from .experiment import get_experiment_logger
+from .logfiles import FastRotatingFileHandler
 from .poll import get_poll_manager
 
 # Set up logging with rotation
@@ -27,10 +29,11 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 # Rotating file handler
-file_handler = RotatingFileHandler(
+file_handler = FastRotatingFileHandler(
     LOG_PATH,
     maxBytes=LOG_MAX_BYTES,
     backupCount=LOG_BACKUP_COUNT,
+    compress=True,
 )
 file_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
 logger.addHandler(file_handler)
@@ -41,6 +44,16 @@ stream_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(m
 logger.addHandler(stream_handler)
 
 
+@lru_cache(maxsize=8)
+def _parse_time_of_day(value: str) -> int | None:
+    """Parse an "HH:MM" string into minutes after midnight, or None if invalid."""
+    try:
+        hour, minute = map(int, value.split(":"))
+    except ValueError:
+        return None
+    return hour * 60 + minute
+
+
 class BlockDaemon:
     """Background daemon for automated blocking/unblocking."""
 
@@ -58,16 +71,28 @@ class BlockDaemon:
         )
         self.experiment = get_experiment_logger(self.config)
         self.poll_manager = get_poll_manager(self.config.phone_api_settings)
+        self._poll_enabled = bool(self.poll_manager.enabled)
+        # Phone requests handled this cycle, sent with the end-of-cycle status
+        self._poll_completions: list[tuple[str, dict[str, object]]] = []
+        # Worker fetching phone requests while state loads, created on first use
+        self._poll_executor: ThreadPoolExecutor | None = None
         self.running = False
+        # Set by the signal handler so the wait between checks ends immediately
+        self._stop_event = threading.Event()
 
     def _note_info(self) -> dict[str, object]:
         """Collect metadata about today's daily note."""
         note_path = self.obsidian.get_today_note_path()
-        info: dict[str, object] = {"path": str(note_path), "exists": note_path.exists()}
-        if info["exists"]:
+        info: dict[str, object] = {"path": str(note_path)}
+        # One stat() serves as both the existence check and the metadata
+        try:
             stat = note_path.stat()
-            info["mtime"] = datetime.fromtimestamp(stat.st_mtime).isoformat(timespec="seconds")
-            info["size"] = stat.st_size
+        except (FileNotFoundError, NotADirectoryError):
+            info["exists"] = False
+            return info
+        info["exists"] = True
+        info["mtime"] = datetime.fromtimestamp(stat.st_mtime).isoformat(timespec="seconds")
+        info["size"] = stat.st_size
         return info
 
     def _state_context(self) -> dict[str, object]:
@@ -88,23 +113,59 @@ class BlockDaemon:
         if not self.poll_manager.enabled:
             return
 
+        # Completions and the status go to the remote host in one call
+        completions, self._poll_completions = self._poll_completions, []
         try:
             status = self.unlock_manager.get_status()
-            self.poll_manager.update_status(status)
+        except Exception as e:
+            # Still mark requests completed, so they aren't handled twice
+            logger.error(f"Error getting status for phone: {e}")
+            status = None
+        if status is None and not completions:
+            return
+
+        try:
+            pending = self.poll_manager.poll_cycle(status, completions)
         except Exception as e:
             logger.error(f"Error syncing phone status: {e}")
+            pending = None
+        if pending is None:
+            # Requests left pending on the remote would be handled again,
+            # so keep their completions for the next cycle
+            self._poll_completions[:0] = completions
+
+    def _prefetch_poll_requests(self) -> Future:
+        """Start fetching pending phone requests in the background."""
+        if self._poll_executor is None:
+            self._poll_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="phone-poll"
+            )
+        return self._poll_executor.submit(self.poll_manager.check_pending_requests)
 
-    def process_poll_requests(self) -> None:
-        """Check for and process any pending phone unlock requests."""
+    def process_poll_requests(self, prefetched: Future | None = None) -> bool:
+        """Check for and process any pending phone unlock requests.
+
+        Args:
+            prefetched: A check_pending_requests() call already started by
+                _prefetch_poll_requests(), used instead of fetching again
+
+        Returns:
+            True if any request was processed (state may have changed)
+        """
         if not self.poll_manager.enabled:
-            return
+            return False
 
+        processed = False
         try:
-            pending = self.poll_manager.check_pending_requests()
+            if prefetched is not None:
+                pending = prefetched.result()
+            else:
+                pending = self.poll_manager.check_pending_requests()
             if not pending:
-                return
+                return False
 
             for request in pending:
+                processed = True
                 req_id = request.get("id", "unknown")
                 req_type = request.get("type", "")
                 logger.info(f"Processing phone request: {req_type} (id={req_id})")
@@ -129,8 +190,8 @@ class BlockDaemon:
                     else:
                         logger.info(f"Phone emergency unlock failed: {message}")
 
-                # Mark the request as completed
-                self.poll_manager.mark_completed(req_id, result)
+                # Marked completed on the remote by sync_phone_status()
+                self._poll_completions.append((req_id, result))
 
                 # Log the event
                 self.experiment.log_event(
@@ -140,21 +201,20 @@ class BlockDaemon:
                     result=result,
                 )
 
-            # Update the remote status so phone UI reflects changes
-            status = self.unlock_manager.get_status()
-            self.poll_manager.update_status(status)
-
         except Exception as e:
             logger.error(f"Error processing phone requests: {e}")
 
+        return processed
+
     def evaluate_auto_unlock(self) -> tuple[bool, dict[str, object]]:
         """Check if auto-unlock should happen now, with context."""
         auto_settings = self.config.auto_unlock_settings
+        now = datetime.now()
         info: dict[str, object] = {
             "enabled": bool(auto_settings.get("enabled", True)),
             "earliest_time": auto_settings.get("earliest_time", "17:00"),
             "check_interval": auto_settings.get("check_interval", 300),
-            "now": datetime.now().isoformat(timespec="seconds"),
+            "now": now.isoformat(timespec="seconds"),
             "earliest_passed": None,
             "earliest_parse_error": None,
             "blocked": None,
@@ -168,19 +228,16 @@ class BlockDaemon:
 
         # Check if we're past the earliest time
         earliest = info["earliest_time"]
-        try:
-            earliest_hour, earliest_minute = map(int, earliest.split(":"))
-            now = datetime.now()
-            if now.hour < earliest_hour or (
-                now.hour == earliest_hour and now.minute < earliest_minute
-            ):
-                info["earliest_passed"] = False
-                return False, info
-            info["earliest_passed"] = True
-        except ValueError:
+        # Checked before the cached parser, which can't hash values like lists
+        earliest_minutes = _parse_time_of_day(earliest) if isinstance(earliest, str) else None
+        if earliest_minutes is None:
             info["earliest_parse_error"] = f"Invalid earliest_time format: {earliest}"
             logger.warning(info["earliest_parse_error"])
             return False, info
+        if now.hour * 60 + now.minute < earliest_minutes:
+            info["earliest_passed"] = False
+            return False, info
+        info["earliest_passed"] = True
 
         # Check if already unlocked via conditions today (prevents re-unlock after expiry)
         already_unlocked_today = self.state.unlocked_via_conditions_today
@@ -206,39 +263,60 @@ class BlockDaemon:
 
     def run_check(self) -> None:
         """Run a single check cycle."""
+        # Conditions are evaluated at most once per cycle
+        with self.unlock_manager.reuse_condition_results():
+            self._run_check_cycle()
+
+    def _run_check_cycle(self) -> None:
+        """Sync blocking, apply auto-unlock and phone requests, and log."""
         try:
+            # Fetch phone requests while state loads; with remote state both
+            # are ssh calls, so the cycle only waits for the slower one
+            prefetched = self._prefetch_poll_requests() if self._poll_enabled else None
+
             # Reload state from file to pick up changes from CLI
             self.state.load()
 
-            # Check for phone unlock requests first (polling)
-            self.process_poll_requests()
+            # Check for phone unlock requests first (polling), and reload
+            # state only if a request may have modified it
+            if self._poll_enabled and self.process_poll_requests(prefetched):
+                self.state.load()
 
-            # Reload state again in case phone request modified it
-            self.state.load()
-
-            pre_state = self._state_context()
-            pre_hosts_blocking = self.hosts.is_blocking_active()
+            # Only gather diagnostics when the experiment log will record them
+            log_enabled = self.experiment.enabled
+            pre_state = self._state_context() if log_enabled else None
+            pre_hosts_blocking = self.hosts.is_blocking_active() if log_enabled else None
 
             # Always sync blocking state first
-            self.unlock_manager.sync_blocking_state()
+            self.unlock_manager.sync_blocking_state(background=True)
 
             # Check if auto-unlock should happen
             should_unlock, auto_info = self.evaluate_auto_unlock()
-            self.experiment.log_event(
-                "daemon_check",
-                note=self._note_info(),
-                hosts_blocking_before_sync=pre_hosts_blocking,
-                hosts_blocking_after_sync=self.hosts.is_blocking_active(),
-                auto_unlock=auto_info,
-                config={
-                    "obsidian_vault_path": str(self.config.obsidian_vault_path),
-                    "daily_note_pattern": self.config.daily_note_pattern,
-                    "unlock": self.config.unlock_settings,
-                },
-                state_before_sync=pre_state.get("state"),
-                remote_state=pre_state.get("remote_state"),
-                state_after_sync=self._state_context().get("state"),
-            )
+
+            # Snapshots reused for the rest of the cycle; hosts_active is
+            # updated from the block/unblock results rather than re-read
+            hosts_active = self.hosts.is_blocking_active()
+            note_info = self._note_info() if log_enabled else None
+            post_state = self._state_context() if log_enabled else None
+
+            check_fields: dict[str, object] = {}
+            if log_enabled:
+                check_fields = {
+                    "note": note_info,
+                    "hosts_blocking_before_sync": pre_hosts_blocking,
+                    "hosts_blocking_after_sync": hosts_active,
+                    "auto_unlock": auto_info,
+                    "config": {
+                        "obsidian_vault_path": str(self.config.obsidian_vault_path),
+                        "daily_note_pattern": self.config.daily_note_pattern,
+                        "unlock": self.config.unlock_settings,
+                    },
+                    "state_before_sync": pre_state.get("state"),
+                    "remote_state": pre_state.get("remote_state"),
+                    "state_after_sync": post_state.get("state"),
+                }
+                if self.experiment.split_cycle_events:
+                    self.experiment.log_event("daemon_check", **check_fields)
 
             action = "no_change"
             if should_unlock:
@@ -246,70 +324,101 @@ class BlockDaemon:
                 duration = self.config.unlock_settings.get("proof_of_work_duration", 7200)
                 self.state.set_unlocked(duration)
                 self.state.mark_unlocked_via_conditions()  # Prevent re-unlock after expiry
-                self.hosts.unblock_sites()
-                # Sync to remote (unblock all)
+                if self.hosts.unblock_sites():
+                    hosts_active = False
+                # Sync to remote (unblock all) without holding up the check
                 if self.remote_sync.enabled:
-                    success, msg = self.remote_sync.sync([])
-                    if not success:
-                        logger.error(f"Remote sync failed during auto-unlock: {msg}")
+                    self.remote_sync.sync_async([], "auto-unlock")
                 logger.info(f"Auto-unlocked for {duration} seconds")
                 action = "auto_unlock"
             else:
                 # Make sure blocking is in sync with state
                 if self.state.is_blocked:
-                    if not self.hosts.is_blocking_active():
+                    if not hosts_active:
                         logger.info("Re-enabling blocking...")
-                        self.hosts.block_sites(self.config.blocked_sites)
+                        if self.hosts.block_sites(self.config.blocked_sites):
+                            hosts_active = True
                         if self.remote_sync.enabled:
-                            success, msg = self.remote_sync.sync(self.config.blocked_sites)
-                            if not success:
-                                logger.error(f"Remote sync failed during re-block: {msg}")
+                            self.remote_sync.sync_async(self.config.blocked_sites, "re-block")
                         action = "reblock_hosts"
                 else:
-                    if self.hosts.is_blocking_active():
+                    if hosts_active:
                         logger.info("Removing blocks (unlocked)...")
-                        self.hosts.unblock_sites()
+                        if self.hosts.unblock_sites():
+                            hosts_active = False
                         if self.remote_sync.enabled:
-                            success, msg = self.remote_sync.sync([])
-                            if not success:
-                                logger.error(f"Remote sync failed during unblock: {msg}")
+                            self.remote_sync.sync_async([], "unblock")
                         action = "unblock_hosts"
 
-            self.experiment.log_event(
-                "daemon_check_complete",
-                action=action,
-                note=self._note_info(),
-                hosts_blocking=self.hosts.is_blocking_active(),
-                **self._state_context(),
-            )
-
-            # Sync status to phone API every cycle
-            self.sync_phone_status()
+            if log_enabled:
+                # State only changes if an action was taken; hosts_active
+                # already tracks the block/unblock write above
+                if action != "no_change":
+                    post_state = self._state_context()
+                if self.experiment.split_cycle_events:
+                    self.experiment.log_event(
+                        "daemon_check_complete",
+                        action=action,
+                        note=note_info,
+                        hosts_blocking=hosts_active,
+                        **post_state,
+                    )
+                else:
+                    # One record per cycle: the pre-action fields plus the outcome
+                    check_fields.update(post_state)
+                    self.experiment.log_event(
+                        "daemon_cycle",
+                        action=action,
+                        hosts_blocking=hosts_active,
+                        **check_fields,
+                    )
 
         except Exception as e:
             logger.error(f"Error during check: {e}")
 
+        finally:
+            # Sync status to phone API every cycle, along with any requests
+            # processed, even if the cycle failed after handling them
+            if self._poll_enabled:
+                self.sync_phone_status()
+
     def run(self) -> None:
         """Run the daemon loop."""
         interval = self.config.auto_unlock_settings.get("check_interval", 300)
         logger.info(f"Starting daemon with {interval}s check interval")
 
         self.running = True
+        self._stop_event.clear()
 
         # Set up signal handlers
         def handle_signal(signum, frame):
             logger.info("Received shutdown signal")
-            self.running = False
+            self.stop()
 
         signal.signal(signal.SIGTERM, handle_signal)
         signal.signal(signal.SIGINT, handle_signal)
 
+        # Schedule checks against a monotonic deadline so the time spent in
+        # run_check doesn't push every later check back; if a check overruns
+        # the interval, the next one starts immediately
+        deadline = time.monotonic()
         while self.running:
             self.run_check()
-            time.sleep(interval)
+            deadline += interval
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                deadline = time.monotonic()
+                continue
+            if self._stop_event.wait(remaining):
+                break
 
         logger.info("Daemon stopped")
 
+    def stop(self) -> None:
+        """Stop the daemon loop, waking it if it is waiting between checks."""
+        self.running = False
+        self._stop_event.set()
+
     def run_once(self) -> None:
         """Run a single check (for testing or one-shot usage)."""
         self.run_check()
@@ -1,48 +1,117 @@
 """Experiment logging for multi-day diagnosis."""
 
+import atexit
 import json
 import logging
 import os
+import queue
 import socket
 import time
 from datetime import datetime, date
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Any
 
+from .logfiles import FastRotatingFileHandler
 
+
+LOGGER_NAME = "block_distractions.experiment"
 LOG_DIR = Path(__file__).parent.parent / ".logs"
 LOG_PATH = LOG_DIR / "experiment.log"
 LOG_MAX_BYTES = 2 * 1024 * 1024  # 2 MB
 LOG_BACKUP_COUNT = 3
 META_PATH = LOG_DIR / "experiment.meta.json"
 
+# Reused encoder for log lines; compact separators keep the log small.
+# Keys are written in insertion order, not sorted.
+_encode = json.JSONEncoder(ensure_ascii=True, separators=(",", ":")).encode
+
+# Background thread writing queued experiment records to LOG_PATH
+_listener: QueueListener | None = None
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the background writer thread.
+
+    The queue handler is detached too, so a later ExperimentLogger starts
+    a new listener instead of queueing records nothing will write.
+    """
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+    experiment_logger = logging.getLogger(LOGGER_NAME)
+    for handler in list(experiment_logger.handlers):
+        if isinstance(handler, QueueHandler):
+            experiment_logger.removeHandler(handler)
+
 
 class ExperimentLogger:
     """Write structured JSON lines to the experiment log."""
 
-    def __init__(self, enabled: bool, days: int = 3, started_at: str | None = None):
+    def __init__(
+        self,
+        enabled: bool,
+        days: int = 3,
+        started_at: str | None = None,
+        split_cycle_events: bool = False,
+    ):
         self.enabled = enabled
         self.days = days
         self.started_at = started_at
-        self._logger = logging.getLogger("block_distractions.experiment")
+        # Log daemon cycles as separate daemon_check/daemon_check_complete
+        # events (the older format) instead of a single daemon_cycle event
+        self.split_cycle_events = split_cycle_events
+        self._logger = logging.getLogger(LOGGER_NAME)
+
+        # Fields that don't change for the life of the process
+        self._static_fields: dict[str, Any] = {
+            "tz": time.tzname[0] if time.tzname else "",
+            "pid": os.getpid(),
+            "ppid": os.getppid(),
+            "user": os.getenv("USER", ""),
+            "host": socket.gethostname() if enabled else "",
+            "experiment_days": days,
+        }
+        # (today, started_at, experiment_day) from the last _experiment_day()
+        self._day_cache: tuple[date, Any, int | None] | None = None
 
         if self.enabled:
             LOG_DIR.mkdir(exist_ok=True)
-            if not self._logger.handlers:
-                handler = RotatingFileHandler(
-                    LOG_PATH,
-                    maxBytes=LOG_MAX_BYTES,
-                    backupCount=LOG_BACKUP_COUNT,
-                )
-                handler.setFormatter(logging.Formatter("%(message)s"))
-                self._logger.addHandler(handler)
-                self._logger.setLevel(logging.INFO)
-                self._logger.propagate = False
+            if _listener is None:
+                self._start_listener()
 
             self._normalize_started_at()
             self._ensure_meta()
 
+    def _start_listener(self) -> None:
+        """Route records through a queue so file writes happen off-thread."""
+        global _listener
+        handler = FastRotatingFileHandler(
+            LOG_PATH,
+            maxBytes=LOG_MAX_BYTES,
+            backupCount=LOG_BACKUP_COUNT,
+            compress=True,
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._logger.addHandler(QueueHandler(log_queue))
+        self._logger.setLevel(logging.INFO)
+        self._logger.propagate = False
+
+        _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_stop_listener)
+
+    def close(self) -> None:
+        """Flush pending events to disk and stop the writer thread."""
+        _stop_listener()
+
     def _normalize_started_at(self) -> None:
         """Normalize started_at into an ISO string when possible."""
         if self.started_at is None:
@@ -58,67 +127,86 @@ class ExperimentLogger:
 
     def _ensure_meta(self) -> None:
         """Ensure the experiment meta file exists to track start date."""
+        existing = self._read_meta()
+
         if self.started_at:
-            payload = {
-                "started_at": self.started_at,
-                "days": self.days,
-            }
-            META_PATH.write_text(json.dumps(payload, indent=2))
+            self._write_meta(existing)
             return
 
-        if META_PATH.exists():
-            try:
-                data = json.loads(META_PATH.read_text())
-                self.started_at = data.get("started_at")
-            except (json.JSONDecodeError, OSError):
-                self.started_at = None
+        if existing is not None:
+            self.started_at = existing.get("started_at")
 
         if not self.started_at:
             self.started_at = datetime.now().isoformat(timespec="seconds")
-            payload = {
-                "started_at": self.started_at,
-                "days": self.days,
-            }
-            META_PATH.write_text(json.dumps(payload, indent=2))
+            self._write_meta(existing)
             self.log_event("experiment_start")
 
+    def _read_meta(self) -> dict[str, Any] | None:
+        """Read the meta file, or None if it is missing or unreadable."""
+        try:
+            data = json.loads(META_PATH.read_text())
+        except (json.JSONDecodeError, OSError):
+            return None
+        return data if isinstance(data, dict) else None
+
+    def _write_meta(self, existing: dict[str, Any] | None) -> None:
+        """Write the meta file unless it already holds the same values."""
+        payload = {
+            "started_at": self.started_at,
+            "days": self.days,
+        }
+        if existing == payload:
+            return
+        META_PATH.write_text(json.dumps(payload, indent=2))
+
     def _experiment_day(self) -> int | None:
-        """Compute the current experiment day (1-based)."""
+        """Compute the current experiment day (1-based).
+
+        The result only changes when the date or started_at changes, so it
+        is cached rather than re-parsing started_at for every event.
+        """
+        today = date.today()
+        cached = self._day_cache
+        if cached is not None and cached[0] == today and cached[1] == self.started_at:
+            return cached[2]
+
+        start_date = self._parse_start_date()
+        day = (today - start_date).days + 1 if start_date is not None else None
+        self._day_cache = (today, self.started_at, day)
+        return day
+
+    def _parse_start_date(self) -> date | None:
+        """Parse started_at into a date, or None if unset or invalid."""
         if not self.started_at:
             return None
         try:
             if isinstance(self.started_at, datetime):
-                start_date = self.started_at.date()
-            elif isinstance(self.started_at, date):
-                start_date = self.started_at
-            else:
-                start_date = datetime.fromisoformat(str(self.started_at)).date()
+                return self.started_at.date()
+            if isinstance(self.started_at, date):
+                return self.started_at
+            return datetime.fromisoformat(str(self.started_at)).date()
         except (ValueError, TypeError):
             try:
-                start_date = date.fromisoformat(str(self.started_at))
+                return date.fromisoformat(str(self.started_at))
             except (ValueError, TypeError):
                 return None
-        return (date.today() - start_date).days + 1
 
     def log_event(self, event: str, **data: Any) -> None:
         """Log an event with structured context."""
         if not self.enabled:
             return
 
+        # One clock read for both timestamps
+        now = time.time()
         payload = {
-            "ts": datetime.now().isoformat(timespec="seconds"),
-            "epoch": round(time.time(), 3),
-            "tz": time.tzname[0] if time.tzname else "",
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(now)),
+            "epoch": round(now, 3),
             "event": event,
-            "pid": os.getpid(),
-            "ppid": os.getppid(),
-            "user": os.getenv("USER", ""),
-            "host": socket.gethostname(),
             "experiment_day": self._experiment_day(),
-            "experiment_days": self.days,
+            **self._static_fields,
+            **data,
         }
-        payload.update(data)
-        self._logger.info(json.dumps(payload, ensure_ascii=True, sort_keys=True))
+        self._logger.info(_encode(payload))
 
 
 def get_experiment_logger(config: Any) -> ExperimentLogger:
@@ -129,4 +217,10 @@ def get_experiment_logger(config: Any) -> ExperimentLogger:
     enabled = bool(settings.get("enabled", False))
     days = int(settings.get("days", 3) or 3)
     started_at = settings.get("started_at") or None
-    return ExperimentLogger(enabled=enabled, days=days, started_at=started_at)
+    split_cycle_events = bool(settings.get("split_cycle_events", False))
+    return ExperimentLogger(
+        enabled=enabled,
+        days=days,
+        started_at=started_at,
+        split_cycle_events=split_cycle_events,
+    )
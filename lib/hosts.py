@@ -1,10 +1,22 @@
 """Hosts file management for blocking sites."""
 
+import itertools
 import logging
+import mmap
+import os
+import platform
+import random
+import re
+import stat
 import subprocess
 import tempfile
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterable, Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -13,12 +25,170 @@ BEGIN_MARKER = "# BEGIN BLOCK_DISTRACTIONS"
 END_MARKER = "# END BLOCK_DISTRACTIONS"
 BLOCK_IP = "127.0.0.1"
 
+# Options for every ssh/scp call: fail fast on dead connections instead of
+# waiting out TCP timeouts, and never stop to prompt for a password
+SSH_OPTIONS = (
+    "-o", "ConnectTimeout=5",
+    "-o", "ServerAliveInterval=3",
+    "-o", "ServerAliveCountMax=2",
+    "-o", "BatchMode=yes",
+)
+
+# Multiplexed ssh connections: later ssh/scp calls to the same host reuse
+# an open master connection instead of repeating the handshake. The master
+# stays up for SSH_CONTROL_PERSIST seconds after its last session closes.
+# Kept under /tmp rather than $TMPDIR, which on macOS is too long a prefix
+# for a unix socket path.
+SSH_CONTROL_DIR = Path("/tmp") / f"block-distractions-ssh-{os.getuid()}"
+SSH_CONTROL_PERSIST = 600
+
+_BEGIN_MARKER_BYTES = BEGIN_MARKER.encode()
+_IPV4_PREFIX = BLOCK_IP + " "
+_IPV6_PREFIX = "::1 "
+
+# stderr messages from ssh/scp that are worth retrying
+_TRANSIENT_SSH_ERROR_RE = re.compile("|".join(map(re.escape, [
+    "Connection reset by peer",
+    "Connection refused",
+    "Connection timed out",
+    "Network is unreachable",
+    "No route to host",
+    # sshd dropped the connection before the handshake, usually because
+    # MaxStartups is throttling new connections
+    "kex_exchange_identification",
+    "ssh_exchange_identification",
+])))
+_THROTTLED_SSH_ERROR_RE = re.compile("(?:kex|ssh)_exchange_identification")
+
+# Minimum retry delay when sshd is throttling new connections
+SSH_THROTTLED_BACKOFF = 5  # seconds
+
+_SYSTEM = platform.system()
+_LINUX_FLUSH_CMDS = (
+    ["sudo", "resolvectl", "flush-caches"],
+    ["sudo", "systemd-resolve", "--flush-caches"],
+)
+# The Linux flush command that last succeeded
+_linux_flush_cmd: list[str] | None = None
+
+
+def canonicalize_sites(sites: Iterable[str]) -> frozenset[str]:
+    """Reduce a site list to unique bare domains.
+
+    A leading www. is dropped, since every domain is blocked along with
+    its www. variant.
+    """
+    return frozenset(site[4:] if site.startswith("www.") else site for site in sites)
+
+
+def _iter_host_entries(sites: Iterable[str]) -> Iterator[str]:
+    """Yield the hosts file lines blocking each bare domain."""
+    for site in sites:
+        # Add both IPv4 and IPv6 blocking for each domain
+        # IPv6 is needed because some sites have AAAA records and Safari prefers IPv6
+        yield _IPV4_PREFIX + site
+        yield _IPV6_PREFIX + site
+        yield _IPV4_PREFIX + "www." + site
+        yield _IPV6_PREFIX + "www." + site
+
+
+@contextmanager
+def _staged_file(content: str) -> Iterator[str]:
+    """Stage content in a file for another process to copy, yielding its path.
+
+    On Linux the content lives in an in-memory memfd, exposed through
+    /proc/<pid>/fd (sudo closes inherited fds, so /proc/self won't do).
+    Elsewhere it falls back to a temp file that is removed afterwards.
+    """
+    if hasattr(os, "memfd_create"):
+        fd = os.memfd_create("block-distractions-hosts")
+        try:
+            with open(fd, "w", closefd=False) as f:
+                f.write(content)
+            yield f"/proc/{os.getpid()}/fd/{fd}"
+        finally:
+            os.close(fd)
+        return
+
+    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".hosts") as f:
+        f.write(content)
+    try:
+        yield f.name
+    finally:
+        Path(f.name).unlink(missing_ok=True)
+
+
+@lru_cache(maxsize=8)
+def _build_dnsmasq_content(sites: tuple[str, ...]) -> str:
+    """Build dnsmasq address= lines for sorted, canonicalized sites.
+
+    address= blocks ALL record types (A, AAAA, HTTPS, SVCB, etc.), which
+    prevents Safari's HTTPS record IP hint bypass.
+    """
+    lines = [
+        line
+        for site in sites
+        for line in (f"address=/{site}/", f"address=/www.{site}/")
+    ]
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+@lru_cache(maxsize=1)
+def ssh_options() -> tuple[str, ...]:
+    """Get the options for ssh/scp calls, including connection sharing.
+
+    Control sockets live in a per-user directory. If it can't be created or
+    isn't private to this user, connection sharing is left off.
+    """
+    try:
+        SSH_CONTROL_DIR.mkdir(mode=0o700, exist_ok=True)
+        st = SSH_CONTROL_DIR.lstat()
+    except OSError:
+        return SSH_OPTIONS
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+        logger.warning(f"Not sharing ssh connections: {SSH_CONTROL_DIR} is not private")
+        return SSH_OPTIONS
+    return SSH_OPTIONS + (
+        "-o", "ControlMaster=auto",
+        "-o", f"ControlPath={SSH_CONTROL_DIR}/%C",
+        "-o", f"ControlPersist={SSH_CONTROL_PERSIST}",
+    )
+
+
+def is_transient_ssh_error(stderr: str) -> bool:
+    """Check whether an ssh/scp failure looks like a transient network error."""
+    return _TRANSIENT_SSH_ERROR_RE.search(stderr) is not None
+
+
+def ssh_retry_delay(stderr: str, previous: float, initial: float, maximum: float) -> float:
+    """Pick the delay before retrying a failed ssh/scp call.
+
+    Uses decorrelated jitter: each delay is drawn between the initial delay
+    and three times the previous one, capped at maximum, so callers retrying
+    at the same time spread out. Throttling errors start from at least
+    SSH_THROTTLED_BACKOFF.
+    """
+    if _THROTTLED_SSH_ERROR_RE.search(stderr):
+        initial = max(initial, SSH_THROTTLED_BACKOFF)
+    return min(maximum, random.uniform(initial, max(initial, previous * 3)))
+
 
 class HostsManager:
     """Manages the /etc/hosts file for blocking sites."""
 
     def __init__(self, hosts_path: Path | str | None = None):
         self.hosts_path = Path(hosts_path) if hosts_path else HOSTS_FILE
+        # ((st_mtime_ns, st_size), sites) when the file last matched block_sites(),
+        # with sites None when it last matched unblock_sites()
+        self._in_sync: tuple[tuple[int, int] | None, frozenset[str] | None] | None = None
+
+    def _stat_key(self) -> tuple[int, int] | None:
+        """Get (mtime_ns, size) of the hosts file, or None if missing."""
+        try:
+            st = self.hosts_path.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
 
     def _read_hosts(self) -> str:
         """Read the current hosts file content."""
@@ -26,23 +196,33 @@ class HostsManager:
             return self.hosts_path.read_text()
         return ""
 
-    def _write_hosts(self, content: str) -> bool:
-        """Write content to hosts file using sudo."""
+    def _hosts_contains(self, needle: bytes) -> bool:
+        """Search the hosts file for needle via mmap, without decoding it."""
         try:
-            # Write to a temp file first
-            with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".hosts") as f:
-                f.write(content)
-                temp_path = f.name
+            with open(self.hosts_path, "rb") as f:
+                # mmap can't map an empty file
+                if not os.fstat(f.fileno()).st_size:
+                    return False
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return mm.find(needle) != -1
+        except FileNotFoundError:
+            return False
 
-            # Use sudo to copy the temp file to /etc/hosts
-            result = subprocess.run(
-                ["sudo", "cp", temp_path, str(self.hosts_path)],
-                capture_output=True,
-                text=True,
-            )
+    def _write_hosts(self, content: str) -> bool:
+        """Write content to hosts file, using sudo unless it's writable."""
+        try:
+            # Running as root (or with a user-owned hosts file) needs no sudo
+            if os.access(self.hosts_path, os.W_OK) and self._replace_hosts(content):
+                self._flush_dns_cache()
+                return True
 
-            # Clean up temp file
-            Path(temp_path).unlink(missing_ok=True)
+            # Stage the content, then use sudo to copy it to /etc/hosts
+            with _staged_file(content) as staged_path:
+                result = subprocess.run(
+                    ["sudo", "cp", staged_path, str(self.hosts_path)],
+                    capture_output=True,
+                    text=True,
+                )
 
             if result.returncode != 0:
                 print(f"Error updating hosts file: {result.stderr}")
@@ -56,14 +236,38 @@ class HostsManager:
             print(f"Error updating hosts file: {e}")
             return False
 
+    def _replace_hosts(self, content: str) -> bool:
+        """Atomically replace the hosts file in-process.
+
+        The new file is written next to the hosts file, so os.replace is a
+        rename within one filesystem, and keeps the original's permissions.
+
+        Returns:
+            False if the file couldn't be replaced this way (e.g. the
+            directory isn't writable or the hosts file is a bind mount)
+        """
+        try:
+            mode = self.hosts_path.stat().st_mode & 0o7777
+            fd, temp_path = tempfile.mkstemp(dir=self.hosts_path.parent, prefix=".hosts.")
+        except OSError:
+            return False
+
+        try:
+            with open(fd, "w") as f:
+                f.write(content)
+            os.chmod(temp_path, mode)
+            os.replace(temp_path, self.hosts_path)
+            return True
+        except OSError:
+            Path(temp_path).unlink(missing_ok=True)
+            return False
+
     def _flush_dns_cache(self) -> None:
         """Flush the DNS cache (platform-specific)."""
-        import platform
-
-        system = platform.system()
+        global _linux_flush_cmd
 
         try:
-            if system == "Darwin":  # macOS
+            if _SYSTEM == "Darwin":  # macOS
                 subprocess.run(
                     ["sudo", "dscacheutil", "-flushcache"],
                     capture_output=True,
@@ -73,70 +277,93 @@ class HostsManager:
                     ["sudo", "killall", "-9", "mDNSResponder"],
                     capture_output=True,
                 )
-            elif system == "Linux":
+            elif _SYSTEM == "Linux":
+                # Once a flush command has worked, skip straight to it
+                if _linux_flush_cmd is not None:
+                    subprocess.run(_linux_flush_cmd, capture_output=True)
+                    return
                 # Try resolvectl first (Ubuntu 20.04+), fall back to systemd-resolve
-                result = subprocess.run(
-                    ["sudo", "resolvectl", "flush-caches"],
-                    capture_output=True,
-                )
-                if result.returncode != 0:
-                    subprocess.run(
-                        ["sudo", "systemd-resolve", "--flush-caches"],
-                        capture_output=True,
-                    )
+                for cmd in _LINUX_FLUSH_CMDS:
+                    if subprocess.run(cmd, capture_output=True).returncode == 0:
+                        _linux_flush_cmd = cmd
+                        break
         except Exception:
             pass  # DNS flush is best-effort
 
-    def _get_block_entries(self, sites: list[str]) -> str:
-        """Generate hosts file entries for blocking sites."""
-        lines = [BEGIN_MARKER]
-        for site in sites:
-            # Add both IPv4 and IPv6 blocking for each domain
-            # IPv6 is needed because some sites have AAAA records and Safari prefers IPv6
-            lines.append(f"{BLOCK_IP} {site}")
-            lines.append(f"::1 {site}")
-            if not site.startswith("www."):
-                lines.append(f"{BLOCK_IP} www.{site}")
-                lines.append(f"::1 www.{site}")
-        lines.append(END_MARKER)
-        return "\n".join(lines)
+    def _get_block_entries(self, sites: frozenset[str]) -> str:
+        """Generate hosts file entries for canonicalized sites, in sorted order."""
+        entries = _iter_host_entries(sorted(sites))
+        return "\n".join(itertools.chain([BEGIN_MARKER], entries, [END_MARKER]))
+
+    @staticmethod
+    def _find_marker_line(content: str, marker: str, start: int = 0) -> tuple[int, int] | None:
+        """Find the next line consisting of marker, searching from start.
+
+        Returns:
+            (line_start, line_end) where line_end is just past the newline,
+            or None if no such line exists.
+        """
+        idx = content.find(marker, start)
+        while idx != -1:
+            line_start = content.rfind("\n", 0, idx) + 1
+            line_end = content.find("\n", idx)
+            line_end = len(content) if line_end == -1 else line_end + 1
+            if content[line_start:line_end].strip() == marker:
+                return line_start, line_end
+            idx = content.find(marker, line_end)
+        return None
+
+    def _locate_block(self, content: str, start: int = 0) -> tuple[int, int, int, int] | None:
+        """Locate the next block section by offset, without splitting lines.
+
+        Returns:
+            (section_start, section_end, inner_start, inner_end), where the
+            section spans both marker lines and inner is the text between
+            them. An unterminated section runs to the end of content.
+        """
+        begin = self._find_marker_line(content, BEGIN_MARKER, start)
+        if begin is None:
+            return None
+        end = self._find_marker_line(content, END_MARKER, begin[1])
+        if end is None:
+            return begin[0], len(content), begin[1], len(content)
+        return begin[0], end[1], begin[1], end[0]
 
     def _remove_block_section(self, content: str) -> str:
         """Remove the block section from hosts content."""
-        lines = content.split("\n")
-        result = []
-        in_block = False
-
-        for line in lines:
-            if line.strip() == BEGIN_MARKER:
-                in_block = True
-                continue
-            if line.strip() == END_MARKER:
-                in_block = False
-                continue
-            if not in_block:
-                result.append(line)
-
-        # Remove trailing empty lines
-        while result and result[-1].strip() == "":
-            result.pop()
-
-        return "\n".join(result)
+        parts = []
+        pos = 0
+        while True:
+            block = self._locate_block(content, pos)
+            gap_end = len(content) if block is None else block[0]
+            # Drop stray END markers outside any section
+            while (stray := self._find_marker_line(content, END_MARKER, pos)) is not None \
+                    and stray[1] <= gap_end:
+                parts.append(content[pos:stray[0]])
+                pos = stray[1]
+            parts.append(content[pos:gap_end])
+            if block is None:
+                break
+            pos = block[1]
+        result = "".join(parts)
+
+        # Remove trailing empty lines, keeping the last non-empty line intact
+        stripped = result.rstrip()
+        if not stripped:
+            return ""
+        line_end = result.find("\n", len(stripped))
+        return result if line_end == -1 else result[:line_end]
 
     def get_blocked_sites(self) -> list[str]:
         """Get list of currently blocked sites from hosts file."""
         content = self._read_hosts()
         sites = []
-        in_block = False
-
-        for line in content.split("\n"):
-            if line.strip() == BEGIN_MARKER:
-                in_block = True
-                continue
-            if line.strip() == END_MARKER:
-                in_block = False
-                continue
-            if in_block and line.strip():
+
+        # Only the lines between the markers are split and scanned
+        pos = 0
+        while (block := self._locate_block(content, pos)) is not None:
+            pos = block[1]
+            for line in content[block[2]:block[3]].split("\n"):
                 parts = line.split()
                 if len(parts) >= 2 and parts[0] == BLOCK_IP:
                     site = parts[1]
@@ -147,35 +374,59 @@ class HostsManager:
 
     def is_blocking_active(self) -> bool:
         """Check if blocking is currently active in hosts file."""
-        content = self._read_hosts()
-        return BEGIN_MARKER in content
+        return self._hosts_contains(_BEGIN_MARKER_BYTES)
 
     def block_sites(self, sites: list[str]) -> bool:
         """Block the given sites in the hosts file."""
+        canonical = canonicalize_sites(sites)
+
+        # Skip reading the file if it hasn't changed since it last matched
+        stat_key = self._stat_key()
+        if stat_key is not None and self._in_sync == (stat_key, canonical):
+            return True
+
         current_content = self._read_hosts()
 
         # Build new content
         base_content = self._remove_block_section(current_content)
         if base_content and not base_content.endswith("\n"):
             base_content += "\n"
-        new_content = base_content + "\n" + self._get_block_entries(sites) + "\n"
+        new_content = base_content + "\n" + self._get_block_entries(canonical) + "\n"
 
         # Only write if content actually changed (avoid unnecessary DNS flushes)
         if new_content.strip() == current_content.strip():
+            self._in_sync = (stat_key, canonical)
             return True  # Already up to date
 
-        return self._write_hosts(new_content)
+        if not self._write_hosts(new_content):
+            return False
+        self._in_sync = (self._stat_key(), canonical)
+        return True
 
     def unblock_sites(self) -> bool:
         """Remove all site blocks from hosts file."""
-        content = self._read_hosts()
-        content = self._remove_block_section(content)
+        # Skip reading the file if it hasn't changed since it was last unblocked
+        stat_key = self._stat_key()
+        if stat_key is not None and self._in_sync == (stat_key, None):
+            return True
+
+        current_content = self._read_hosts()
+        content = self._remove_block_section(current_content)
 
         # Ensure proper ending
         if content and not content.endswith("\n"):
             content += "\n"
 
-        return self._write_hosts(content)
+        # Only write if there was a block to remove (avoid unnecessary DNS flushes)
+        if content.strip() == current_content.strip():
+            self._in_sync = (stat_key, None)
+            return True
+
+        self._in_sync = None
+        if not self._write_hosts(content):
+            return False
+        self._in_sync = (self._stat_key(), None)
+        return True
 
     def sync_with_config(self, sites: list[str], should_block: bool) -> bool:
         """Sync hosts file with desired state."""
@@ -196,13 +447,13 @@ class RemoteSyncManager:
     Uses dnsmasq address=// format which blocks ALL DNS record types
     (A, AAAA, HTTPS, SVCB, etc.) to prevent Safari's HTTPS record bypass.
 
-    Includes retry logic with exponential backoff for SSH connection failures.
+    Includes retry logic with jittered backoff for SSH connection failures.
     """
 
     # Retry settings
     MAX_RETRIES = 3
     INITIAL_BACKOFF = 2  # seconds
-    BACKOFF_MULTIPLIER = 2
+    MAX_BACKOFF = 10  # seconds
 
     def __init__(self, config: dict):
         self.enabled = config.get("enabled", False)
@@ -210,18 +461,32 @@ class RemoteSyncManager:
         self.user = config.get("user", "")
         # Default to new dnsmasq.d location for address= format
         self.remote_path = config.get("blocklist_path", "/etc/dnsmasq.d/blocklist.conf")
-
-    def _run_with_retry(self, cmd: list[str], description: str) -> tuple[bool, str]:
+        # Serializes syncs so background and direct calls never overlap
+        self._sync_lock = threading.Lock()
+        # Single background worker for sync_async(), created on first use
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending: Future | None = None
+
+    def _run_with_retry(
+        self, cmd: list[str], description: str, input: str | None = None
+    ) -> tuple[bool, str]:
         """Run a command with retry logic for transient SSH failures.
 
+        Args:
+            cmd: The command to run
+            description: Name of the step, used in retry warnings
+            input: Text to send on the command's stdin (resent on each attempt)
+
         Returns:
             Tuple of (success, error_message or empty string)
         """
-        backoff = self.INITIAL_BACKOFF
+        delay = self.INITIAL_BACKOFF
         last_error = ""
 
         for attempt in range(self.MAX_RETRIES):
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            result = subprocess.run(
+                cmd, input=input, capture_output=True, text=True, timeout=30
+            )
 
             if result.returncode == 0:
                 return True, ""
@@ -229,32 +494,25 @@ class RemoteSyncManager:
             last_error = result.stderr.strip()
 
             # Check if it's a transient SSH error worth retrying
-            transient_errors = [
-                "Connection reset by peer",
-                "Connection refused",
-                "Connection timed out",
-                "Network is unreachable",
-                "No route to host",
-            ]
-            is_transient = any(err in last_error for err in transient_errors)
+            is_transient = is_transient_ssh_error(last_error)
 
             if not is_transient or attempt == self.MAX_RETRIES - 1:
                 # Non-transient error or final attempt
                 break
 
+            delay = ssh_retry_delay(last_error, delay, self.INITIAL_BACKOFF, self.MAX_BACKOFF)
             logger.warning(
                 f"Remote sync {description} failed (attempt {attempt + 1}/{self.MAX_RETRIES}): "
-                f"{last_error}. Retrying in {backoff}s..."
+                f"{last_error}. Retrying in {delay:.1f}s..."
             )
-            time.sleep(backoff)
-            backoff *= self.BACKOFF_MULTIPLIER
+            time.sleep(delay)
 
         return False, last_error
 
     def sync(self, sites: list[str]) -> tuple[bool, str]:
         """Sync blocked sites to remote server.
 
-        Includes retry logic with exponential backoff for transient SSH failures.
+        Includes retry logic with jittered backoff for transient SSH failures.
 
         Returns:
             Tuple of (success, message)
@@ -265,55 +523,96 @@ class RemoteSyncManager:
         if not self.host or not self.user:
             return False, "Remote sync not configured (missing host or user)"
 
-        # Generate dnsmasq address= format
-        # This blocks ALL record types (A, AAAA, HTTPS, SVCB, etc.)
-        # which prevents Safari's HTTPS record IP hint bypass
-        lines = []
-        for site in sites:
-            lines.append(f"address=/{site}/")
-            if not site.startswith("www."):
-                lines.append(f"address=/www.{site}/")
-        content = "\n".join(sorted(set(lines))) + "\n" if lines else ""
-
-        temp_path = None
-        try:
-            # Write to temp file
-            with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".conf") as f:
-                f.write(content)
-                temp_path = f.name
+        with self._sync_lock:
+            return self._sync_locked(sites)
 
-            # Copy to remote server with retry
-            remote = f"{self.user}@{self.host}"
-            success, error = self._run_with_retry(
-                ["scp", temp_path, f"{remote}:/tmp/blocklist.conf.tmp"],
-                "scp"
-            )
+    def sync_async(self, sites: list[str], description: str = "sync") -> Future:
+        """Queue a sync on a background worker and return immediately.
+
+        A queued sync that hasn't started yet is cancelled in favour of the
+        new one, since only the latest blocklist matters. Failures are
+        logged rather than returned.
+
+        Args:
+            sites: The sites to sync
+            description: What triggered the sync, used in failure logs
+
+        Returns:
+            Future resolving to sync()'s (success, message)
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="remote-sync")
+        if self._pending is not None:
+            self._pending.cancel()
+
+        def log_result(future: Future) -> None:
+            if future.cancelled():
+                return
+            exc = future.exception()
+            if exc is not None:
+                logger.error(f"Remote sync failed during {description}: {exc}")
+                return
+            success, message = future.result()
             if not success:
-                return False, f"Failed to copy to remote: {error}"
+                logger.error(f"Remote sync failed during {description}: {message}")
 
-            # Move to final location, fix permissions, and restart dnsmasq with retry
+        future = self._executor.submit(self.sync, list(sites))
+        future.add_done_callback(log_result)
+        self._pending = future
+        return future
+
+    def wait_pending(self, timeout: float | None = None) -> tuple[bool, str] | None:
+        """Wait for the sync last queued by sync_async() to finish.
+
+        Returns:
+            The sync's (success, message), or None if nothing was queued, it
+            was cancelled or raised, or it was still running after timeout
+        """
+        future = self._pending
+        if future is None:
+            return None
+        try:
+            return future.result(timeout)
+        except Exception:
+            # Cancellation and timeouts; failures were logged by sync_async
+            return None
+
+    def _sync_locked(self, sites: list[str]) -> tuple[bool, str]:
+        """Push the blocklist to the remote server; caller holds _sync_lock."""
+        # Generate dnsmasq address= format
+        canonical = tuple(sorted(canonicalize_sites(sites)))
+        content = _build_dnsmasq_content(canonical)
+
+        try:
+            # Stream the blocklist over ssh's stdin into the temp file, then
+            # move it into place, fix permissions, and restart dnsmasq, all
+            # in one connection (with retry). The comparison happens on the
+            # remote, since other clients also write the blocklist; only the
+            # move and restart are skipped when it already matches.
+            remote = f"{self.user}@{self.host}"
             success, error = self._run_with_retry(
-                ["ssh", remote,
+                ["ssh", *ssh_options(), remote,
+                 "cat > /tmp/blocklist.conf.tmp && "
+                 f"if cmp -s /tmp/blocklist.conf.tmp {self.remote_path}; then "
+                 "rm -f /tmp/blocklist.conf.tmp; else "
                  f"sudo mv /tmp/blocklist.conf.tmp {self.remote_path} && "
                  f"sudo chmod 644 {self.remote_path} && "
                  f"sudo chown root:root {self.remote_path} && "
-                 "sudo systemctl restart dnsmasq"],
-                "ssh"
+                 "sudo systemctl restart dnsmasq; fi"],
+                "ssh",
+                input=content,
             )
             if not success:
                 return False, f"Failed to update remote: {error}"
 
-            logger.info(f"Remote sync successful: {len(sites)} sites to {self.host}")
-            return True, f"Synced {len(sites)} sites to {self.host}"
+            logger.info(f"Remote sync successful: {len(canonical)} sites to {self.host}")
+            return True, f"Synced {len(canonical)} sites to {self.host}"
 
         except subprocess.TimeoutExpired:
             return False, "Remote sync timed out"
         except Exception as e:
             logger.error(f"Remote sync error: {e}")
             return False, f"Sync error: {e}"
-        finally:
-            if temp_path:
-                Path(temp_path).unlink(missing_ok=True)
 
 
 def get_remote_sync_manager(config: dict) -> RemoteSyncManager:
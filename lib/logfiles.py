@@ -0,0 +1,118 @@
+"""Log file handlers shared by the daemon and experiment logs."""
+
+import gzip
+import logging
+import os
+import shutil
+from logging.handlers import RotatingFileHandler
+
+
+def _gzip_file(source: str, dest: str) -> None:
+    """Compress source into dest and remove source."""
+    with open(source, "rb") as src, gzip.open(dest, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
+
+class FastRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that avoids filesystem calls on every record.
+
+    The stock handler stats the log path and seeks to the end of the file
+    for each record it emits. This one measures the file once, keeps a
+    running size estimate, and only checks the real size once the
+    estimate reaches maxBytes. The message formatted for the size check
+    is reused by emit() instead of being formatted a second time.
+
+    With compress=True, backups older than log.1 are gzipped (log.2.gz,
+    ...). The live file is still renamed to log.1 rather than compressed,
+    since other processes writing the same log keep appending to it until
+    they reopen.
+    """
+
+    def __init__(self, *args, compress: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.compress = compress
+        self._approx_size: int | None = None
+        self._is_regular_file = True
+        self._last_record: logging.LogRecord | None = None
+        self._last_msg = ""
+
+    def _measure(self) -> int:
+        """Get the actual size of the log file."""
+        if self.stream is None:
+            self.stream = self._open()
+        self.stream.seek(0, 2)
+        return self.stream.tell()
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record, reusing the result from shouldRollover()."""
+        if record is self._last_record:
+            return self._last_msg
+        return super().format(record)
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """Decide whether writing this record should rotate the file."""
+        if self.maxBytes <= 0:
+            return False
+
+        msg = super().format(record)
+        self._last_record = record
+        self._last_msg = msg
+
+        if self._approx_size is None:
+            # See bpo-45401: never rollover anything other than regular files
+            self._is_regular_file = not (
+                os.path.exists(self.baseFilename) and not os.path.isfile(self.baseFilename)
+            )
+            self._approx_size = self._measure()
+        if not self._is_regular_file:
+            return False
+
+        self._approx_size += len(msg) + 1
+        if self._approx_size < self.maxBytes:
+            return False
+
+        # Near the limit: confirm against the file, which other processes
+        # may also be appending to
+        self._approx_size = self._measure() + len(msg) + 1
+        return self._approx_size >= self.maxBytes
+
+    def doRollover(self) -> None:
+        """Rotate the files and re-measure on the next record."""
+        if self.compress:
+            self._compressed_rollover()
+        else:
+            super().doRollover()
+        self._approx_size = None
+
+    def _compressed_rollover(self) -> None:
+        """Rotate log to log.1, gzipping the previous log.1 into log.2.gz."""
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+
+        if self.backupCount > 0:
+            base = self.baseFilename
+            for i in range(self.backupCount - 1, 1, -1):
+                source = f"{base}.{i}.gz"
+                if os.path.exists(source):
+                    os.replace(source, f"{base}.{i + 1}.gz")
+            first = f"{base}.1"
+            if os.path.exists(first):
+                if self.backupCount > 1:
+                    _gzip_file(first, f"{base}.2.gz")
+                else:
+                    os.remove(first)
+            if os.path.exists(base):
+                os.rename(base, first)
+
+        if not self.delay:
+            self.stream = self._open()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Emit a record, then drop the cached formatted message."""
+        try:
+            super().emit(record)
+        finally:
+            self._last_record = None
+            self._last_msg = ""
@@ -1,18 +1,199 @@
 """Obsidian vault parsing and condition checking."""
 
+import os
 import re
-import yaml
+import stat
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 
+# A checked checkbox (- [x] or * [x]), capturing the rest of its line. The
+# lookahead finds every checkbox even when several share a line.
+_CHECKED_ITEM_RE = re.compile(r"(?=[-*]\s*\[[xX]\]\s*([^\n]*))")
+
+
+@lru_cache(maxsize=8)
+def _scan_checked_items(content: str) -> tuple[str, ...]:
+    """Collect the lowercased text after every checked checkbox in content.
+
+    Scanned once per note content and shared by all checkbox conditions.
+    """
+    return tuple(match.group(1).lower() for match in _CHECKED_ITEM_RE.finditer(content))
+
+
+@lru_cache(maxsize=32)
+def _compile_heading(text: str, level: int | None = None) -> re.Pattern:
+    """Compile the regex matching a heading line, capturing its # symbols.
+
+    A level of None matches the heading at any level.
+    """
+    hashes = "#+" if level is None else "#" * level
+    return re.compile(rf"^({hashes})\s*{re.escape(text)}\s*$", re.MULTILINE | re.IGNORECASE)
+
+
+@lru_cache(maxsize=8)
+def _split_lines(content: str) -> tuple[str, ...]:
+    """Split note content into lines, once per content string."""
+    return tuple(content.split("\n"))
+
+
+def _heading_level(line: str) -> int:
+    """Count the # symbols a line starts with."""
+    return len(line) - len(line.lstrip("#"))
+
+
+@lru_cache(maxsize=8)
+def _heading_keys(content: str) -> tuple[tuple[int, str], ...]:
+    """Get (# count, lowercased stripped text after the #s) for each line.
+
+    Computed once per note so every heading lookup is a plain string
+    comparison, with no per-check lowercasing or case-insensitive regex.
+    """
+    keys = []
+    for line in _split_lines(content):
+        hashes = _heading_level(line)
+        keys.append((hashes, line[hashes:].strip().lower()))
+    return tuple(keys)
+
+
+def _find_heading(content: str, text: str, level: int | None = None) -> tuple[int, list[str]] | None:
+    """Find the first heading line for text and the lines that follow it.
+
+    Headings are matched by comparing stripped lines against text, which
+    covers ordinary heading names; text that has surrounding whitespace or
+    starts with # goes through the equivalent regex instead. A level of None
+    matches the heading at any level.
+
+    Returns:
+        (number of # symbols on the heading, lines after the heading), or
+        None if the heading isn't found. Blank lines directly below the
+        heading collapse into a single leading "".
+    """
+    if not text or text != text.strip() or text.startswith("#"):
+        match = _compile_heading(text, level).search(content)
+        if not match:
+            return None
+        return len(match.group(1)), content[match.end():].split("\n")
+
+    lines = _split_lines(content)
+    target = text.lower()
+    for i, (hashes, key) in enumerate(_heading_keys(content)):
+        if key == target and (hashes == level or (level is None and hashes)):
+            j = i + 1
+            while j < len(lines) and not lines[j].strip():
+                j += 1
+            return hashes, ["", *lines[j:]]
+    return None
+
+
+def _scan_wiki_links(content: str) -> list[str]:
+    """Find the targets of [[link]] and [[link|alias]] in content.
+
+    Uses str.find to jump between "[[" openers instead of running a regex
+    over all the prose in between. A link's target and alias must both be
+    non-empty and neither may contain "]"; otherwise scanning resumes just
+    after the opening bracket.
+    """
+    links = []
+    pos = 0
+    while True:
+        start = content.find("[[", pos)
+        if start < 0:
+            return links
+        end = content.find("]]", start + 2)
+        if end < 0:
+            return links
+        inner = content[start + 2:end]
+        pipe = inner.find("|")
+        target = inner if pipe < 0 else inner[:pipe]
+        if target and "]" not in inner and (pipe < 0 or pipe < len(inner) - 1):
+            links.append(target)
+            pos = end + 2
+        else:
+            pos = start + 1
+
+
+@lru_cache(maxsize=16)
+def _section_content(content: str, heading: str, any_level: bool) -> str | None:
+    """Get the lines under a heading, until the next heading at its level or above.
+
+    Cached per note content, so several conditions reading the same section
+    of an unchanged note slice it once.
+    """
+    if any_level:
+        found = _find_heading(content, heading)
+    else:
+        level = heading.count("#") if heading.startswith("#") else 1
+        text = heading.lstrip("#").strip()
+        found = _find_heading(content, text, level)
+
+    if found is None:
+        return None
+
+    heading_level, after_heading = found
+    lines = []
+
+    for line in after_heading:
+        # Check if this is a heading of same or higher level
+        level = _heading_level(line)
+        if level and line[level:level + 1].isspace() and level <= heading_level:
+            break
+        lines.append(line)
+
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=16)
+def _section_links(content: str) -> tuple[str, ...]:
+    """Wiki-link targets in content, cached alongside _section_content."""
+    return tuple(_scan_wiki_links(content))
+
+
+@lru_cache(maxsize=8)
+def _load_frontmatter(text: str) -> Any:
+    """Parse frontmatter YAML, cached so each YAML condition reuses it."""
+    import yaml  # Deferred: only needed when a note has frontmatter to parse
+
+    # Prefer libyaml's C loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    try:
+        return yaml.load(text, Loader=loader) or {}
+    except yaml.YAMLError:
+        return {}
+
+
+@lru_cache(maxsize=32)
+def _compile_regex(pattern: str) -> re.Pattern | None:
+    """Compile a user-supplied regex condition, or None if it is invalid."""
+    try:
+        return re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+    except re.error:
+        return None
+
+
+def _stat_regular_file(path: Path | None) -> tuple[Path, os.stat_result] | None:
+    """Pair a path with its stat() result, if it is a regular file."""
+    if path is None:
+        return None
+    try:
+        st = path.stat()
+    except (OSError, ValueError):
+        return None
+    return (path, st) if stat.S_ISREG(st.st_mode) else None
+
+
 class ObsidianParser:
     """Parse Obsidian vault for condition checking."""
 
     def __init__(self, vault_path: Path | str, daily_note_pattern: str = "Daily/{date}.md"):
         self.vault_path = Path(vault_path)
         self.daily_note_pattern = daily_note_pattern
+        # (path, st_mtime_ns, st_size, content) of the last daily note read
+        self._note_cache: tuple[Path, int, int, str] | None = None
+        # File name -> first matching path in the vault, built on first use
+        self._file_index: dict[str, Path] | None = None
 
     def get_today_note_path(self) -> Path:
         """Get the path to today's daily note."""
@@ -27,6 +208,32 @@ class ObsidianParser:
             return note_path.read_text()
         return None
 
+    def read_daily_note_cached(self) -> str | None:
+        """Read today's daily note, reusing the last read if the file is unchanged.
+
+        The cache is keyed by (path, mtime_ns, size), so several conditions
+        checked in the same cycle share a single read of the note.
+        """
+        note_path = self.get_today_note_path()
+        try:
+            st = note_path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            self._note_cache = None
+            return None
+
+        cached = self._note_cache
+        if cached is not None and cached[:3] == (note_path, st.st_mtime_ns, st.st_size):
+            return cached[3]
+
+        content = note_path.read_text()
+        self._note_cache = (note_path, st.st_mtime_ns, st.st_size, content)
+        return content
+
+    def invalidate(self) -> None:
+        """Drop the cached daily note and vault index so both are re-read."""
+        self._note_cache = None
+        self._file_index = None
+
     def parse_frontmatter(self, content: str) -> dict[str, Any]:
         """Parse YAML frontmatter from markdown content."""
         if not content.startswith("---"):
@@ -36,10 +243,9 @@ class ObsidianParser:
         if len(parts) < 3:
             return {}
 
-        try:
-            return yaml.safe_load(parts[1]) or {}
-        except yaml.YAMLError:
-            return {}
+        frontmatter = _load_frontmatter(parts[1])
+        # Copy so callers can't modify the cached result
+        return dict(frontmatter) if isinstance(frontmatter, dict) else frontmatter
 
     def check_checkbox(self, content: str, pattern: str) -> bool:
         """Check if a checkbox pattern is checked.
@@ -59,10 +265,10 @@ class ObsidianParser:
         else:
             text = pattern
 
-        # Build regex to find checked checkbox with this text
-        # Matches: - [x] text or * [x] text, case insensitive for x
-        regex = rf"[-*]\s*\[[xX]\]\s*{re.escape(text)}"
-        return bool(re.search(regex, content, re.IGNORECASE))
+        # Find a checked checkbox whose text starts with this text; the
+        # scan already skips whitespace after the box, so the pattern does too
+        text = text.lstrip().lower()
+        return any(item.startswith(text) for item in _scan_checked_items(content))
 
     def check_yaml_field(
         self, content: str, field: str, expected: Any = None, minimum: int | None = None
@@ -94,20 +300,18 @@ class ObsidianParser:
         """Check if a heading exists with content below it."""
         if any_level:
             # Match any heading level
-            regex = rf"^#+\s*{re.escape(heading)}\s*$"
+            found = _find_heading(content, heading)
         else:
             # Match exact heading (count # symbols)
             level = heading.count("#")
             text = heading.lstrip("#").strip()
-            regex = rf"^{'#' * level}\s*{re.escape(text)}\s*$"
+            found = _find_heading(content, text, level)
 
-        match = re.search(regex, content, re.MULTILINE | re.IGNORECASE)
-        if not match:
+        if found is None:
             return False
 
         # Check if there's content after the heading
-        after_heading = content[match.end():]
-        lines = after_heading.split("\n")
+        _, lines = found
 
         for line in lines:
             stripped = line.strip()
@@ -123,103 +327,124 @@ class ObsidianParser:
 
     def check_regex(self, content: str, pattern: str) -> bool:
         """Check if a regex pattern matches anywhere in the content."""
-        try:
-            return bool(re.search(pattern, content, re.IGNORECASE | re.MULTILINE))
-        except re.error:
+        compiled = _compile_regex(pattern)
+        if compiled is None:
             return False
+        return bool(compiled.search(content))
 
     def get_section_content(
         self, content: str, heading: str, any_level: bool = True
     ) -> str | None:
         """Get all content under a specific heading until the next heading."""
-        if any_level:
-            regex = rf"^(#+)\s*{re.escape(heading)}\s*$"
-        else:
-            level = heading.count("#") if heading.startswith("#") else 1
-            text = heading.lstrip("#").strip()
-            regex = rf"^({'#' * level})\s*{re.escape(text)}\s*$"
-
-        match = re.search(regex, content, re.MULTILINE | re.IGNORECASE)
-        if not match:
-            return None
-
-        heading_level = len(match.group(1))
-        after_heading = content[match.end():]
-        lines = []
-
-        for line in after_heading.split("\n"):
-            # Check if this is a heading of same or higher level
-            heading_match = re.match(r"^(#+)\s", line)
-            if heading_match and len(heading_match.group(1)) <= heading_level:
-                break
-            lines.append(line)
-
-        return "\n".join(lines)
+        return _section_content(content, heading, any_level)
 
     def extract_wiki_links(self, content: str) -> list[str]:
         """Extract all [[wiki-links]] from content."""
-        # Match [[link]] or [[link|alias]]
-        pattern = r"\[\[([^\]|]+)(?:\|[^\]]+)?\]\]"
-        matches = re.findall(pattern, content)
-        return matches
+        return list(_section_links(content))
 
     def resolve_link_path(self, link: str) -> Path | None:
         """Resolve a wiki-link to an actual file path."""
+        found = self.resolve_link_stat(link)
+        return found[0] if found else None
+
+    def resolve_link_stat(self, link: str) -> tuple[Path, os.stat_result] | None:
+        """Resolve a wiki-link to a file path and its stat() result.
+
+        Resolving has to stat the file anyway, so callers that need its
+        mtime or size get them without a second call.
+        """
         # Handle both with and without .md extension
         if not link.endswith(".md"):
             link = link + ".md"
 
         # Try direct path
         direct_path = self.vault_path / link
-        if direct_path.exists():
-            return direct_path
+        try:
+            return direct_path, direct_path.stat()
+        except (OSError, ValueError):
+            pass
 
-        # Search for the file in the vault
+        # Look the file up in the vault index, rebuilding it once if the
+        # file is new or has moved since the index was built
         link_name = Path(link).name
-        for path in self.vault_path.rglob(link_name):
-            if path.is_file():
-                return path
-
-        return None
-
-    def check_condition(self, condition_config: dict[str, Any]) -> tuple[bool, str]:
-        """Check a single condition and return (met, description)."""
-        content = self.read_daily_note()
+        if self._file_index is not None:
+            found = _stat_regular_file(self._file_index.get(link_name))
+            if found is not None:
+                return found
+
+        return _stat_regular_file(self._build_file_index().get(link_name))
+
+    def _build_file_index(self) -> dict[str, Path]:
+        """Walk the vault once, mapping each file name to its first path."""
+        index: dict[str, Path] = {}
+        for dirpath, _, filenames in os.walk(self.vault_path):
+            for name in filenames:
+                index.setdefault(name, Path(dirpath, name))
+        self._file_index = index
+        return index
+
+    def check_condition(
+        self, condition_config: dict[str, Any], content: str | None = None
+    ) -> tuple[bool, str]:
+        """Check a single condition and return (met, description).
+
+        Args:
+            condition_config: The condition's settings
+            content: Today's note, if the caller already read it; otherwise
+                the (cached) note is read here
+        """
+        if content is None:
+            content = self.read_daily_note_cached()
         if content is None:
             return False, "Daily note not found"
 
         condition_type = condition_config.get("type", "checkbox")
-
-        if condition_type == "checkbox":
-            pattern = condition_config.get("pattern", "")
-            met = self.check_checkbox(content, pattern)
-            return met, f"Checkbox '{pattern}'" + (" checked" if met else " not checked")
-
-        elif condition_type == "yaml":
-            field = condition_config.get("field", "")
-            expected = condition_config.get("value")
-            minimum = condition_config.get("minimum")
-            met = self.check_yaml_field(content, field, expected, minimum)
-            if minimum is not None:
-                return met, f"YAML field '{field}' >= {minimum}" if met else f"YAML field '{field}' < {minimum}"
-            return met, f"YAML field '{field}'" + (" set" if met else " not set")
-
-        elif condition_type == "heading":
-            heading = condition_config.get("section", "")
-            any_level = condition_config.get("section_any_level", True)
-            met = self.check_heading_exists(content, heading, any_level)
-            return met, f"Heading '{heading}'" + (" has content" if met else " empty or missing")
-
-        elif condition_type == "regex":
-            pattern = condition_config.get("pattern", "")
-            met = self.check_regex(content, pattern)
-            return met, f"Pattern '{pattern}'" + (" matched" if met else " not matched")
-
-        elif condition_type == "linked_wordcount":
-            # This will be handled by wordcount.py
-            return False, "Word count check (handled separately)"
-
-        return False, f"Unknown condition type: {condition_type}"
+        handler = self._CONDITION_HANDLERS.get(condition_type)
+        if handler is None:
+            return False, f"Unknown condition type: {condition_type}"
+        return handler(self, content, condition_config)
+
+    def _checkbox_condition(self, content: str, config: dict[str, Any]) -> tuple[bool, str]:
+        """Check a checkbox condition against note content."""
+        pattern = config.get("pattern", "")
+        met = self.check_checkbox(content, pattern)
+        return met, f"Checkbox '{pattern}'" + (" checked" if met else " not checked")
+
+    def _yaml_condition(self, content: str, config: dict[str, Any]) -> tuple[bool, str]:
+        """Check a YAML frontmatter condition against note content."""
+        field = config.get("field", "")
+        expected = config.get("value")
+        minimum = config.get("minimum")
+        met = self.check_yaml_field(content, field, expected, minimum)
+        if minimum is not None:
+            return met, f"YAML field '{field}' >= {minimum}" if met else f"YAML field '{field}' < {minimum}"
+        return met, f"YAML field '{field}'" + (" set" if met else " not set")
+
+    def _heading_condition(self, content: str, config: dict[str, Any]) -> tuple[bool, str]:
+        """Check a heading condition against note content."""
+        heading = config.get("section", "")
+        any_level = config.get("section_any_level", True)
+        met = self.check_heading_exists(content, heading, any_level)
+        return met, f"Heading '{heading}'" + (" has content" if met else " empty or missing")
+
+    def _regex_condition(self, content: str, config: dict[str, Any]) -> tuple[bool, str]:
+        """Check a regex condition against note content."""
+        pattern = config.get("pattern", "")
+        met = self.check_regex(content, pattern)
+        return met, f"Pattern '{pattern}'" + (" matched" if met else " not matched")
+
+    def _linked_wordcount_condition(self, content: str, config: dict[str, Any]) -> tuple[bool, str]:
+        """Placeholder: linked word counts are checked by wordcount.py."""
+        return False, "Word count check (handled separately)"
+
+    # Condition type -> method checking it, looked up once per condition
+    _CONDITION_HANDLERS = {
+        "checkbox": _checkbox_condition,
+        "yaml": _yaml_condition,
+        "heading": _heading_condition,
+        "regex": _regex_condition,
+        "linked_wordcount": _linked_wordcount_condition,
+    }
 
 
 def get_obsidian_parser(vault_path: Path | str, daily_note_pattern: str = "Daily/{date}.md") -> ObsidianParser:
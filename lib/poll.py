@@ -2,13 +2,50 @@
 
 import json
 import logging
+import shlex
 import subprocess
 import time
 from pathlib import Path
 from typing import Any
 
+from .hosts import is_transient_ssh_error, ssh_options, ssh_retry_delay
+
 logger = logging.getLogger(__name__)
 
+# Runs on the remote host as `_UPDATE_COMMAND <data_dir>` with a
+# JSON payload on stdin. Marks the given requests completed (keeping the
+# last 10 completed), writes status.json if a status was sent, and prints
+# the pending requests as JSON.
+_UPDATE_SCRIPT = """
+import json, os, sys
+payload = json.load(sys.stdin)
+data_dir = sys.argv[1]
+requests_file = os.path.join(data_dir, 'requests.json')
+try:
+    with open(requests_file) as f:
+        requests = json.load(f)
+except FileNotFoundError:
+    requests = []
+if payload['completions']:
+    by_id = {r.get('id'): r for r in requests}
+    for request_id, result, completed_at in payload['completions']:
+        r = by_id.get(request_id)
+        if r is not None:
+            r['status'] = 'completed'
+            r['result'] = result
+            r['completed_at'] = completed_at
+    completed = [r for r in requests if r.get('status') == 'completed']
+    pending = [r for r in requests if r.get('status') == 'pending']
+    requests = pending + completed[-10:]
+    with open(requests_file, 'w') as f:
+        json.dump(requests, f, indent=2)
+if payload['status'] is not None:
+    with open(os.path.join(data_dir, 'status.json'), 'w') as f:
+        f.write(json.dumps(payload['status']) + '\\n')
+print(json.dumps([r for r in requests if r.get('status') == 'pending']))
+"""
+_UPDATE_COMMAND = f"python3 -c {shlex.quote(_UPDATE_SCRIPT)}"
+
 
 class PollManager:
     """Manages polling for unlock requests from the remote API.
@@ -17,10 +54,10 @@ class PollManager:
     mark requests as completed after processing.
     """
 
-    # Retry settings (same as RemoteSyncManager)
+    # Retry settings (same as RemoteStateStore)
     MAX_RETRIES = 3
-    INITIAL_BACKOFF = 2
-    BACKOFF_MULTIPLIER = 2
+    INITIAL_BACKOFF = 2  # seconds
+    MAX_BACKOFF = 30  # seconds
 
     def __init__(self, config: dict):
         """Initialize the poll manager.
@@ -38,61 +75,64 @@ class PollManager:
         self.user = config.get("user", "")
         self.data_dir = config.get("data_dir", "/var/lib/block_distractions")
         self.auth_token = config.get("auth_token", "")
+        # (remote mtime and size of requests.json, pending requests in it)
+        self._pending_cache: tuple[str, list[dict]] | None = None
 
-    def _run_ssh(self, command: str, description: str) -> tuple[bool, str]:
+    def _run_ssh(
+        self, command: str, description: str, input: bytes | None = None
+    ) -> tuple[bool, bytes, str]:
         """Run a command over SSH with retry logic.
 
+        Args:
+            command: The remote shell command
+            description: Name of the step, used in retry warnings
+            input: Bytes to send on the command's stdin (resent on each attempt)
+
         Returns:
-            Tuple of (success, output_or_error)
+            Tuple of (success, raw stdout, error message). stdout is left
+            undecoded, since json.loads() takes bytes directly.
         """
         if not self.host or not self.user:
-            return False, "SSH not configured"
+            return False, b"", "SSH not configured"
 
         remote = f"{self.user}@{self.host}"
-        cmd = ["ssh", remote, command]
+        cmd = ["ssh", *ssh_options(), remote, command]
 
-        backoff = self.INITIAL_BACKOFF
+        delay = self.INITIAL_BACKOFF
         last_error = ""
 
         for attempt in range(self.MAX_RETRIES):
             try:
                 result = subprocess.run(
-                    cmd, capture_output=True, text=True, timeout=30
+                    cmd, input=input, capture_output=True, timeout=30
                 )
 
                 if result.returncode == 0:
-                    return True, result.stdout.strip()
+                    return True, result.stdout.strip(), ""
 
-                last_error = result.stderr.strip()
+                last_error = result.stderr.decode(errors="replace").strip()
 
                 # Check if it's a transient SSH error
-                transient_errors = [
-                    "Connection reset by peer",
-                    "Connection refused",
-                    "Connection timed out",
-                    "Network is unreachable",
-                    "No route to host",
-                ]
-                is_transient = any(err in last_error for err in transient_errors)
+                is_transient = is_transient_ssh_error(last_error)
 
                 if not is_transient or attempt == self.MAX_RETRIES - 1:
                     break
 
+                delay = ssh_retry_delay(last_error, delay, self.INITIAL_BACKOFF, self.MAX_BACKOFF)
                 logger.warning(
                     f"Poll {description} failed (attempt {attempt + 1}/{self.MAX_RETRIES}): "
-                    f"{last_error}. Retrying in {backoff}s..."
+                    f"{last_error}. Retrying in {delay:.1f}s..."
                 )
-                time.sleep(backoff)
-                backoff *= self.BACKOFF_MULTIPLIER
+                time.sleep(delay)
 
             except subprocess.TimeoutExpired:
                 last_error = "Command timed out"
                 if attempt == self.MAX_RETRIES - 1:
                     break
-                time.sleep(backoff)
-                backoff *= self.BACKOFF_MULTIPLIER
+                delay = ssh_retry_delay(last_error, delay, self.INITIAL_BACKOFF, self.MAX_BACKOFF)
+                time.sleep(delay)
 
-        return False, last_error
+        return False, b"", last_error
 
     def check_pending_requests(self) -> list[dict]:
         """Check for pending unlock requests.
@@ -104,22 +144,57 @@ class PollManager:
         if not self.enabled:
             return []
 
-        requests_file = f"{self.data_dir}/requests.json"
-        cmd = f"cat {requests_file} 2>/dev/null || echo '[]'"
-
-        success, output = self._run_ssh(cmd, "check pending")
+        requests_file = shlex.quote(f"{self.data_dir}/requests.json")
+        # Print the file's mtime and size, then its contents unless they
+        # match the cached version, in which case only "unchanged" is sent
+        cached_version = self._pending_cache[0] if self._pending_cache else None
+        cmd = (
+            f"v=$(stat -c '%y %s' {requests_file} 2>/dev/null); echo \"v:$v\"; "
+            f"if [ \"$v\" = {shlex.quote(cached_version or '-')} ]; then echo unchanged; "
+            f"else cat {requests_file} 2>/dev/null || echo '[]'; fi"
+        )
+
+        success, output, error = self._run_ssh(cmd, "check pending")
         if not success:
-            logger.error(f"Failed to check pending requests: {output}")
+            logger.error(f"Failed to check pending requests: {error}")
             return []
 
+        version_line, _, body = output.partition(b"\n")
+        version = version_line.decode(errors="replace").removeprefix("v:")
+        if body == b"unchanged" and self._pending_cache is not None:
+            return list(self._pending_cache[1])
+
         try:
-            requests = json.loads(output)
+            requests = json.loads(body)
             # Filter to only pending requests
             pending = [r for r in requests if r.get("status") == "pending"]
-            return pending
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse requests JSON: {e}")
             return []
+        self._pending_cache = (version, pending)
+        return list(pending)
+
+    def poll_cycle(
+        self,
+        status: dict[str, Any] | None,
+        completions: list[tuple[str, dict[str, Any]]],
+    ) -> list[dict] | None:
+        """Mark requests completed and update the status in one SSH call.
+
+        Args:
+            status: The status dict from UnlockManager.get_status(), or None
+                to leave the remote status unchanged
+            completions: (request_id, result) pairs to mark completed
+
+        Returns:
+            The requests still pending after the update, an empty list if
+            disabled, or None if the update failed (nothing was marked
+            completed)
+        """
+        if not self.enabled:
+            return []
+
+        return self._update_remote(status, completions)
 
     def mark_completed(self, request_id: str, result: dict[str, Any]) -> bool:
         """Mark a request as completed.
@@ -134,42 +209,7 @@ class PollManager:
         if not self.enabled:
             return False
 
-        requests_file = f"{self.data_dir}/requests.json"
-        # Base64 encode the result to avoid shell escaping issues
-        import base64
-        result_b64 = base64.b64encode(json.dumps(result).encode()).decode()
-        completed_at = time.time()
-
-        # Use a Python one-liner to update the request in place
-        python_script = f"""
-import json, base64
-try:
-    result = json.loads(base64.b64decode('{result_b64}').decode())
-    with open('{requests_file}', 'r') as f:
-        requests = json.load(f)
-    for r in requests:
-        if r['id'] == '{request_id}':
-            r['status'] = 'completed'
-            r['result'] = result
-            r['completed_at'] = {completed_at}
-            break
-    completed = [r for r in requests if r.get('status') == 'completed']
-    pending = [r for r in requests if r.get('status') == 'pending']
-    requests = pending + completed[-10:]
-    with open('{requests_file}', 'w') as f:
-        json.dump(requests, f, indent=2)
-    print('ok')
-except Exception as e:
-    print(f'error: {{e}}')
-"""
-        cmd = f"python3 -c \"{python_script}\""
-        success, output = self._run_ssh(cmd, "mark completed")
-
-        if success and output.strip() == "ok":
-            return True
-
-        logger.error(f"Failed to mark request completed: {output}")
-        return False
+        return self._update_remote(None, [(request_id, result)]) is not None
 
     def update_status(self, status: dict[str, Any]) -> bool:
         """Update the cached status on the remote server.
@@ -186,19 +226,40 @@ except Exception as e:
         if not self.enabled:
             return False
 
-        status_file = f"{self.data_dir}/status.json"
-        # Base64 encode to avoid shell escaping issues
-        import base64
-        status_b64 = base64.b64encode(json.dumps(status).encode()).decode()
+        return self._update_remote(status, []) is not None
 
-        cmd = f"python3 -c \"import base64; print(base64.b64decode('{status_b64}').decode())\" > {status_file}"
+    def _update_remote(
+        self,
+        status: dict[str, Any] | None,
+        completions: list[tuple[str, dict[str, Any]]],
+    ) -> list[dict] | None:
+        """Run _UPDATE_SCRIPT on the remote host.
 
-        success, output = self._run_ssh(cmd, "update status")
-        if not success:
-            logger.error(f"Failed to update remote status: {output}")
-            return False
+        Returns:
+            The pending requests, or None if the update failed
+        """
+        completed_at = time.time()
+        payload = {
+            "status": status,
+            "completions": [[rid, result, completed_at] for rid, result in completions],
+        }
+        # The payload goes over stdin, so nothing from it reaches the shell
+        cmd = f"{_UPDATE_COMMAND} {shlex.quote(self.data_dir)}"
+
+        if completions:
+            # requests.json is about to be rewritten
+            self._pending_cache = None
+        success, output, error = self._run_ssh(
+            cmd, "update", input=json.dumps(payload).encode()
+        )
+        if success:
+            try:
+                return json.loads(output)
+            except json.JSONDecodeError:
+                error = f"unexpected output: {output.decode(errors='replace')}"
 
-        return True
+        logger.error(f"Failed to update remote requests/status: {error}")
+        return None
 
 
 def get_poll_manager(config: dict) -> PollManager:
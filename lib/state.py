@@ -3,25 +3,56 @@
 import json
 import shlex
 import logging
+import os
 import subprocess
 import tempfile
 import time
-from datetime import datetime, date
+from datetime import date, datetime, time as dt_time, timedelta
 from pathlib import Path
 from typing import Any
 
+from .hosts import is_transient_ssh_error, ssh_options, ssh_retry_delay
+
+try:
+    import orjson  # Optional: faster JSON encoding/decoding when installed
+except ImportError:
+    orjson = None
+
 # Default state file location
 DEFAULT_STATE_PATH = Path(__file__).parent.parent / "state.json"
 
 logger = logging.getLogger(__name__)
 
 
+def _dump_state(state: dict[str, Any]) -> bytes:
+    """Serialize state as JSON indented by 2 spaces."""
+    if orjson is not None:
+        return orjson.dumps(state, option=orjson.OPT_INDENT_2)
+    return json.dumps(state, indent=2).encode()
+
+
+def _load_state(data: str | bytes) -> Any:
+    """Parse state JSON (raises json.JSONDecodeError if invalid)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class RemoteStateStore:
     """Loads/saves state on a remote host via SSH with a lock."""
 
     MAX_RETRIES = 3
     INITIAL_BACKOFF = 2  # seconds
-    BACKOFF_MULTIPLIER = 2
+    MAX_BACKOFF = 30  # seconds
+
+    # Wait this long for the remote state lock before giving up on an
+    # attempt; flock then exits with LOCK_BUSY_EXIT and the call is retried
+    LOCK_TIMEOUT = 5  # seconds
+    LOCK_BUSY_EXIT = 75  # EX_TEMPFAIL
+
+    # Reuse the remote's date for this long before asking again, when the
+    # remote's next midnight can't be determined
+    TODAY_CACHE_TTL = 60  # seconds
 
     def __init__(self, config: dict[str, Any], fallback: dict[str, Any] | None = None):
         fallback = fallback or {}
@@ -39,42 +70,56 @@ class RemoteStateStore:
         # Track whether the last load_state() succeeded - used to block saves
         # that might overwrite remote state with empty/stale data
         self._load_succeeded = False
+        # (expiry as a Unix timestamp, date) from the last successful
+        # get_today_iso() lookup; expires at the remote's next midnight
+        self._today_cache: tuple[float, str] | None = None
 
     def is_configured(self) -> bool:
         """Return True if remote state is enabled and has host/user."""
         return bool(self.enabled and self.host and self.user and self.state_path)
 
-    def _run_with_retry(self, cmd: list[str], description: str) -> tuple[bool, str, str]:
-        """Run a command with retry logic for transient SSH failures."""
-        backoff = self.INITIAL_BACKOFF
+    def _flock(self, mode: str) -> str:
+        """Build a remote flock prefix that waits at most LOCK_TIMEOUT."""
+        return f"flock -w {self.LOCK_TIMEOUT} -E {self.LOCK_BUSY_EXIT} {mode} {self.lock_path}"
+
+    def _run_with_retry(
+        self, cmd: list[str], description: str, input: bytes | None = None
+    ) -> tuple[bool, bytes, str]:
+        """Run a command with retry logic for transient SSH failures.
+
+        input is sent on the command's stdin, and resent on each attempt.
+        Returns (success, raw stdout, stderr); stdout is left undecoded.
+        """
+        delay = self.INITIAL_BACKOFF
         last_error = ""
 
         for attempt in range(self.MAX_RETRIES):
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            result = subprocess.run(
+                cmd, input=input, capture_output=True, timeout=30
+            )
+            stderr = result.stderr.decode(errors="replace")
             if result.returncode == 0:
-                return True, result.stdout, result.stderr
-
-            last_error = result.stderr.strip()
-            transient_errors = [
-                "Connection reset by peer",
-                "Connection refused",
-                "Connection timed out",
-                "Network is unreachable",
-                "No route to host",
-            ]
-            is_transient = any(err in last_error for err in transient_errors)
+                return True, result.stdout, stderr
+
+            if result.returncode == self.LOCK_BUSY_EXIT:
+                # Another process held the remote lock past LOCK_TIMEOUT
+                last_error = "remote state lock is busy"
+                is_transient = True
+            else:
+                last_error = stderr.strip()
+                is_transient = is_transient_ssh_error(last_error)
 
             if not is_transient or attempt == self.MAX_RETRIES - 1:
                 break
 
+            delay = ssh_retry_delay(last_error, delay, self.INITIAL_BACKOFF, self.MAX_BACKOFF)
             logger.warning(
                 f"Remote state {description} failed (attempt {attempt + 1}/{self.MAX_RETRIES}): "
-                f"{last_error}. Retrying in {backoff}s..."
+                f"{last_error}. Retrying in {delay:.1f}s..."
             )
-            time.sleep(backoff)
-            backoff *= self.BACKOFF_MULTIPLIER
+            time.sleep(delay)
 
-        return False, "", last_error
+        return False, b"", last_error
 
     def load_state(self) -> dict[str, Any]:
         """Load state JSON from the remote host.
@@ -90,8 +135,9 @@ class RemoteStateStore:
         sudo = "sudo " if self.use_sudo else ""
         cmd = [
             "ssh",
+            *ssh_options(),
             remote,
-            f"flock -s {self.lock_path} -c '{sudo}cat {self.state_path} 2>/dev/null || true'",
+            f"{self._flock('-s')} -c '{sudo}cat {self.state_path} 2>/dev/null || true'",
         ]
         success, stdout, error = self._run_with_retry(cmd, "load")
         if not success:
@@ -106,7 +152,7 @@ class RemoteStateStore:
             return {}
 
         try:
-            return json.loads(stdout)
+            return _load_state(stdout)
         except json.JSONDecodeError:
             logger.error("Remote state JSON is invalid; starting fresh.")
             return {}
@@ -120,16 +166,38 @@ class RemoteStateStore:
         if not self.is_configured():
             return date.today().isoformat()
 
+        # Every State property checks for a day reset, so without this each
+        # access would cost an ssh round trip
+        now = time.time()
+        if self._today_cache is not None and now < self._today_cache[0]:
+            return self._today_cache[1]
+
         remote = f"{self.user}@{self.host}"
         tz_prefix = ""
         if self.timezone:
-            tz_prefix = f"TZ={shlex.quote(self.timezone)} "
+            tz_prefix = f"export TZ={shlex.quote(self.timezone)}; "
 
-        # Use the remote's local date (or configured TZ) to avoid UTC/local drift.
-        cmd = ["ssh", remote, f"{tz_prefix}date +%F"]
+        # Use the remote's local date (or configured TZ) to avoid UTC/local
+        # drift, followed by the Unix time of the midnight that ends it. The
+        # midnight needs GNU date, so it is left out rather than failing the
+        # command on other remotes.
+        cmd = [
+            "ssh",
+            *ssh_options(),
+            remote,
+            f'{tz_prefix}d=$(date +%F) && echo "$d" && '
+            '{ date -d "$d + 1 day" +%s 2>/dev/null || true; }',
+        ]
         success, stdout, error = self._run_with_retry(cmd, "date")
-        if success and stdout.strip():
-            return stdout.strip()
+        lines = stdout.decode(errors="replace").split()
+        if success and lines:
+            try:
+                expires = float(lines[1])
+            except (IndexError, ValueError):
+                # No GNU date on the remote: fall back to a short expiry
+                expires = now + self.TODAY_CACHE_TTL
+            self._today_cache = (expires, lines[0])
+            return lines[0]
 
         logger.warning(f"Falling back to local date for remote state: {error}")
         return date.today().isoformat()
@@ -151,43 +219,32 @@ class RemoteStateStore:
             )
             return False
 
-        temp_path = None
+        # One ssh call: the JSON arrives on stdin and is written to a private
+        # temp file, which is moved into place while holding the lock
         remote = f"{self.user}@{self.host}"
-        try:
-            with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as f:
-                json.dump(state, f, indent=2)
-                temp_path = f.name
-
-            success, _, error = self._run_with_retry(
-                ["scp", temp_path, f"{remote}:/tmp/state.json.tmp"],
-                "scp",
-            )
-            if not success:
-                logger.error(f"Failed to copy remote state: {error}")
-                return False
-
-            sudo = "sudo " if self.use_sudo else ""
-            cmd = [
-                "ssh",
-                remote,
-                "flock -x {lock} -c '{sudo}mkdir -p {dir} "
-                "&& {sudo}mv /tmp/state.json.tmp {path} "
-                "&& {sudo}chmod 600 {path} {chown}'".format(
-                    lock=self.lock_path,
-                    sudo=sudo,
-                    dir=self.state_dir,
-                    path=self.state_path,
-                    chown=f'&& {sudo}chown root:root {self.state_path}' if self.use_sudo else "",
-                ),
-            ]
-            success, _, error = self._run_with_retry(cmd, "save")
-            if not success:
-                logger.error(f"Failed to save remote state: {error}")
-                return False
-            return True
-        finally:
-            if temp_path:
-                Path(temp_path).unlink(missing_ok=True)
+        sudo = "sudo " if self.use_sudo else ""
+        cmd = [
+            "ssh",
+            *ssh_options(),
+            remote,
+            "{flock} -c 'umask 077 && cat > /tmp/state.json.tmp "
+            "&& {sudo}mkdir -p {dir} "
+            "&& {sudo}mv /tmp/state.json.tmp {path} "
+            "&& {sudo}chmod 600 {path} {chown}'".format(
+                flock=self._flock("-x"),
+                sudo=sudo,
+                dir=self.state_dir,
+                path=self.state_path,
+                chown=f'&& {sudo}chown root:root {self.state_path}' if self.use_sudo else "",
+            ),
+        ]
+        success, _, error = self._run_with_retry(
+            cmd, "save", input=_dump_state(state)
+        )
+        if not success:
+            logger.error(f"Failed to save remote state: {error}")
+            return False
+        return True
 
 
 class State:
@@ -201,6 +258,12 @@ class State:
         self.state_path = Path(state_path) if state_path else DEFAULT_STATE_PATH
         self.remote_store = remote_store
         self._state: dict[str, Any] = {}
+        # Serialized state as last loaded or saved, or None if nothing is
+        # stored yet; save() skips writing when nothing has changed
+        self._persisted: bytes | None = None
+        # Local date and the Unix time at which it ends, for _local_today()
+        self._today = ""
+        self._next_midnight = 0.0
         self.load()
 
     def load(self) -> None:
@@ -215,23 +278,55 @@ class State:
                 )
         else:
             if self.state_path.exists():
-                with open(self.state_path, "r") as f:
-                    self._state = json.load(f)
+                self._state = _load_state(self.state_path.read_bytes())
             else:
                 self._state = {}
+        self._persisted = _dump_state(self._state) if self._state else None
 
         # Check if we need to reset for a new day
         self._check_day_reset()
 
     def save(self) -> None:
-        """Save state to file."""
+        """Save state to file.
+
+        Writes a uniquely named sibling temp file and renames it over the
+        state file, so a crash mid-write never leaves a truncated state.json
+        and the CLI and daemon saving at once can't interleave their writes.
+        Nothing is written if the state matches what was last loaded or saved.
+        """
+        data = _dump_state(self._state)
+        if data == self._persisted:
+            return
+
         if self.remote_store:
-            self.remote_store.save_state(self._state)
+            if self.remote_store.save_state(self._state):
+                self._persisted = data
             return
 
         self.state_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.state_path, "w") as f:
-            json.dump(self._state, f, indent=2)
+        fd, temp_path = tempfile.mkstemp(
+            dir=self.state_path.parent, prefix=".state.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.state_path)
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+        self._persisted = data
+
+    def _local_today(self) -> str:
+        """Get today's local date, recomputed only once midnight passes."""
+        now = time.time()
+        if now >= self._next_midnight:
+            today = date.fromtimestamp(now)
+            self._today = today.isoformat()
+            self._next_midnight = datetime.combine(
+                today + timedelta(days=1), dt_time.min
+            ).timestamp()
+        return self._today
 
     def _check_day_reset(self) -> None:
         """Reset state if it's a new day.
@@ -248,7 +343,7 @@ class State:
         today = (
             self.remote_store.get_today_iso()
             if self.remote_store
-            else date.today().isoformat()
+            else self._local_today()
         )
         current_tz = (
             self.remote_store.timezone
@@ -276,6 +371,10 @@ class State:
     def is_blocked(self) -> bool:
         """Check if sites are currently blocked."""
         self._check_day_reset()
+        return self._is_blocked_now()
+
+    def _is_blocked_now(self) -> bool:
+        """Check if sites are blocked, assuming the day reset was checked."""
         unlocked_until = self._state.get("unlocked_until", 0)
         if unlocked_until > 0:
             # There was an unlock set - check if it's still active
@@ -367,14 +466,14 @@ class State:
     def record_emergency_unlock(self, wait_time: int) -> None:
         """Record an emergency unlock usage."""
         self._check_day_reset()
-        self._state["emergency_count"] = self.emergency_count + 1
+        self._state["emergency_count"] = self._state.get("emergency_count", 0) + 1
         self._state["last_emergency_wait"] = wait_time
         self.save()
 
     def can_emergency_unlock(self, max_per_day: int) -> bool:
         """Check if emergency unlock is available."""
         self._check_day_reset()
-        return self.emergency_count < max_per_day
+        return self._state.get("emergency_count", 0) < max_per_day
 
     def get_next_emergency_wait(self, initial_wait: int, multiplier: int) -> int:
         """Calculate the next emergency wait time."""
@@ -390,20 +489,22 @@ class State:
 
     def get_status(self) -> dict[str, Any]:
         """Get a status summary."""
+        # Checked once here; the fields below read the state directly
         self._check_day_reset()
+        emergency_count = self._state.get("emergency_count", 0)
         return {
             "date": self.today,
-            "blocked": self.is_blocked,
+            "blocked": self._is_blocked_now(),
             "unlocked_until": self.unlocked_until,
             "unlock_remaining": self.unlock_remaining_formatted,
-            "emergency_count": self.emergency_count,
-            "emergency_remaining": max(0, 3 - self.emergency_count),  # Will use config
+            "emergency_count": emergency_count,
+            "emergency_remaining": max(0, 3 - emergency_count),  # Will use config
         }
 
     def get_debug_snapshot(self) -> dict[str, Any]:
         """Get a detailed snapshot for diagnostics."""
         self._check_day_reset()
-        blocked = self.is_blocked
+        blocked = self._is_blocked_now()
         snapshot = dict(self._state)
         snapshot["is_blocked"] = blocked
         snapshot["unlock_remaining"] = self.unlock_remaining_formatted
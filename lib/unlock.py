@@ -1,9 +1,13 @@
 """Unlock logic and shame prompts."""
 
 import logging
+import math
+import random
 import sys
 import time
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, suppress
+from typing import Any, Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -22,9 +26,44 @@ SHAME_PROMPTS = [
     "Your future self will thank you for staying focused.",
     "Distraction is the enemy of achievement.",
 ]
+_SHAME_COUNT = len(SHAME_PROMPTS)
 
 CONFIRMATION_PHRASE = "I CHOOSE DISTRACTION"
 
+# Rough check time in seconds by condition type, used to order short-circuit
+# checks until a condition has been timed; other types may hit the network
+CONDITION_COST_ESTIMATES = {
+    "checkbox": 0.001,
+    "yaml": 0.001,
+    "heading": 0.001,
+    "regex": 0.001,
+    "linked_wordcount": 0.01,
+}
+DEFAULT_CONDITION_COST = 1.0
+
+# Weight of the newest sample in each condition's average check time
+CONDITION_LATENCY_ALPHA = 0.3
+
+
+def _countdown(seconds: int) -> None:
+    """Wait for the given number of seconds, showing a countdown on a terminal.
+
+    The wait is measured against a deadline, so time spent writing doesn't
+    stretch it. When stdout isn't a terminal there is nothing to animate,
+    and the wait is a single sleep.
+    """
+    if not sys.stdout.isatty():
+        time.sleep(seconds)
+        return
+
+    deadline = time.monotonic() + seconds
+    while (left := deadline - time.monotonic()) > 0:
+        shown = math.ceil(left)
+        sys.stdout.write(f"\rWaiting... {shown} seconds remaining   ")
+        sys.stdout.flush()
+        # Wake when the shown number next changes
+        time.sleep(left - (shown - 1))
+
 
 class UnlockManager:
     """Manages unlocking logic for proof-of-work and emergency unlocks."""
@@ -54,6 +93,15 @@ class UnlockManager:
         # Cache for condition instances (created lazily)
         self._conditions: dict[str, Condition] = {}
 
+        # check_all_conditions() result, reused inside reuse_condition_results()
+        # and otherwise until the time.monotonic() deadline _results_expiry
+        self._results_depth = 0
+        self._cached_results: tuple[bool, list[tuple[str, bool, str]]] | None = None
+        self._results_expiry = 0.0
+
+        # Condition name -> moving average of its check time in seconds
+        self._cond_latency: dict[str, float] = {}
+
     def _get_condition(self, condition_type: str) -> Condition:
         """Get or create a condition instance by type.
 
@@ -73,25 +121,132 @@ class UnlockManager:
             )
         return self._conditions[condition_type]
 
-    def _sync_remote(self) -> bool:
+    def _check_condition(
+        self, name: str, condition_config: dict, fast: bool = False
+    ) -> tuple[str, bool, str]:
+        """Check one condition, counting any failure as not met.
+
+        With fast, a condition class defining check_fast is checked with
+        it instead, which may cut work short once the outcome is known.
+        """
+        condition_type = condition_config.get("type", "checkbox")
+        started = time.monotonic()
+
+        try:
+            condition = self._get_condition(condition_type)
+            # Looked up on the class, so only conditions that define it opt in
+            check_fast = getattr(type(condition), "check_fast", None) if fast else None
+            if check_fast is not None:
+                met, description = check_fast(condition, condition_config)
+            else:
+                met, description = condition.check(condition_config)
+        except ValueError as e:
+            # Unknown condition type
+            logger.error(f"Condition '{name}' has unknown type '{condition_type}': {e}")
+            met, description = False, f"Unknown type: {condition_type}"
+        except Exception as e:
+            # Condition check failed - fail safe (count as not met)
+            logger.error(f"Condition '{name}' check failed: {e}")
+            met, description = False, f"Error: {e}"
+
+        elapsed = time.monotonic() - started
+        previous = self._cond_latency.get(name)
+        self._cond_latency[name] = (
+            elapsed if previous is None
+            else previous + CONDITION_LATENCY_ALPHA * (elapsed - previous)
+        )
+        return name, met, description
+
+    def _expected_cost(self, name: str, condition_config: dict) -> float:
+        """Expected check time: the condition's average, or its type's estimate."""
+        cost = self._cond_latency.get(name)
+        if cost is None:
+            condition_type = condition_config.get("type", "checkbox")
+            cost = CONDITION_COST_ESTIMATES.get(condition_type, DEFAULT_CONDITION_COST)
+        return cost
+
+    def _fresh_cached_results(self) -> tuple[bool, list[tuple[str, bool, str]]] | None:
+        """The cached check_all_conditions() result, if it can still be used."""
+        cached = self._cached_results
+        if cached is not None and (
+            self._results_depth or time.monotonic() < self._results_expiry
+        ):
+            return cached
+        return None
+
+    def _store_results(
+        self, results: list[tuple[str, bool, str]]
+    ) -> tuple[bool, list[tuple[str, bool, str]]]:
+        """Combine complete results per condition_mode and cache them."""
+        if self.config.condition_mode == "all":
+            # AND logic: all conditions must be met
+            conditions_satisfied = all(met for _, met, _ in results) if results else False
+        else:
+            # OR logic (default): any condition met is sufficient
+            conditions_satisfied = any(met for _, met, _ in results)
+
+        ttl = self.config.unlock_settings.get("conditions_cache_ttl", 5)
+        self._cached_results = (conditions_satisfied, results)
+        self._results_expiry = time.monotonic() + ttl
+        return self._cached_results
+
+    def _sync_remote(self, background: bool = False) -> bool:
         """Sync blocking state to remote DNS server.
 
+        Args:
+            background: Queue the sync on the remote sync worker instead of
+                waiting for it; failures are then only logged.
+
         Returns:
-            True if sync succeeded or was disabled, False on failure.
+            True if sync succeeded, was queued, or was disabled, False on failure.
         """
         if not self.remote_sync or not self.remote_sync.enabled:
             return True
 
         # When unblocked, sync empty list to remote; when blocked, sync full list
-        if self.state.is_blocked:
-            success, message = self.remote_sync.sync(self.config.blocked_sites)
-        else:
-            success, message = self.remote_sync.sync([])  # Unblock all on remote
+        sites = self.config.blocked_sites if self.state.is_blocked else []
+
+        if background:
+            self.remote_sync.sync_async(sites, "state sync")
+            return True
 
+        success, message = self.remote_sync.sync(sites)
         if not success:
             logger.error(f"Remote sync failed: {message}")
         return success
 
+    def wait_for_remote_sync(self, timeout: float | None = None) -> None:
+        """Wait for a remote sync queued in the background to finish.
+
+        Unlocks and force_block() push to the remote DNS server without
+        waiting; short-lived callers like the CLI call this before exiting.
+        """
+        if self.remote_sync and self.remote_sync.enabled:
+            self.remote_sync.wait_pending(timeout)
+
+    @contextmanager
+    def reuse_condition_results(self) -> Iterator[None]:
+        """Evaluate conditions at most once until the block exits.
+
+        The daemon checks conditions for auto-unlock, phone requests and the
+        phone status within a single cycle; their inputs don't meaningfully
+        change in that time, so the first result is reused. Blocks may nest.
+        After the block exits, the result is only reused until it expires.
+        Entering the outermost block drops any earlier result, so each
+        daemon cycle starts from a fresh check.
+        """
+        if not self._results_depth:
+            self._cached_results = None
+        self._results_depth += 1
+        try:
+            yield
+        finally:
+            self._results_depth -= 1
+
+    def invalidate_conditions_cache(self) -> None:
+        """Drop the cached condition results so the next check re-evaluates."""
+        self._cached_results = None
+
     def check_all_conditions(self) -> tuple[bool, list[tuple[str, bool, str]]]:
         """Check all conditions and return results.
 
@@ -101,39 +256,77 @@ class UnlockManager:
 
         Errors are handled fail-safe: if a condition check fails, it counts as not met.
 
+        Results are reused for unlock.conditions_cache_ttl seconds (default 5),
+        so a status check followed by an unlock evaluates conditions once.
+
         Returns:
             Tuple of (conditions_satisfied, list of (condition_name, met, description))
         """
-        conditions = self.config.conditions
-        results: list[tuple[str, bool, str]] = []
+        cached = self._fresh_cached_results()
+        if cached is not None:
+            return cached
+
+        conditions = list(self.config.conditions.items())
+        results: list[tuple[str, bool, str]] = [None] * len(conditions)
+
+        # Conditions of one type share an instance, so each type's checks run
+        # in order on one worker; different types are checked concurrently
+        by_type: dict[str, list[int]] = {}
+        for index, (_, condition_config) in enumerate(conditions):
+            by_type.setdefault(condition_config.get("type", "checkbox"), []).append(index)
+
+        def check_indices(indices: list[int]) -> None:
+            for index in indices:
+                results[index] = self._check_condition(*conditions[index])
+
+        if len(by_type) > 1:
+            # Create instances here so workers don't race to create them;
+            # creation errors are reported by _check_condition
+            for condition_type in by_type:
+                with suppress(Exception):
+                    self._get_condition(condition_type)
+            with ThreadPoolExecutor(
+                max_workers=min(8, len(by_type)), thread_name_prefix="conditions"
+            ) as executor:
+                for future in [executor.submit(check_indices, i) for i in by_type.values()]:
+                    future.result()
+        else:
+            for indices in by_type.values():
+                check_indices(indices)
 
-        for name, condition_config in conditions.items():
-            condition_type = condition_config.get("type", "checkbox")
+        return self._store_results(results)
 
-            try:
-                condition = self._get_condition(condition_type)
-                met, description = condition.check(condition_config)
-            except ValueError as e:
-                # Unknown condition type
-                logger.error(f"Condition '{name}' has unknown type '{condition_type}': {e}")
-                met, description = False, f"Unknown type: {condition_type}"
-            except Exception as e:
-                # Condition check failed - fail safe (count as not met)
-                logger.error(f"Condition '{name}' check failed: {e}")
-                met, description = False, f"Error: {e}"
-
-            results.append((name, met, description))
-
-        # Determine if conditions are satisfied based on mode
-        mode = self.config.condition_mode
-        if mode == "all":
-            # AND logic: all conditions must be met
-            conditions_satisfied = all(met for _, met, _ in results) if results else False
-        else:
-            # OR logic (default): any condition met is sufficient
-            conditions_satisfied = any(met for _, met, _ in results)
+    def check_conditions_fast(self) -> tuple[bool, list[tuple[str, bool, str]]]:
+        """Check conditions only until the outcome is known.
+
+        In "any" mode this stops at the first condition met, and in "all"
+        mode at the first one not met. Conditions are checked cheapest
+        first, by their average check time so far, and conditions that
+        define check_fast may stop early too (a word count stops at its
+        minimum).
+
+        Returns:
+            Tuple of (conditions_satisfied, results for the conditions that
+            were checked, in config order)
+        """
+        cached = self._fresh_cached_results()
+        if cached is not None:
+            return cached
+
+        conditions = list(self.config.conditions.items())
+        # The result that settles the outcome: met in "any" mode, unmet in "all"
+        deciding = self.config.condition_mode != "all"
 
-        return conditions_satisfied, results
+        order = sorted(range(len(conditions)), key=lambda i: self._expected_cost(*conditions[i]))
+
+        checked: dict[int, tuple[str, bool, str]] = {}
+        for index in order:
+            checked[index] = self._check_condition(*conditions[index], fast=True)
+            if checked[index][1] == deciding:
+                return deciding, [checked[i] for i in sorted(checked)]
+
+        # Every condition was checked, so the result is complete
+        return self._store_results([checked[i] for i in sorted(checked)])
 
     def proof_of_work_unlock(self) -> tuple[bool, str]:
         """Attempt proof-of-work unlock.
@@ -146,8 +339,8 @@ class UnlockManager:
             remaining = self.state.unlock_remaining_formatted
             return True, f"Already unlocked. {remaining} remaining."
 
-        # Check conditions
-        conditions_satisfied, results = self.check_all_conditions()
+        # Check conditions, stopping once the outcome is known
+        conditions_satisfied, results = self.check_conditions_fast()
 
         # Build status message
         status_lines = ["Condition check results:"]
@@ -161,7 +354,8 @@ class UnlockManager:
             self.state.set_unlocked(duration)
             self.state.mark_unlocked_via_conditions()  # Prevent auto re-unlock after expiry
             self.hosts.unblock_sites()
-            self._sync_remote()
+            self._sync_remote(background=True)
+            self.invalidate_conditions_cache()
 
             hours = duration // 3600
             minutes = (duration % 3600) // 60
@@ -198,17 +392,12 @@ class UnlockManager:
 
         if interactive:
             # Show shame prompt
-            import random
-            shame = random.choice(SHAME_PROMPTS)
+            shame = SHAME_PROMPTS[random.randrange(_SHAME_COUNT)]
             print(f"\n{shame}")
             print(f"\nThis is emergency unlock #{count} of {max_per_day}.")
             print(f"You must wait {wait_time} seconds to continue.\n")
 
-            # Countdown
-            for remaining in range(wait_time, 0, -1):
-                sys.stdout.write(f"\rWaiting... {remaining} seconds remaining   ")
-                sys.stdout.flush()
-                time.sleep(1)
+            _countdown(wait_time)
             print("\n")
 
             # Require confirmation
@@ -227,7 +416,7 @@ class UnlockManager:
         # Unlock for the emergency duration
         self.state.set_unlocked(duration)
         self.hosts.unblock_sites()
-        self._sync_remote()
+        self._sync_remote(background=True)
 
         minutes = duration // 60
         remaining_unlocks = max_per_day - count
@@ -238,14 +427,19 @@ class UnlockManager:
         """Force sites to be blocked immediately."""
         self.state.force_block()
         self.hosts.block_sites(self.config.blocked_sites)
-        self._sync_remote()
+        self._sync_remote(background=True)
+        self.invalidate_conditions_cache()
         return "Sites are now blocked."
 
-    def sync_blocking_state(self) -> None:
-        """Sync hosts file and remote DNS with current state."""
+    def sync_blocking_state(self, background: bool = False) -> None:
+        """Sync hosts file and remote DNS with current state.
+
+        Args:
+            background: Push to the remote server without waiting for it
+        """
         should_block = self.state.is_blocked
         self.hosts.sync_with_config(self.config.blocked_sites, should_block)
-        self._sync_remote()
+        self._sync_remote(background=background)
 
     def get_status(self) -> dict[str, Any]:
         """Get current status."""
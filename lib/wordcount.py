@@ -1,70 +1,197 @@
 """Word counting for linked files in Obsidian vault."""
 
+import os
 import re
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 from .obsidian import ObsidianParser
 
+# Markdown syntax stripped by count_words, compiled once. Patterns that
+# begin with the same literal share one pass over the text; fusing ones
+# that don't makes re try every alternative at each position, which is
+# slower than separate passes that can skip ahead to their first literal.
+_CODE_RE = re.compile(r"```[\s\S]*?```|`[^`]+`")
+_LINK_RE = re.compile(
+    r"\[\[(?P<wiki_target>[^\]|]+)(?:\|(?P<wiki_alias>[^\]]+))?\]\]"
+    r"|\[(?P<link_text>[^\]]+)\]\([^)]+\)"
+)
+_IMAGE_RE = re.compile(r"!\[[^\]]*\]\([^)]+\)")
+_HEADING_RE = re.compile(r"^#+\s*", re.MULTILINE)
+_BOLD_STAR_RE = re.compile(r"\*\*([^*]+)\*\*")
+_ITALIC_STAR_RE = re.compile(r"\*([^*]+)\*")
+_BOLD_UNDERSCORE_RE = re.compile(r"__([^_]+)__")
+_ITALIC_UNDERSCORE_RE = re.compile(r"_([^_]+)_")
+_BULLET_RE = re.compile(r"^[-*]\s*(\[[xX ]\])?\s*", re.MULTILINE)
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def _link_text(match: re.Match) -> str:
+    """Text shown for a link: a wiki-link's alias or target, or a link's text."""
+    return match.group("wiki_alias") or match.group("wiki_target") or match.group("link_text")
+
+
+# Characters of text split into words at a time by _count_split_words
+_SPLIT_CHUNK = 64 * 1024
+
+
+def _count_split_words(text: str) -> int:
+    """Count what text.split() would return, without building the whole list.
+
+    The text is split a chunk at a time, each ending at a newline so no
+    word is cut in two; the list of words for a long note would otherwise
+    take several times the memory of the note itself.
+    """
+    count = 0
+    start = 0
+    while start < len(text):
+        end = text.find("\n", start + _SPLIT_CHUNK)
+        if end < 0:
+            end = len(text)
+        count += len(text[start:end].split())
+        start = end
+    return count
+
+
+def _read_text(file_path: Path) -> str | None:
+    """Read a file's text, or None if it can't be read."""
+    try:
+        return file_path.read_text()
+    except Exception:
+        return None
+
 
 class WordCounter:
     """Count words in files linked from Obsidian daily notes."""
 
+    # Most linked files whose word counts are remembered
+    COUNT_CACHE_SIZE = 256
+
+    # Seconds before a link whose file wasn't found is resolved again; each
+    # attempt may walk the whole vault
+    MISSING_LINK_TTL = 60
+
     def __init__(self, obsidian_parser: ObsidianParser):
         self.parser = obsidian_parser
+        # Path -> (st_mtime_ns, st_size, word count), least recently used first
+        self._count_cache: OrderedDict[Path, tuple[int, int, int]] = OrderedDict()
+        # Wiki-link -> path it resolved to, and wiki-link -> time.monotonic()
+        # after which a link that didn't resolve is tried again. Both are
+        # dropped when the vault root's mtime changes.
+        self._link_paths: dict[str, Path] = {}
+        self._missing_links: dict[str, float] = {}
+        self._vault_mtime_ns: int | None = None
 
     def count_words(self, text: str) -> int:
         """Count words in text, excluding markdown syntax."""
         if not text:
             return 0
 
-        # Remove YAML frontmatter
+        # Remove YAML frontmatter: everything up to the next "---", sliced
+        # once rather than split into copies of the whole note
         if text.startswith("---"):
-            parts = text.split("---", 2)
-            if len(parts) >= 3:
-                text = parts[2]
+            end = text.find("---", 3)
+            if end >= 0:
+                text = text[end + 3:]
 
-        # Remove code blocks
-        text = re.sub(r"```[\s\S]*?```", "", text)
-        text = re.sub(r"`[^`]+`", "", text)
+        # Remove code blocks and inline code
+        text = _CODE_RE.sub("", text)
 
-        # Remove links but keep link text
-        text = re.sub(r"\[\[([^\]|]+)(?:\|([^\]]+))?\]\]", r"\2" if r"\2" else r"\1", text)
-        text = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", text)
+        # Remove links but keep link text (a wiki-link's alias if it has one)
+        text = _LINK_RE.sub(_link_text, text)
 
         # Remove images
-        text = re.sub(r"!\[[^\]]*\]\([^)]+\)", "", text)
+        text = _IMAGE_RE.sub("", text)
 
         # Remove headings markers but keep text
-        text = re.sub(r"^#+\s*", "", text, flags=re.MULTILINE)
+        text = _HEADING_RE.sub("", text)
 
         # Remove bold/italic markers
-        text = re.sub(r"\*\*([^*]+)\*\*", r"\1", text)
-        text = re.sub(r"\*([^*]+)\*", r"\1", text)
-        text = re.sub(r"__([^_]+)__", r"\1", text)
-        text = re.sub(r"_([^_]+)_", r"\1", text)
+        text = _BOLD_STAR_RE.sub(r"\1", text)
+        text = _ITALIC_STAR_RE.sub(r"\1", text)
+        text = _BOLD_UNDERSCORE_RE.sub(r"\1", text)
+        text = _ITALIC_UNDERSCORE_RE.sub(r"\1", text)
 
         # Remove bullet points and task markers
-        text = re.sub(r"^[-*]\s*(\[[xX ]\])?\s*", "", text, flags=re.MULTILINE)
+        text = _BULLET_RE.sub("", text)
 
         # Remove HTML tags
-        text = re.sub(r"<[^>]+>", "", text)
+        text = _HTML_TAG_RE.sub("", text)
+
+        return _count_split_words(text)
+
+    def _cached_count(self, file_path: Path, key: tuple[int, int]) -> int | None:
+        """Word count remembered for a file, if it still has this (mtime_ns, size)."""
+        cached = self._count_cache.get(file_path)
+        if cached is None or cached[:2] != key:
+            return None
+        self._count_cache.move_to_end(file_path)
+        return cached[2]
+
+    def _store_count(self, file_path: Path, key: tuple[int, int], word_count: int) -> None:
+        """Remember a file's word count, evicting the least recently used."""
+        cache = self._count_cache
+        cache[file_path] = (*key, word_count)
+        cache.move_to_end(file_path)
+        if len(cache) > self.COUNT_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def _check_vault_changed(self) -> None:
+        """Forget resolved links if files were added or removed at the vault root."""
+        try:
+            mtime_ns = self.parser.vault_path.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        if mtime_ns != self._vault_mtime_ns:
+            self._vault_mtime_ns = mtime_ns
+            self._link_paths.clear()
+            self._missing_links.clear()
 
-        # Split on whitespace and count non-empty words
-        words = text.split()
-        return len([w for w in words if w.strip()])
+    def _resolve_link(self, link: str) -> tuple[Path, os.stat_result] | None:
+        """Resolve a wiki-link to a path and its stat() result, reusing past lookups.
+
+        A remembered path is confirmed by the stat() the count cache needs
+        anyway; if it has gone, the link is resolved from scratch.
+        """
+        path = self._link_paths.get(link)
+        if path is not None:
+            try:
+                return path, path.stat()
+            except OSError:
+                del self._link_paths[link]
+        elif time.monotonic() < self._missing_links.get(link, 0):
+            return None
+
+        found = self.parser.resolve_link_stat(link)
+        if found is None:
+            self._missing_links[link] = time.monotonic() + self.MISSING_LINK_TTL
+        else:
+            self._link_paths[link] = found[0]
+            self._missing_links.pop(link, None)
+        return found
 
     def get_linked_files_wordcount(
         self,
         section: str,
         any_level: bool = True,
+        target: int | None = None,
     ) -> tuple[int, list[tuple[str, int]]]:
         """Get total word count from files linked under a section.
 
+        Files that changed since they were last counted are read in
+        parallel; counting and the cache stay on the calling thread.
+
+        With a target, counting stops as soon as the total reaches it:
+        cached counts are used first, then uncounted files are read one
+        at a time, and files left uncounted are not reported.
+
         Returns:
             Tuple of (total_words, list of (filename, word_count) pairs)
         """
-        content = self.parser.read_daily_note()
+        content = self.parser.read_daily_note_cached()
         if content is None:
             return 0, []
 
@@ -78,26 +205,71 @@ class WordCounter:
         if not links:
             return 0, []
 
-        # Count words in each linked file
-        file_counts: list[tuple[str, int]] = []
-        total = 0
+        # (link, word count) in link order, leaving out missing files
+        file_counts: list[tuple[str, int | None]] = []
+        # (index in file_counts, path, (mtime_ns, size)) of files to read
+        to_read: list[tuple[int, Path, tuple[int, int]]] = []
 
+        # Words counted so far, for stopping early at the target
+        known = 0
+
+        self._check_vault_changed()
         for link in links:
-            file_path = self.parser.resolve_link_path(link)
-            if file_path and file_path.exists():
-                try:
-                    file_content = file_path.read_text()
-                    word_count = self.count_words(file_content)
-                    file_counts.append((link, word_count))
-                    total += word_count
-                except Exception:
-                    file_counts.append((link, 0))
-
-        return total, file_counts
-
-    def check_wordcount_condition(self, condition_config: dict[str, Any]) -> tuple[bool, str, int]:
+            if target is not None and known >= target:
+                break
+            # One stat() per file both resolves the link and keys the cache
+            found = self._resolve_link(link)
+            if found is None:
+                continue
+            file_path, st = found
+            key = (st.st_mtime_ns, st.st_size)
+            word_count = self._cached_count(file_path, key)
+            if word_count is None:
+                to_read.append((len(file_counts), file_path, key))
+            else:
+                known += word_count
+            file_counts.append((link, word_count))
+
+        if target is not None:
+            for index, file_path, key in to_read:
+                if known >= target:
+                    break
+                text = _read_text(file_path)
+                word_count = 0
+                if text is not None:
+                    word_count = self.count_words(text)
+                    self._store_count(file_path, key, word_count)
+                file_counts[index] = (file_counts[index][0], word_count)
+                known += word_count
+            counted = [(link, count) for link, count in file_counts if count is not None]
+            return known, counted
+
+        paths = [file_path for _, file_path, _ in to_read]
+        if len(paths) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+                texts = list(executor.map(_read_text, paths))
+        else:
+            texts = [_read_text(file_path) for file_path in paths]
+
+        for (index, file_path, key), text in zip(to_read, texts):
+            word_count = 0
+            if text is not None:
+                word_count = self.count_words(text)
+                self._store_count(file_path, key, word_count)
+            file_counts[index] = (file_counts[index][0], word_count)
+
+        return sum(count for _, count in file_counts), file_counts
+
+    def check_wordcount_condition(
+        self,
+        condition_config: dict[str, Any],
+        stop_at_minimum: bool = False,
+    ) -> tuple[bool, str, int]:
         """Check if the word count condition is met.
 
+        With stop_at_minimum, counting stops once the minimum is reached,
+        so the count reported for a met condition may be partial.
+
         Returns:
             Tuple of (met, description, actual_count)
         """
@@ -105,7 +277,9 @@ class WordCounter:
         any_level = condition_config.get("section_any_level", True)
         minimum = condition_config.get("minimum", 500)
 
-        total, file_counts = self.get_linked_files_wordcount(section, any_level)
+        total, file_counts = self.get_linked_files_wordcount(
+            section, any_level, target=minimum if stop_at_minimum else None
+        )
 
         met = total >= minimum
 
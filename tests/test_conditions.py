@@ -33,11 +33,47 @@ class TestConditionRegistry:
         with pytest.raises(ValueError, match="Unknown condition type"):
             ConditionRegistry.create("nonexistent_type", context)
 
+    def test_wordcount_module_loaded_on_first_use(self):
+        """lib.wordcount should only be imported once a linked_wordcount condition is made."""
+        import subprocess
+
+        script = (
+            "import sys\n"
+            "from pathlib import Path\n"
+            "from lib.conditions import ConditionContext, ConditionRegistry\n"
+            "print('lib.wordcount' in sys.modules)\n"
+            "ConditionRegistry.create('linked_wordcount', ConditionContext(vault_path=Path('/tmp')))\n"
+            "print('lib.wordcount' in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True, text=True, check=True,
+            cwd=Path(__file__).parent.parent,
+        )
+
+        assert result.stdout.split() == ["False", "True"]
+
     def test_is_registered(self):
         """is_registered should return True for registered types."""
         assert ConditionRegistry.is_registered("checkbox") is True
         assert ConditionRegistry.is_registered("nonexistent") is False
 
+    def test_create_all_shares_instance_per_type(self, temp_vault):
+        """create_all should build one instance per type for all named conditions."""
+        context = ConditionContext(vault_path=temp_vault)
+        instances = ConditionRegistry.create_all(
+            {
+                "workout": {"type": "checkbox", "pattern": "- [x] Workout"},
+                "reading": {"type": "checkbox", "pattern": "- [x] Read"},
+                "journal": {"type": "heading", "section": "Journal"},
+            },
+            context,
+        )
+
+        assert set(instances) == {"workout", "reading", "journal"}
+        assert instances["workout"] is instances["reading"]
+        assert instances["journal"] is not instances["workout"]
+
     def test_custom_registration(self):
         """Custom conditions can be registered and created."""
 
@@ -77,6 +113,25 @@ class TestConditionContext:
         assert context.secrets == {}
         assert context.full_config == {}
 
+    def test_obsidian_conditions_share_parser(self, temp_vault):
+        """Obsidian conditions built from one context should share its parser."""
+        from lib.conditions.obsidian import CheckboxCondition, HeadingCondition
+
+        context = ConditionContext(vault_path=temp_vault)
+
+        assert CheckboxCondition(context).parser is HeadingCondition(context).parser
+        assert context.get_parser() is context.get_parser()
+
+    def test_context_is_frozen_and_hashable(self):
+        """Context should reject mutation and be usable as a cache key."""
+        import dataclasses
+
+        context = ConditionContext(vault_path=Path("/tmp/vault"), secrets={"a": {"b": 1}})
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            context.vault_path = Path("/elsewhere")
+        assert hash(context) == hash(ConditionContext(vault_path=Path("/tmp/vault")))
+
     def test_get_secret_nested_path(self):
         """get_secret should support dot-separated paths."""
         context = ConditionContext(
@@ -92,6 +147,10 @@ class TestConditionContext:
         assert context.get_secret("strava.client_secret") == "test_secret"
         assert context.get_secret("strava.missing", default="default") == "default"
         assert context.get_secret("missing.path") is None
+        assert context.get_secret("strava") == {
+            "client_id": "test_id",
+            "client_secret": "test_secret",
+        }
 
 
 class TestCheckboxCondition:
@@ -130,6 +189,24 @@ class TestCheckboxCondition:
         assert met is False
         assert "not checked" in desc
 
+    def test_picks_up_note_edits_between_checks(self, temp_vault):
+        """Cached note content should be refreshed when the note changes."""
+        from lib.conditions.obsidian import CheckboxCondition
+
+        today = date.today().strftime("%Y-%m-%d")
+        note_path = temp_vault / "Daily" / f"{today}.md"
+        note_path.write_text("- [ ] Workout")
+
+        context = ConditionContext(vault_path=temp_vault)
+        condition = CheckboxCondition(context)
+
+        met, _ = condition.check({"pattern": "- [x] Workout"})
+        assert met is False
+
+        note_path.write_text("- [x] Workout done")
+        met, _ = condition.check({"pattern": "- [x] Workout"})
+        assert met is True
+
     def test_no_daily_note(self, temp_vault):
         """Should return False when daily note doesn't exist."""
         from lib.conditions.obsidian import CheckboxCondition
@@ -181,6 +258,56 @@ class TestYamlCondition:
         met, desc = condition.check({"field": "words", "minimum": 600})
         assert met is False
 
+    def test_invalid_frontmatter_counts_as_unset(self, temp_vault):
+        """Malformed frontmatter should leave every field unset."""
+        from lib.conditions.obsidian import YamlCondition
+
+        today = date.today().strftime("%Y-%m-%d")
+        note_path = temp_vault / "Daily" / f"{today}.md"
+        note_path.write_text("---\nworkout: [true\n---\n\nContent")
+
+        context = ConditionContext(vault_path=temp_vault)
+        condition = YamlCondition(context)
+
+        met, desc = condition.check({"field": "workout"})
+        assert met is False
+
+
+class TestRegexCondition:
+    """Tests for RegexCondition."""
+
+    def test_regex_matched_across_checks(self, temp_vault):
+        """Should match case-insensitively and reuse the pattern across checks."""
+        from lib.conditions.obsidian import RegexCondition
+
+        today = date.today().strftime("%Y-%m-%d")
+        note_path = temp_vault / "Daily" / f"{today}.md"
+        note_path.write_text("Ran 5km today\n")
+
+        context = ConditionContext(vault_path=temp_vault)
+        condition = RegexCondition(context)
+
+        for _ in range(2):
+            met, desc = condition.check({"pattern": r"^ran \d+km"})
+            assert met is True
+            assert "matched" in desc
+
+    def test_invalid_regex_not_matched(self, temp_vault):
+        """Invalid patterns should count as not matched rather than raising."""
+        from lib.conditions.obsidian import RegexCondition
+
+        today = date.today().strftime("%Y-%m-%d")
+        note_path = temp_vault / "Daily" / f"{today}.md"
+        note_path.write_text("Some content\n")
+
+        context = ConditionContext(vault_path=temp_vault)
+        condition = RegexCondition(context)
+
+        met, desc = condition.check({"pattern": "[unclosed"})
+
+        assert met is False
+        assert "not matched" in desc
+
 
 class TestConditionModeLogic:
     """Tests for AND/OR logic in check_all_conditions."""
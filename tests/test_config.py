@@ -0,0 +1,41 @@
+"""Tests for lib/config.py - Configuration loading and saving."""
+
+from pathlib import Path
+
+import yaml
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib.config import Config
+
+
+class TestSave:
+    """Tests for Config.save."""
+
+    def test_keeps_symlink_and_mode(self, tmp_path):
+        """Saving through a symlinked config should update its target in place."""
+        real = tmp_path / "dotfiles" / "config.yaml"
+        real.parent.mkdir()
+        real.write_text("blocked_sites:\n- reddit.com\n")
+        real.chmod(0o600)
+        link = tmp_path / "config.yaml"
+        link.symlink_to(real)
+
+        config = Config(link)
+        config.add_blocked_site("youtube.com")
+
+        assert link.is_symlink()
+        assert real.stat().st_mode & 0o777 == 0o600
+        assert yaml.safe_load(real.read_text())["blocked_sites"] == ["reddit.com", "youtube.com"]
+        assert not list(real.parent.glob(".config.*"))
+
+    def test_creates_missing_config(self, tmp_path):
+        """A config that doesn't exist yet should be created readable."""
+        path = tmp_path / "new" / "config.yaml"
+
+        config = Config(path)
+        config.save()
+
+        assert path.stat().st_mode & 0o777 == 0o644
+        assert yaml.safe_load(path.read_text())["condition_mode"] == "any"
@@ -89,6 +89,32 @@ class TestEvaluateAutoUnlock:
             assert info["earliest_passed"] is False
             assert info["earliest_time"] == "17:00"
 
+    @freeze_time("2026-01-06 18:00:00")
+    def test_non_string_earliest_time_is_a_parse_error(self, temp_state_file, mock_config):
+        """A YAML list or number for earliest_time should be reported, not raise."""
+        from lib.daemon import BlockDaemon
+        from lib.state import State
+
+        with patch("lib.daemon.get_config", return_value=mock_config), \
+             patch("lib.daemon.get_state") as mock_get_state, \
+             patch("lib.daemon.get_hosts_manager") as mock_get_hosts, \
+             patch("lib.daemon.get_obsidian_parser") as mock_get_obsidian, \
+             patch("lib.daemon.get_remote_sync_manager") as mock_get_remote_sync, \
+             patch("lib.daemon.get_experiment_logger"):
+
+            mock_get_state.return_value = State(state_path=temp_state_file)
+            mock_get_hosts.return_value = MagicMock()
+            mock_get_obsidian.return_value = MagicMock()
+            mock_get_remote_sync.return_value = MagicMock(enabled=False)
+
+            daemon = BlockDaemon()
+            for earliest in ([17, 0], 1700):
+                mock_config.auto_unlock_settings = {"enabled": True, "earliest_time": earliest}
+                should_unlock, info = daemon.evaluate_auto_unlock()
+
+                assert should_unlock is False
+                assert info["earliest_parse_error"] == f"Invalid earliest_time format: {earliest}"
+
     @freeze_time("2026-01-06 18:00:00")
     def test_allowed_after_earliest_time(self, temp_state_file, mock_config):
         """Should evaluate conditions after earliest_time."""
@@ -514,6 +540,246 @@ class TestRunCheck:
             mock_hosts.block_sites.assert_called_once_with(mock_config.blocked_sites)
 
 
+    @freeze_time("2026-01-06 18:00:00")
+    def test_skips_diagnostics_when_experiment_disabled(self, temp_state_file, mock_config):
+        """Disabled experiment logging should skip snapshot collection and logging."""
+        from lib.daemon import BlockDaemon
+        from lib.state import State
+
+        mock_config.auto_unlock_settings = {
+            "enabled": False,
+            "check_interval": 300,
+        }
+
+        with patch("lib.daemon.get_config", return_value=mock_config), \
+             patch("lib.daemon.get_state") as mock_get_state, \
+             patch("lib.daemon.get_hosts_manager") as mock_get_hosts, \
+             patch("lib.daemon.get_obsidian_parser") as mock_get_obsidian, \
+             patch("lib.daemon.get_remote_sync_manager") as mock_get_remote_sync, \
+             patch("lib.daemon.get_experiment_logger") as mock_get_experiment:
+
+            mock_get_state.return_value = State(state_path=temp_state_file)
+
+            mock_hosts = MagicMock()
+            mock_hosts.is_blocking_active.return_value = True
+            mock_get_hosts.return_value = mock_hosts
+
+            mock_obsidian = MagicMock()
+            mock_get_obsidian.return_value = mock_obsidian
+            mock_get_remote_sync.return_value = MagicMock(enabled=False)
+
+            mock_experiment = MagicMock(enabled=False)
+            mock_get_experiment.return_value = mock_experiment
+
+            daemon = BlockDaemon()
+            daemon.run_check()
+
+            mock_experiment.log_event.assert_not_called()
+            mock_obsidian.get_today_note_path.assert_not_called()
+            assert mock_hosts.is_blocking_active.call_count == 1
+
+    @freeze_time("2026-01-06 18:00:00")
+    def test_re_block_sync_runs_in_background(self, temp_state_file, mock_config):
+        """Re-blocking should queue the remote sync instead of waiting on it."""
+        from lib.daemon import BlockDaemon
+        from lib.state import State
+
+        mock_config.auto_unlock_settings = {
+            "enabled": False,
+            "check_interval": 300,
+        }
+
+        with mock_condition_registry(return_value=(False, "Not checked")), \
+             patch("lib.daemon.get_config", return_value=mock_config), \
+             patch("lib.daemon.get_state") as mock_get_state, \
+             patch("lib.daemon.get_hosts_manager") as mock_get_hosts, \
+             patch("lib.daemon.get_obsidian_parser"), \
+             patch("lib.daemon.get_remote_sync_manager") as mock_get_remote_sync, \
+             patch("lib.daemon.get_experiment_logger"):
+
+            mock_get_state.return_value = State(state_path=temp_state_file)
+
+            mock_hosts = MagicMock()
+            mock_hosts.is_blocking_active.return_value = False
+            mock_get_hosts.return_value = mock_hosts
+
+            mock_remote_sync = MagicMock(enabled=True)
+            mock_get_remote_sync.return_value = mock_remote_sync
+
+            daemon = BlockDaemon()
+            daemon.run_check()
+
+            mock_remote_sync.sync_async.assert_any_call(
+                mock_config.blocked_sites, "re-block"
+            )
+            mock_remote_sync.sync.assert_not_called()
+
+    @freeze_time("2026-01-06 18:00:00")
+    def test_re_block_reuses_hosts_snapshot(self, temp_state_file, mock_config):
+        """The hosts file should not be re-read after a successful re-block."""
+        from lib.daemon import BlockDaemon
+        from lib.state import State
+
+        mock_config.auto_unlock_settings = {
+            "enabled": False,
+            "check_interval": 300,
+        }
+
+        with mock_condition_registry(return_value=(False, "Not checked")), \
+             patch("lib.daemon.get_config", return_value=mock_config), \
+             patch("lib.daemon.get_state") as mock_get_state, \
+             patch("lib.daemon.get_hosts_manager") as mock_get_hosts, \
+             patch("lib.daemon.get_obsidian_parser") as mock_get_obsidian, \
+             patch("lib.daemon.get_remote_sync_manager") as mock_get_remote_sync, \
+             patch("lib.daemon.get_experiment_logger") as mock_get_experiment:
+
+            mock_get_state.return_value = State(state_path=temp_state_file)
+
+            mock_hosts = MagicMock()
+            mock_hosts.is_blocking_active.return_value = False
+            mock_hosts.block_sites.return_value = True
+            mock_get_hosts.return_value = mock_hosts
+
+            mock_obsidian = MagicMock()
+            mock_obsidian.get_today_note_path.return_value = Path("/tmp/fake.md")
+            mock_get_obsidian.return_value = mock_obsidian
+            mock_get_remote_sync.return_value = MagicMock(enabled=False)
+
+            mock_experiment = MagicMock(enabled=True, split_cycle_events=False)
+            mock_get_experiment.return_value = mock_experiment
+
+            daemon = BlockDaemon()
+            daemon.run_check()
+
+            # Once before and once after the state sync, not after re-blocking
+            assert mock_hosts.is_blocking_active.call_count == 2
+            event, = [c for c in mock_experiment.log_event.call_args_list
+                      if c.args[0] == "daemon_cycle"]
+            assert event.kwargs["action"] == "reblock_hosts"
+            assert event.kwargs["hosts_blocking"] is True
+
+
+    @freeze_time("2026-01-06 18:00:00")
+    def test_phone_completions_sent_with_status(self, temp_state_file, mock_config):
+        """Handled phone requests and the status should go out in one remote call."""
+        from lib.daemon import BlockDaemon
+        from lib.state import State
+
+        mock_config.auto_unlock_settings = {
+            "enabled": False,
+            "check_interval": 300,
+        }
+
+        with mock_condition_registry(return_value=(False, "Not checked")), \
+             patch("lib.daemon.get_config", return_value=mock_config), \
+             patch("lib.daemon.get_state") as mock_get_state, \
+             patch("lib.daemon.get_hosts_manager"), \
+             patch("lib.daemon.get_obsidian_parser"), \
+             patch("lib.daemon.get_remote_sync_manager") as mock_get_remote_sync, \
+             patch("lib.daemon.get_poll_manager") as mock_get_poll, \
+             patch("lib.daemon.get_experiment_logger"):
+
+            mock_get_state.return_value = State(state_path=temp_state_file)
+            mock_get_remote_sync.return_value = MagicMock(enabled=False)
+
+            mock_poll = MagicMock(enabled=True)
+            mock_poll.check_pending_requests.return_value = [{"id": "r1", "type": "other"}]
+            mock_get_poll.return_value = mock_poll
+
+            daemon = BlockDaemon()
+            daemon.run_check()
+
+            mock_poll.poll_cycle.assert_called_once()
+            status, completions = mock_poll.poll_cycle.call_args.args
+            assert status["blocked"] is True
+            assert completions == [
+                ("r1", {"success": False, "message": "Unknown request type"})
+            ]
+            mock_poll.mark_completed.assert_not_called()
+            mock_poll.update_status.assert_not_called()
+
+    def test_phone_completions_kept_when_update_fails(self, temp_state_file, mock_config):
+        """Completions should be resent next cycle if the remote update fails."""
+        from lib.daemon import BlockDaemon
+        from lib.state import State
+
+        with patch("lib.daemon.get_config", return_value=mock_config), \
+             patch("lib.daemon.get_state") as mock_get_state, \
+             patch("lib.daemon.get_hosts_manager"), \
+             patch("lib.daemon.get_obsidian_parser"), \
+             patch("lib.daemon.get_remote_sync_manager") as mock_get_remote_sync, \
+             patch("lib.daemon.get_poll_manager") as mock_get_poll, \
+             patch("lib.daemon.get_experiment_logger"):
+
+            mock_get_state.return_value = State(state_path=temp_state_file)
+            mock_get_remote_sync.return_value = MagicMock(enabled=False)
+            mock_poll = MagicMock(enabled=True)
+            mock_get_poll.return_value = mock_poll
+
+            daemon = BlockDaemon()
+            daemon.unlock_manager = MagicMock()
+            done = ("r1", {"success": True, "message": "ok"})
+            daemon._poll_completions = [done]
+
+            mock_poll.poll_cycle.return_value = None
+            daemon.sync_phone_status()
+            assert daemon._poll_completions == [done]
+
+            mock_poll.poll_cycle.side_effect = OSError("ssh died")
+            daemon.sync_phone_status()
+            assert daemon._poll_completions == [done]
+
+            # A status failure still marks the requests completed
+            daemon.unlock_manager.get_status.side_effect = RuntimeError("no status")
+            mock_poll.poll_cycle.side_effect = None
+            mock_poll.poll_cycle.return_value = []
+            daemon.sync_phone_status()
+            mock_poll.poll_cycle.assert_called_with(None, [done])
+            assert daemon._poll_completions == []
+
+
+    def test_phone_requests_fetched_while_state_loads(self, temp_state_file, mock_config):
+        """Fetching phone requests should overlap the state reload."""
+        import threading
+        from lib.daemon import BlockDaemon
+        from lib.state import State
+
+        with mock_condition_registry(return_value=(False, "Not checked")), \
+             patch("lib.daemon.get_config", return_value=mock_config), \
+             patch("lib.daemon.get_state") as mock_get_state, \
+             patch("lib.daemon.get_hosts_manager"), \
+             patch("lib.daemon.get_obsidian_parser"), \
+             patch("lib.daemon.get_remote_sync_manager") as mock_get_remote_sync, \
+             patch("lib.daemon.get_poll_manager") as mock_get_poll, \
+             patch("lib.daemon.get_experiment_logger"):
+
+            state = State(state_path=temp_state_file)
+            mock_get_state.return_value = state
+            mock_get_remote_sync.return_value = MagicMock(enabled=False)
+
+            fetch_started = threading.Event()
+            overlapped = []
+
+            def check_pending_requests():
+                fetch_started.set()
+                return []
+
+            def load():
+                # Only finishes waiting if the fetch runs alongside the load
+                overlapped.append(fetch_started.wait(timeout=2))
+
+            mock_poll = MagicMock(enabled=True)
+            mock_poll.check_pending_requests.side_effect = check_pending_requests
+            mock_get_poll.return_value = mock_poll
+
+            daemon = BlockDaemon()
+            with patch.object(state, "load", side_effect=load):
+                daemon.run_check()
+
+            assert overlapped == [True]
+            mock_poll.check_pending_requests.assert_called_once()
+
+
 class TestDaemonStateReload:
     """Tests for state reloading in daemon."""
 
@@ -555,3 +821,33 @@ class TestDaemonStateReload:
 
             # Verify state was reloaded
             assert daemon.state.emergency_count == 5
+
+
+class TestDaemonLoop:
+    """Tests for the daemon run loop."""
+
+    def test_stop_interrupts_wait_between_checks(self, temp_state_file, mock_config):
+        """stop() should end the loop without waiting out the check interval."""
+        from lib.daemon import BlockDaemon
+        from lib.state import State
+
+        mock_config.auto_unlock_settings = {"enabled": False, "check_interval": 300}
+
+        with patch("lib.daemon.get_config", return_value=mock_config), \
+             patch("lib.daemon.get_state") as mock_get_state, \
+             patch("lib.daemon.get_hosts_manager"), \
+             patch("lib.daemon.get_obsidian_parser"), \
+             patch("lib.daemon.get_remote_sync_manager"), \
+             patch("lib.daemon.get_experiment_logger"), \
+             patch("lib.daemon.signal.signal"):
+
+            mock_get_state.return_value = State(state_path=temp_state_file)
+            daemon = BlockDaemon()
+
+            with patch.object(daemon, "run_check", side_effect=daemon.stop) as mock_check:
+                started = time.monotonic()
+                daemon.run()
+
+            assert time.monotonic() - started < 5
+            mock_check.assert_called_once()
+            assert daemon.running is False
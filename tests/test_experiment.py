@@ -0,0 +1,50 @@
+"""Tests for lib/experiment.py - Experiment logging."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib import experiment
+from lib.experiment import ExperimentLogger
+
+
+@pytest.fixture
+def log_dir(tmp_path):
+    """Point the experiment log at a temporary directory."""
+    with patch("lib.experiment.LOG_DIR", tmp_path), \
+         patch("lib.experiment.LOG_PATH", tmp_path / "experiment.log"), \
+         patch("lib.experiment.META_PATH", tmp_path / "experiment.meta.json"):
+        yield tmp_path
+    experiment._stop_listener()
+
+
+def read_events(path: Path) -> list[str]:
+    """Get the event names written to a log file."""
+    return [json.loads(line)["event"] for line in path.read_text().splitlines()]
+
+
+class TestListener:
+    """Tests for the background writer thread."""
+
+    def test_events_reach_log_after_stop(self, log_dir):
+        """Events queued for the listener should be on disk once it stops."""
+        logger = ExperimentLogger(enabled=True, started_at="2026-01-06")
+        logger.log_event("daemon_cycle", blocked=True)
+        experiment._stop_listener()
+
+        assert read_events(log_dir / "experiment.log") == ["daemon_cycle"]
+
+    def test_new_logger_writes_after_close(self, log_dir):
+        """Closing should detach the queue so a new logger starts its own listener."""
+        ExperimentLogger(enabled=True, started_at="2026-01-06").close()
+
+        logger = ExperimentLogger(enabled=True, started_at="2026-01-06")
+        logger.log_event("after_close")
+        logger.close()
+
+        assert read_events(log_dir / "experiment.log") == ["after_close"]
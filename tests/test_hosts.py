@@ -0,0 +1,355 @@
+"""Tests for lib/hosts.py - Hosts file parsing."""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib.hosts import (
+    HostsManager, RemoteSyncManager, canonicalize_sites, ssh_options,
+    BEGIN_MARKER, END_MARKER, SSH_OPTIONS
+)
+
+
+BLOCKED_HOSTS = (
+    "127.0.0.1 localhost\n"
+    "::1 localhost\n"
+    "\n"
+    f"{BEGIN_MARKER}\n"
+    "127.0.0.1 reddit.com\n"
+    "::1 reddit.com\n"
+    "127.0.0.1 www.reddit.com\n"
+    "::1 www.reddit.com\n"
+    f"{END_MARKER}\n"
+)
+
+
+class TestBlockSection:
+    """Tests for locating and removing the block section."""
+
+    def test_removes_block_section(self, temp_hosts_file):
+        """Content outside the markers should be kept, minus trailing blank lines."""
+        hosts = HostsManager(hosts_path=temp_hosts_file)
+
+        result = hosts._remove_block_section(BLOCKED_HOSTS + "10.0.0.1 nas\n\n")
+
+        assert result == "127.0.0.1 localhost\n::1 localhost\n\n10.0.0.1 nas"
+
+    def test_unterminated_section_runs_to_end(self, temp_hosts_file):
+        """A BEGIN marker without an END marker should drop the rest of the file."""
+        hosts = HostsManager(hosts_path=temp_hosts_file)
+
+        content = f"127.0.0.1 localhost\n{BEGIN_MARKER}\n127.0.0.1 reddit.com\n"
+
+        assert hosts._remove_block_section(content) == "127.0.0.1 localhost"
+
+    def test_ignores_marker_text_inside_other_lines(self, temp_hosts_file):
+        """Only lines consisting of a marker should start a section."""
+        hosts = HostsManager(hosts_path=temp_hosts_file)
+
+        content = f"# note: {BEGIN_MARKER} goes below\n127.0.0.1 localhost"
+
+        assert hosts._remove_block_section(content) == content
+
+    def test_gets_blocked_sites_from_section(self, temp_hosts_file):
+        """Only non-www IPv4 entries between the markers should be reported."""
+        temp_hosts_file.write_text(BLOCKED_HOSTS)
+        hosts = HostsManager(hosts_path=temp_hosts_file)
+
+        assert hosts.get_blocked_sites() == ["reddit.com"]
+        assert hosts.is_blocking_active() is True
+
+
+class TestIsBlockingActive:
+    """Tests for is_blocking_active."""
+
+    def test_false_without_block_section(self, temp_hosts_file):
+        """A hosts file without the markers should not be blocking."""
+        hosts = HostsManager(hosts_path=temp_hosts_file)
+
+        assert hosts.is_blocking_active() is False
+
+    def test_false_for_empty_or_missing_file(self, temp_hosts_file, tmp_path):
+        """Empty and missing hosts files should not be blocking."""
+        temp_hosts_file.write_text("")
+
+        assert HostsManager(hosts_path=temp_hosts_file).is_blocking_active() is False
+        assert HostsManager(hosts_path=tmp_path / "missing").is_blocking_active() is False
+
+
+class TestBlockSites:
+    """Tests for block_sites."""
+
+    def test_skips_read_when_file_unchanged(self, temp_hosts_file):
+        """An unchanged hosts file should not be re-read for the same sites."""
+        temp_hosts_file.write_text(BLOCKED_HOSTS)
+        hosts = HostsManager(hosts_path=temp_hosts_file)
+
+        with patch.object(hosts, "_write_hosts") as mock_write, \
+             patch.object(hosts, "_read_hosts", wraps=hosts._read_hosts) as mock_read:
+            assert hosts.block_sites(["reddit.com"]) is True
+            assert hosts.block_sites(["reddit.com"]) is True
+            assert mock_read.call_count == 1
+
+            # A different site list has to be checked against the file again
+            hosts.block_sites(["reddit.com", "youtube.com"])
+            assert mock_read.call_count == 2
+            mock_write.assert_called_once()
+
+
+class TestUnblockSites:
+    """Tests for unblock_sites."""
+
+    def test_writes_only_when_a_block_is_removed(self, temp_hosts_file):
+        """Repeated unblocks of an unblocked file shouldn't rewrite it or flush DNS."""
+        temp_hosts_file.write_text(BLOCKED_HOSTS)
+        hosts = HostsManager(hosts_path=temp_hosts_file)
+
+        with patch.object(hosts, "_write_hosts", wraps=hosts._write_hosts) as mock_write, \
+             patch.object(hosts, "_read_hosts", wraps=hosts._read_hosts) as mock_read, \
+             patch.object(hosts, "_flush_dns_cache"), \
+             patch("lib.hosts.os.access", return_value=True):
+            assert hosts.unblock_sites() is True
+            assert hosts.unblock_sites() is True
+            assert hosts.unblock_sites() is True
+
+        mock_write.assert_called_once()
+        assert mock_read.call_count == 1
+        assert temp_hosts_file.read_text() == "127.0.0.1 localhost\n::1 localhost\n"
+
+    def test_block_after_unblock_writes_again(self, temp_hosts_file):
+        """Switching back to blocking should not be mistaken for being in sync."""
+        hosts = HostsManager(hosts_path=temp_hosts_file)
+
+        with patch.object(hosts, "_write_hosts", return_value=True) as mock_write:
+            assert hosts.unblock_sites() is True
+            mock_write.assert_not_called()
+            assert hosts.block_sites(["reddit.com"]) is True
+            mock_write.assert_called_once()
+
+
+class TestCanonicalizeSites:
+    """Tests for canonicalize_sites and the entries built from it."""
+
+    def test_drops_duplicates_and_www_prefix(self):
+        """Duplicates and www. variants should collapse to one bare domain."""
+        sites = ["reddit.com", "www.reddit.com", "youtube.com", "reddit.com"]
+
+        assert canonicalize_sites(sites) == frozenset({"reddit.com", "youtube.com"})
+
+    def test_block_entries_are_sorted_and_unique(self, temp_hosts_file):
+        """Each domain should appear once, in sorted order, with its www. variant."""
+        hosts = HostsManager(hosts_path=temp_hosts_file)
+
+        entries = hosts._get_block_entries(canonicalize_sites(["youtube.com", "www.reddit.com"]))
+
+        assert entries.split("\n") == [
+            BEGIN_MARKER,
+            "127.0.0.1 reddit.com",
+            "::1 reddit.com",
+            "127.0.0.1 www.reddit.com",
+            "::1 www.reddit.com",
+            "127.0.0.1 youtube.com",
+            "::1 youtube.com",
+            "127.0.0.1 www.youtube.com",
+            "::1 www.youtube.com",
+            END_MARKER,
+        ]
+
+
+class TestFlushDnsCache:
+    """Tests for _flush_dns_cache."""
+
+    def test_linux_remembers_working_flush_command(self, temp_hosts_file):
+        """After a fallback succeeds, later flushes should go straight to it."""
+        hosts = HostsManager(hosts_path=temp_hosts_file)
+
+        with patch("lib.hosts._SYSTEM", "Linux"), \
+             patch("lib.hosts._linux_flush_cmd", None), \
+             patch("lib.hosts.subprocess.run") as mock_run:
+            mock_run.side_effect = [MagicMock(returncode=1), MagicMock(returncode=0)]
+            hosts._flush_dns_cache()
+
+            mock_run.reset_mock(side_effect=True)
+            mock_run.return_value = MagicMock(returncode=0)
+            hosts._flush_dns_cache()
+
+            mock_run.assert_called_once_with(
+                ["sudo", "systemd-resolve", "--flush-caches"], capture_output=True
+            )
+
+
+class TestRemoteSync:
+    """Tests for RemoteSyncManager.sync."""
+
+    def test_streams_blocklist_over_one_ssh_call(self):
+        """The blocklist should go over ssh's stdin, without a separate scp."""
+        remote = RemoteSyncManager({"enabled": True, "host": "vm", "user": "me"})
+
+        with patch("lib.hosts.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0)
+            success, message = remote.sync(["reddit.com"])
+
+        assert success is True
+        mock_run.assert_called_once()
+        cmd = mock_run.call_args.args[0]
+        assert cmd[0] == "ssh"
+        assert "BatchMode=yes" in cmd
+        assert cmd[-2] == "me@vm"
+        assert cmd[-1].startswith("cat > /tmp/blocklist.conf.tmp && if cmp -s")
+        assert "sudo systemctl restart dnsmasq" in cmd[-1]
+        assert mock_run.call_args.kwargs["input"] == (
+            "address=/reddit.com/\naddress=/www.reddit.com/\n"
+        )
+
+    def test_retries_transient_errors_with_jittered_backoff(self):
+        """Transient failures should be retried after a decorrelated, capped delay."""
+        remote = RemoteSyncManager({"enabled": True, "host": "vm", "user": "me"})
+        reset = MagicMock(returncode=255, stderr="Connection reset by peer")
+
+        with patch("lib.hosts.subprocess.run") as mock_run, \
+             patch("lib.hosts.time.sleep") as mock_sleep:
+            mock_run.side_effect = [reset, reset, MagicMock(returncode=0)]
+            success, _ = remote.sync(["reddit.com"])
+
+        assert success is True
+        assert mock_run.call_count == 3
+        first, second = (c.args[0] for c in mock_sleep.call_args_list)
+        assert 2 <= first <= 6
+        assert 2 <= second <= min(10, first * 3)
+
+    def test_throttled_connections_wait_longer(self):
+        """sshd dropping connections before the handshake should back off from 5s."""
+        remote = RemoteSyncManager({"enabled": True, "host": "vm", "user": "me"})
+        dropped = MagicMock(
+            returncode=255,
+            stderr="kex_exchange_identification: Connection closed by remote host",
+        )
+
+        with patch("lib.hosts.subprocess.run") as mock_run, \
+             patch("lib.hosts.time.sleep") as mock_sleep:
+            mock_run.side_effect = [dropped, MagicMock(returncode=0)]
+            success, _ = remote.sync(["reddit.com"])
+
+        assert success is True
+        assert 5 <= mock_sleep.call_args.args[0] <= 10
+
+
+    def test_only_restarts_dnsmasq_when_remote_content_differs(self, tmp_path):
+        """The remote file decides whether to push, so changes from other clients are undone."""
+        import subprocess
+
+        blocklist = tmp_path / "blocklist.conf"
+        remote = RemoteSyncManager(
+            {"enabled": True, "host": "vm", "user": "me", "blocklist_path": str(blocklist)}
+        )
+        restarts = []
+        real_run = subprocess.run
+
+        def run_on_remote(cmd, input=None, **kwargs):
+            # Run the remote script here, without sudo, chown or a real restart
+            script = (
+                cmd[-1]
+                .replace("sudo systemctl restart dnsmasq", "echo restarted")
+                .replace(f"sudo chown root:root {blocklist}", "true")
+                .replace("sudo ", "")
+            )
+            result = real_run(["sh", "-c", script], input=input, capture_output=True, text=True)
+            if "restarted" in result.stdout:
+                restarts.append(input)
+            return result
+
+        with patch("lib.hosts.subprocess.run", side_effect=run_on_remote):
+            assert remote.sync(["reddit.com"])[0] is True
+            assert remote.sync(["www.reddit.com"])[0] is True
+            assert len(restarts) == 1
+
+            # Another client unblocks the remote; the same sync must push again
+            blocklist.write_text("")
+            assert remote.sync(["reddit.com"])[0] is True
+            assert len(restarts) == 2
+
+        assert blocklist.read_text() == "address=/reddit.com/\naddress=/www.reddit.com/\n"
+
+    def test_wait_pending_returns_queued_result(self):
+        """wait_pending should block until the queued sync has finished."""
+        remote = RemoteSyncManager({"enabled": True, "host": "vm", "user": "me"})
+        assert remote.wait_pending() is None
+
+        with patch("lib.hosts.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0)
+            remote.sync_async(["reddit.com"])
+            success, _ = remote.wait_pending(timeout=5)
+
+        assert success is True
+        mock_run.assert_called_once()
+
+
+class TestWriteHosts:
+    """Tests for _write_hosts."""
+
+    def test_copies_staged_content_into_hosts_file(self, temp_hosts_file):
+        """The staged content should be readable by the copying process."""
+        import subprocess
+
+        hosts = HostsManager(hosts_path=temp_hosts_file)
+        real_run = subprocess.run
+
+        def run_without_sudo(cmd, **kwargs):
+            # Drop "sudo" so the copy runs as the test user
+            return real_run(cmd[1:], **kwargs) if cmd[0] == "sudo" else MagicMock(returncode=0)
+
+        # Force the sudo path, as for a root-owned /etc/hosts
+        with patch("lib.hosts.os.access", return_value=False), \
+             patch("lib.hosts.subprocess.run", side_effect=run_without_sudo), \
+             patch.object(hosts, "_flush_dns_cache"):
+            assert hosts._write_hosts("127.0.0.1 localhost\n# staged\n") is True
+
+        assert temp_hosts_file.read_text() == "127.0.0.1 localhost\n# staged\n"
+
+    def test_replaces_writable_file_without_sudo(self, temp_hosts_file):
+        """A hosts file we can write should be replaced in-process, keeping its mode."""
+        temp_hosts_file.chmod(0o644)
+        hosts = HostsManager(hosts_path=temp_hosts_file)
+
+        with patch("lib.hosts.subprocess.run") as mock_run, \
+             patch.object(hosts, "_flush_dns_cache") as mock_flush:
+            assert hosts._write_hosts("127.0.0.1 localhost\n# direct\n") is True
+
+        mock_run.assert_not_called()
+        mock_flush.assert_called_once()
+        assert temp_hosts_file.read_text() == "127.0.0.1 localhost\n# direct\n"
+        assert temp_hosts_file.stat().st_mode & 0o777 == 0o644
+        assert not list(temp_hosts_file.parent.glob(".hosts.*"))
+
+
+class TestSshOptions:
+    """Tests for ssh_options."""
+
+    def test_shares_connections_through_private_dir(self, tmp_path):
+        """Control sockets should go in a directory only this user can access."""
+        control_dir = tmp_path / "ssh"
+        ssh_options.cache_clear()
+        try:
+            with patch("lib.hosts.SSH_CONTROL_DIR", control_dir):
+                options = ssh_options()
+        finally:
+            ssh_options.cache_clear()
+
+        assert options[:len(SSH_OPTIONS)] == SSH_OPTIONS
+        assert "ControlMaster=auto" in options
+        assert f"ControlPath={control_dir}/%C" in options
+        assert control_dir.stat().st_mode & 0o777 == 0o700
+
+    def test_no_sharing_when_dir_is_not_private(self, tmp_path):
+        """A control directory others can access should not be used."""
+        control_dir = tmp_path / "ssh"
+        control_dir.mkdir()
+        control_dir.chmod(0o777)
+        ssh_options.cache_clear()
+        try:
+            with patch("lib.hosts.SSH_CONTROL_DIR", control_dir):
+                assert ssh_options() == SSH_OPTIONS
+        finally:
+            ssh_options.cache_clear()
@@ -104,6 +104,17 @@ class TestObsidianConditionChecking:
         })
         assert met is False
 
+    def test_checkbox_pattern_with_extra_spaces(self, temp_vault):
+        """Extra whitespace after the box in a pattern should still match."""
+        from lib.obsidian import ObsidianParser
+
+        parser = ObsidianParser(temp_vault, "Daily/{date}.md")
+        content = "- [x] Workout\n* [X]   Reading\n"
+
+        assert parser.check_checkbox(content, "- [x]  Workout") is True
+        assert parser.check_checkbox(content, "- [x] Reading") is True
+        assert parser.check_checkbox(content, "  Reading") is True
+
     def test_daily_note_not_found(self, temp_vault):
         """Should handle missing daily note gracefully."""
         from lib.obsidian import ObsidianParser
@@ -119,6 +130,57 @@ class TestObsidianConditionChecking:
         assert met is False
         assert "not found" in desc.lower()
 
+    def test_uses_pre_read_content(self, temp_vault):
+        """Content passed in by the caller should be checked without reading the note."""
+        from lib.obsidian import ObsidianParser
+
+        parser = ObsidianParser(temp_vault, "Daily/{date}.md")
+
+        # No note exists for today, so a read would report it missing
+        met, desc = parser.check_condition(
+            {"type": "checkbox", "pattern": "- [x] Workout"},
+            content="- [x] Workout\n",
+        )
+
+        assert met is True
+
+    def test_heading_must_be_on_one_line(self, temp_vault):
+        """A bare # line followed by the heading text is not a heading."""
+        from lib.obsidian import ObsidianParser
+
+        parser = ObsidianParser(temp_vault, "Daily/{date}.md")
+        content = "#\nJournal\nwrote stuff\n## Journal\n\n- [[Essay]]\n## Next\n"
+
+        assert parser.get_section_content(content, "Journal") == "\n- [[Essay]]"
+        assert parser.check_heading_exists(content, "Journal") is True
+
+    def test_extracts_wiki_link_targets(self, temp_vault):
+        """Link targets should be extracted without aliases; malformed links skipped."""
+        from lib.obsidian import ObsidianParser
+
+        parser = ObsidianParser(temp_vault, "Daily/{date}.md")
+        content = "See [[Essay]] and [[Notes/Draft|my draft]].\n[[]] [[a]b]] [[Bad|]] [[Last]]"
+
+        assert parser.extract_wiki_links(content) == ["Essay", "Notes/Draft", "Last"]
+
+    def test_resolves_links_through_vault_index(self, temp_vault):
+        """Links should resolve anywhere in the vault, including files added later."""
+        from lib.obsidian import ObsidianParser
+
+        (temp_vault / "Essays").mkdir()
+        essay = temp_vault / "Essays" / "Essay.md"
+        essay.write_text("words")
+
+        parser = ObsidianParser(temp_vault, "Daily/{date}.md")
+
+        assert parser.resolve_link_path("Essay") == essay
+        assert parser.resolve_link_path("Missing") is None
+
+        # A note created after the index was built is still found
+        later = temp_vault / "Essays" / "Later.md"
+        later.write_text("more words")
+        assert parser.resolve_link_path("Later") == later
+
 
 class TestAutoUnlockIntegration:
     """Integration tests for auto-unlock behavior."""
@@ -0,0 +1,125 @@
+"""Tests for lib/logfiles.py - Rotating log file handler."""
+
+import gzip
+import logging
+from pathlib import Path
+from unittest.mock import patch
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib.logfiles import FastRotatingFileHandler
+
+
+def make_record(msg: str) -> logging.LogRecord:
+    """Build a log record with the given message."""
+    return logging.LogRecord("test", logging.INFO, __file__, 1, msg, None, None)
+
+
+def make_handler(path: Path, **kwargs) -> FastRotatingFileHandler:
+    """Build a handler that writes bare messages."""
+    handler = FastRotatingFileHandler(path, **kwargs)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    return handler
+
+
+class TestRollover:
+    """Tests for shouldRollover and doRollover."""
+
+    def test_rolls_over_once_estimate_reaches_max_bytes(self, tmp_path):
+        """The file should be measured once, then rotated when the estimate is full."""
+        log_path = tmp_path / "test.log"
+        handler = make_handler(log_path, maxBytes=40, backupCount=2)
+
+        try:
+            with patch.object(handler, "_measure", wraps=handler._measure) as mock_measure:
+                for i in range(3):
+                    handler.handle(make_record(f"line {i} xxxx"))  # 12 bytes with the newline
+                assert mock_measure.call_count == 1
+                assert not (tmp_path / "test.log.1").exists()
+
+                handler.handle(make_record("line 3 xxxx"))
+        finally:
+            handler.close()
+
+        assert (tmp_path / "test.log.1").read_text().splitlines() == [
+            "line 0 xxxx", "line 1 xxxx", "line 2 xxxx",
+        ]
+        assert log_path.read_text() == "line 3 xxxx\n"
+
+    def test_remeasures_after_rollover(self, tmp_path):
+        """After rotating, the size estimate should restart from the new file."""
+        handler = make_handler(tmp_path / "test.log", maxBytes=40, backupCount=2)
+
+        try:
+            for i in range(2):
+                handler.handle(make_record(f"line {i} xxxx"))
+            assert handler._approx_size == 24
+
+            handler.doRollover()
+            assert handler._approx_size is None
+
+            with patch.object(handler, "_measure", wraps=handler._measure) as mock_measure:
+                handler.handle(make_record("after"))
+                handler.handle(make_record("again"))
+            mock_measure.assert_called_once()
+            assert handler._approx_size == 12
+        finally:
+            handler.close()
+
+    def test_compressed_backups(self, tmp_path):
+        """With compress=True, log.1 stays plain and older backups are gzipped."""
+        handler = make_handler(tmp_path / "test.log", maxBytes=20, backupCount=3, compress=True)
+
+        try:
+            for i in range(4):
+                handler.handle(make_record(f"record {i} padding"))  # 17 bytes with the newline
+        finally:
+            handler.close()
+
+        assert (tmp_path / "test.log.1").read_text() == "record 2 padding\n"
+        with gzip.open(tmp_path / "test.log.2.gz", "rt") as f:
+            assert f.read() == "record 1 padding\n"
+        with gzip.open(tmp_path / "test.log.3.gz", "rt") as f:
+            assert f.read() == "record 0 padding\n"
+        assert (tmp_path / "test.log").read_text() == "record 3 padding\n"
+
+    def test_other_writer_keeps_records_after_compressed_rollover(self, tmp_path):
+        """A process still writing the rotated file should have its records land in log.1."""
+        log_path = tmp_path / "test.log"
+        rotating = make_handler(log_path, maxBytes=40, backupCount=2, compress=True)
+        other = make_handler(log_path, maxBytes=1000, backupCount=2, compress=True)
+
+        try:
+            other.handle(make_record("other before"))
+            rotating.handle(make_record("record 0 padding"))
+            rotating.handle(make_record("record 1 padding"))
+            other.handle(make_record("other after"))
+        finally:
+            rotating.close()
+            other.close()
+
+        assert (tmp_path / "test.log.1").read_text().splitlines() == [
+            "other before", "record 0 padding", "other after",
+        ]
+
+
+class TestFormat:
+    """Tests for reusing the message formatted for the size check."""
+
+    def test_formats_each_record_once(self, tmp_path):
+        """emit() should reuse the message shouldRollover() already formatted."""
+        handler = make_handler(tmp_path / "test.log", maxBytes=1000, backupCount=1)
+
+        try:
+            with patch.object(
+                handler.formatter, "format", wraps=handler.formatter.format
+            ) as mock_format:
+                handler.handle(make_record("first"))
+                handler.handle(make_record("second"))
+            assert mock_format.call_count == 2
+            assert handler._last_record is None
+        finally:
+            handler.close()
+
+        assert (tmp_path / "test.log").read_text() == "first\nsecond\n"
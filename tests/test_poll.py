@@ -0,0 +1,106 @@
+"""Tests for lib/poll.py - Phone request polling."""
+
+import json
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib.poll import PollManager
+
+
+def run_locally(command, description, input=None):
+    """Stand-in for PollManager._run_ssh that runs the command here."""
+    result = subprocess.run(["sh", "-c", command], input=input, capture_output=True)
+    if result.returncode != 0:
+        return False, b"", result.stderr.decode().strip()
+    return True, result.stdout.strip(), ""
+
+
+class TestCheckPendingRequests:
+    """Tests for check_pending_requests."""
+
+    def test_unchanged_file_is_not_resent(self, tmp_path):
+        """An unchanged requests.json should be answered from the cache."""
+        requests_file = tmp_path / "requests.json"
+        requests_file.write_text(json.dumps([
+            {"id": "a", "type": "unlock", "status": "pending"},
+            {"id": "b", "type": "unlock", "status": "completed"},
+        ]))
+        poll = PollManager({"enabled": True, "host": "vm", "user": "me", "data_dir": str(tmp_path)})
+        outputs = []
+
+        def run_and_record(command, description, input=None):
+            result = run_locally(command, description, input)
+            outputs.append(result[1])
+            return result
+
+        with patch.object(poll, "_run_ssh", side_effect=run_and_record):
+            assert [r["id"] for r in poll.check_pending_requests()] == ["a"]
+            assert [r["id"] for r in poll.check_pending_requests()] == ["a"]
+            assert outputs[1].endswith(b"\nunchanged")
+
+            requests_file.write_text(json.dumps([
+                {"id": "c", "type": "emergency", "status": "pending"},
+            ]))
+            assert [r["id"] for r in poll.check_pending_requests()] == ["c"]
+
+    def test_missing_file_has_no_requests(self, tmp_path):
+        """A missing requests.json should mean nothing is pending."""
+        poll = PollManager({"enabled": True, "host": "vm", "user": "me", "data_dir": str(tmp_path)})
+
+        with patch.object(poll, "_run_ssh", side_effect=run_locally):
+            assert poll.check_pending_requests() == []
+            assert poll.check_pending_requests() == []
+
+
+class TestPollCycle:
+    """Tests for poll_cycle."""
+
+    def test_marks_completed_and_writes_status_in_one_call(self, tmp_path):
+        """Completions and status should be applied by a single remote command."""
+        requests_file = tmp_path / "requests.json"
+        requests_file.write_text(json.dumps([
+            {"id": "a", "type": "unlock", "status": "pending"},
+            {"id": "b", "type": "emergency", "status": "pending"},
+        ]))
+        poll = PollManager({"enabled": True, "host": "vm", "user": "me", "data_dir": str(tmp_path)})
+
+        with patch.object(poll, "_run_ssh", side_effect=run_locally) as mock_ssh:
+            pending = poll.poll_cycle(
+                {"blocked": False}, [("a", {"success": True, "message": "ok"})]
+            )
+
+        mock_ssh.assert_called_once()
+        assert [r["id"] for r in pending] == ["b"]
+        requests = json.loads(requests_file.read_text())
+        assert requests[1]["id"] == "a"
+        assert requests[1]["status"] == "completed"
+        assert requests[1]["result"] == {"success": True, "message": "ok"}
+        assert json.loads((tmp_path / "status.json").read_text()) == {"blocked": False}
+
+    def test_status_only_leaves_requests_untouched(self, tmp_path):
+        """Without completions, requests.json should not be rewritten."""
+        poll = PollManager({"enabled": True, "host": "vm", "user": "me", "data_dir": str(tmp_path)})
+
+        with patch.object(poll, "_run_ssh", side_effect=run_locally):
+            assert poll.update_status({"blocked": True}) is True
+
+        assert not (tmp_path / "requests.json").exists()
+        assert json.loads((tmp_path / "status.json").read_text()) == {"blocked": True}
+
+    def test_request_ids_never_reach_the_shell(self, tmp_path):
+        """Request IDs with quotes or shell syntax should be handled as data."""
+        hostile = f"x'; touch {tmp_path}/pwned; echo '"
+        requests_file = tmp_path / "requests.json"
+        requests_file.write_text(json.dumps([{"id": hostile, "status": "pending"}]))
+        poll = PollManager({"enabled": True, "host": "vm", "user": "me", "data_dir": str(tmp_path)})
+
+        with patch.object(poll, "_run_ssh", side_effect=run_locally) as mock_ssh:
+            assert poll.mark_completed(hostile, {"success": True}) is True
+
+        assert hostile not in mock_ssh.call_args.args[0]
+        assert json.loads(requests_file.read_text())[0]["status"] == "completed"
+        assert not (tmp_path / "pwned").exists()
@@ -1,6 +1,7 @@
 """Tests for lib/state.py - State management and unlock tracking."""
 
 import json
+import subprocess
 import time
 from datetime import date, timedelta
 from pathlib import Path
@@ -163,6 +164,47 @@ class TestSetUnlocked:
         assert saved_data["unlocked_until"] > time.time()
 
 
+    def test_same_file_without_orjson(self, temp_state_file):
+        """The stdlib json fallback should write the same file as orjson."""
+        from lib.state import _dump_state
+
+        state = State(state_path=temp_state_file)
+        with patch("lib.state.orjson", None):
+            state.set_unlocked(3600)
+            assert State(state_path=temp_state_file).is_blocked is False
+        written = temp_state_file.read_bytes()
+
+        assert written == _dump_state(state._state)
+
+    def test_unchanged_state_is_not_rewritten(self, temp_state_file):
+        """Saving state identical to what is on disk should skip the write."""
+        state = State(state_path=temp_state_file)
+        state.force_block()
+
+        with patch("lib.state.os.replace") as mock_replace:
+            state.force_block()
+            State(state_path=temp_state_file).save()
+            mock_replace.assert_not_called()
+
+            state.set_unlocked(3600)
+            mock_replace.assert_called_once()
+
+
+    def test_failed_save_keeps_previous_file(self, temp_state_file):
+        """A write that fails midway should leave the old state and no temp file."""
+        state = State(state_path=temp_state_file)
+        state.set_unlocked(3600)
+        written = temp_state_file.read_text()
+
+        state._state["blocked"] = True
+        with patch("lib.state._dump_state", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                state.save()
+
+        assert temp_state_file.read_text() == written
+        assert not list(temp_state_file.parent.glob(".state.*.tmp"))
+
+
 class TestExtendUnlock:
     """Tests for extend_unlock method."""
 
@@ -343,6 +385,19 @@ class TestDayReset:
         assert state.emergency_count == 2
 
 
+    def test_same_instance_resets_after_midnight(self, temp_state_file):
+        """A long-lived State should reset once local midnight passes."""
+        with freeze_time("2026-01-06 23:59:59") as frozen:
+            state = State(state_path=temp_state_file)
+            state.record_emergency_unlock(30)
+            assert state.emergency_count == 1
+
+            frozen.tick(timedelta(seconds=1))
+
+            assert state.emergency_count == 0
+            assert state._state["date"] == "2026-01-07"
+
+
 class TestGetDebugSnapshot:
     """Tests for get_debug_snapshot method."""
 
@@ -475,7 +530,7 @@ class TestRemoteStateLoadFailure:
 
         # Mock the actual SSH calls to avoid real network access
         with patch.object(store, '_run_with_retry') as mock_retry:
-            mock_retry.return_value = (True, "", "")
+            mock_retry.return_value = (True, b"", "")
             result = store.save_state({"date": "2026-01-08", "emergency_count": 1})
             # save_state was allowed to proceed (would have called SSH)
             assert mock_retry.called
@@ -543,3 +598,126 @@ class TestRemoteStateLoadFailure:
         # Verify emergency_count was preserved
         assert state.emergency_count == 2
         assert state._state.get("last_emergency_wait") == 60
+
+
+class TestRemoteToday:
+    """Tests for looking up the remote date."""
+
+    def test_remote_date_reused_until_midnight(self):
+        """The remote date should be fetched once per day, not per property access."""
+        from lib.state import RemoteStateStore
+
+        store = RemoteStateStore({
+            "enabled": True,
+            "host": "example.com",
+            "user": "test",
+            "state_path": "/etc/block/state.json",
+        })
+        midnight = 1767945600.0
+
+        with patch.object(store, "_run_with_retry") as mock_retry, \
+             patch("lib.state.time.time") as mock_time:
+            mock_retry.return_value = (True, f"2026-01-08\n{midnight:.0f}\n".encode(), "")
+            mock_time.return_value = midnight - 3600
+            assert store.get_today_iso() == "2026-01-08"
+            mock_time.return_value = midnight - 1
+            assert store.get_today_iso() == "2026-01-08"
+            assert mock_retry.call_count == 1
+
+            mock_time.return_value = midnight
+            mock_retry.return_value = (True, f"2026-01-09\n{midnight + 86400:.0f}\n".encode(), "")
+            assert store.get_today_iso() == "2026-01-09"
+            assert mock_retry.call_count == 2
+
+    def test_remote_date_without_midnight_uses_ttl(self):
+        """If the remote can't report its next midnight, the date expires after the TTL."""
+        from lib.state import RemoteStateStore
+
+        store = RemoteStateStore({
+            "enabled": True,
+            "host": "example.com",
+            "user": "test",
+            "state_path": "/etc/block/state.json",
+        })
+
+        real_run = subprocess.run
+        today = date.today().isoformat()
+
+        def run_without_gnu_date(cmd, **kwargs):
+            # Run the remote command here, with a date that rejects -d like BSD date
+            script = 'date() { [ "$1" = "-d" ] && return 1; command date "$@"; }; ' + cmd[-1]
+            return real_run(["sh", "-c", script], **kwargs)
+
+        with patch("lib.state.subprocess.run", side_effect=run_without_gnu_date) as mock_run, \
+             patch("lib.state.time.time") as mock_time:
+            mock_time.return_value = 1000.0
+            assert store.get_today_iso() == today
+            assert store.get_today_iso() == today
+            assert mock_run.call_count == 1
+
+            mock_time.return_value = 1000.0 + store.TODAY_CACHE_TTL
+            assert store.get_today_iso() == today
+
+        assert mock_run.call_count == 2
+
+    def test_status_checks_day_reset_once(self):
+        """get_status should look up today's date once."""
+        from lib.state import State, RemoteStateStore
+
+        mock_store = MagicMock(spec=RemoteStateStore)
+        mock_store.load_state.return_value = {}
+        mock_store._load_succeeded = True
+        mock_store.timezone = None
+        mock_store.get_today_iso.return_value = date.today().isoformat()
+
+        state = State(remote_store=mock_store)
+        mock_store.get_today_iso.reset_mock()
+        state.get_status()
+
+        mock_store.get_today_iso.assert_called_once()
+
+
+class TestRemoteSaveState:
+    """Tests for RemoteStateStore.save_state."""
+
+    def test_streams_state_over_one_ssh_call(self):
+        """The state JSON should go over ssh's stdin, without a separate scp."""
+        from lib.state import RemoteStateStore
+
+        store = RemoteStateStore({
+            "enabled": True,
+            "host": "example.com",
+            "user": "test",
+            "state_path": "/etc/block/state.json",
+        })
+        store._load_succeeded = True
+
+        with patch("lib.state.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=b"", stderr=b"")
+            assert store.save_state({"date": "2026-01-08", "emergency_count": 1}) is True
+
+        mock_run.assert_called_once()
+        cmd = mock_run.call_args.args[0]
+        assert cmd[0] == "ssh"
+        assert "cat > /tmp/state.json.tmp" in cmd[-1]
+        assert "sudo mv /tmp/state.json.tmp /etc/block/state.json" in cmd[-1]
+        assert json.loads(mock_run.call_args.kwargs["input"]) == {
+            "date": "2026-01-08", "emergency_count": 1,
+        }
+
+    def test_retries_when_remote_lock_is_busy(self):
+        """A flock timeout on the remote should back off and retry."""
+        from lib.state import RemoteStateStore
+
+        store = RemoteStateStore({"enabled": True, "host": "example.com", "user": "test"})
+        store._load_succeeded = True
+        busy = MagicMock(returncode=RemoteStateStore.LOCK_BUSY_EXIT, stdout=b"", stderr=b"")
+
+        with patch("lib.state.subprocess.run") as mock_run, \
+             patch("lib.state.time.sleep") as mock_sleep:
+            mock_run.side_effect = [busy, MagicMock(returncode=0, stdout=b"", stderr=b"")]
+            assert store.save_state({"date": "2026-01-08"}) is True
+
+        assert mock_run.call_count == 2
+        mock_sleep.assert_called_once()
+        assert "flock -w 5 -E 75 -x" in mock_run.call_args.args[0][-1]
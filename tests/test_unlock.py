@@ -126,7 +126,7 @@ class TestProofOfWorkUnlock:
         self, mock_config, mock_hosts, mock_obsidian, mock_remote_sync, temp_state_file,
         patch_condition_registry
     ):
-        """Should sync remote when unlocking."""
+        """Should queue a remote sync when unlocking, without waiting for it."""
         from lib.state import State
 
         state = State(state_path=temp_state_file)
@@ -139,7 +139,11 @@ class TestProofOfWorkUnlock:
         manager.proof_of_work_unlock()
 
         # Should sync with empty list (unblock all)
-        mock_remote_sync.sync.assert_called_once_with([])
+        mock_remote_sync.sync_async.assert_called_once_with([], "state sync")
+        mock_remote_sync.sync.assert_not_called()
+
+        manager.wait_for_remote_sync()
+        mock_remote_sync.wait_pending.assert_called_once()
 
 
 class TestEmergencyUnlock:
@@ -295,7 +299,9 @@ class TestForceBlock:
         manager.force_block()
 
         # Should sync with blocked sites list
-        mock_remote_sync.sync.assert_called_once_with(mock_config.blocked_sites)
+        mock_remote_sync.sync_async.assert_called_once_with(
+            mock_config.blocked_sites, "state sync"
+        )
 
 
 class TestSyncBlockingState:
@@ -340,6 +346,43 @@ class TestSyncBlockingState:
         )
 
 
+class TestCountdown:
+    """Tests for the emergency unlock countdown."""
+
+    def test_single_sleep_without_terminal(self):
+        """Without a terminal, the wait should be one sleep with no output."""
+        from lib.unlock import _countdown
+
+        with patch("lib.unlock.sys.stdout") as mock_stdout, \
+             patch("lib.unlock.time.sleep") as mock_sleep:
+            mock_stdout.isatty.return_value = False
+            _countdown(30)
+
+        mock_sleep.assert_called_once_with(30)
+        mock_stdout.write.assert_not_called()
+
+    def test_counts_down_to_a_deadline(self):
+        """On a terminal, each second should be shown once, ending at the deadline."""
+        from lib.unlock import _countdown
+
+        clock = [100.0]
+
+        def sleep(seconds):
+            # Each wake-up runs a little late
+            clock[0] += seconds + 0.05
+
+        with patch("lib.unlock.sys.stdout") as mock_stdout, \
+             patch("lib.unlock.time.monotonic", side_effect=lambda: clock[0]), \
+             patch("lib.unlock.time.sleep", side_effect=sleep):
+            mock_stdout.isatty.return_value = True
+            _countdown(3)
+
+        shown = [c.args[0].split()[1] for c in mock_stdout.write.call_args_list]
+        assert shown == ["3", "2", "1"]
+        # Late wake-ups don't add up: it ends one wake-up past the deadline
+        assert clock[0] == pytest.approx(103.05)
+
+
 class TestCheckAllConditions:
     """Tests for check_all_conditions method."""
 
@@ -388,6 +431,207 @@ class TestCheckAllConditions:
 
         assert any_met is False
 
+    def test_reuses_results_within_block(
+        self, mock_config, mock_hosts, mock_obsidian, mock_remote_sync, temp_state_file,
+        patch_condition_registry
+    ):
+        """Conditions should be evaluated once inside reuse_condition_results()."""
+        from lib.state import State
+
+        state = State(state_path=temp_state_file)
+        mock_config.conditions = {
+            "workout": {"type": "checkbox", "pattern": "- [x] Workout"},
+        }
+        mock_config.unlock_settings["conditions_cache_ttl"] = 0
+        patch_condition_registry.check.return_value = (True, "Workout checked")
+
+        manager = UnlockManager(
+            mock_config, state, mock_hosts, mock_obsidian, mock_remote_sync
+        )
+        with manager.reuse_condition_results():
+            first = manager.check_all_conditions()
+            manager.get_status()
+            assert manager.check_all_conditions() == first
+        assert patch_condition_registry.check.call_count == 1
+
+        # Results are evaluated fresh once the block exits
+        manager.check_all_conditions()
+        assert patch_condition_registry.check.call_count == 2
+
+    def test_each_block_checks_conditions_again(
+        self, mock_config, mock_hosts, mock_obsidian, mock_remote_sync, temp_state_file,
+        patch_condition_registry
+    ):
+        """A later block shouldn't reuse the result cached by an earlier one."""
+        from lib.state import State
+
+        state = State(state_path=temp_state_file)
+        mock_config.conditions = {
+            "workout": {"type": "checkbox", "pattern": "- [x] Workout"},
+        }
+        patch_condition_registry.check.return_value = (False, "Not checked")
+
+        manager = UnlockManager(
+            mock_config, state, mock_hosts, mock_obsidian, mock_remote_sync
+        )
+        with patch("lib.unlock.time.monotonic", return_value=100.0), \
+             manager.reuse_condition_results():
+            assert manager.check_all_conditions()[0] is False
+
+        patch_condition_registry.check.return_value = (True, "Workout checked")
+        with patch("lib.unlock.time.monotonic", return_value=400.0), \
+             manager.reuse_condition_results():
+            assert manager.check_all_conditions()[0] is True
+            assert manager.check_all_conditions()[0] is True
+
+        assert patch_condition_registry.check.call_count == 2
+
+    def test_checks_condition_types_concurrently(
+        self, mock_config, mock_hosts, mock_obsidian, mock_remote_sync, temp_state_file
+    ):
+        """Different condition types should be checked at the same time, in config order."""
+        import threading
+        from lib.state import State
+
+        state = State(state_path=temp_state_file)
+        mock_config.conditions = {
+            "workout": {"type": "checkbox", "pattern": "- [x] Workout"},
+            "writing": {"type": "linked_wordcount", "minimum": 500},
+            "reading": {"type": "checkbox", "pattern": "- [x] Reading"},
+        }
+        # Each type's first check waits for the other type's, so checking
+        # them one after another would time out
+        both_started = threading.Barrier(2, timeout=5)
+
+        def create(condition_type, context):
+            condition = MagicMock()
+
+            def check(config):
+                if condition.check.call_count == 1:
+                    both_started.wait()
+                return True, config.get("pattern", condition_type)
+
+            condition.check.side_effect = check
+            return condition
+
+        manager = UnlockManager(
+            mock_config, state, mock_hosts, mock_obsidian, mock_remote_sync
+        )
+        with patch("lib.unlock.ConditionRegistry.create", side_effect=create):
+            satisfied, results = manager.check_all_conditions()
+
+        assert satisfied is True
+        assert results == [
+            ("workout", True, "- [x] Workout"),
+            ("writing", True, "linked_wordcount"),
+            ("reading", True, "- [x] Reading"),
+        ]
+
+    def test_reuses_results_until_ttl_expires(
+        self, mock_config, mock_hosts, mock_obsidian, mock_remote_sync, temp_state_file,
+        patch_condition_registry
+    ):
+        """Results should be reused for conditions_cache_ttl seconds, or until invalidated."""
+        from lib.state import State
+
+        state = State(state_path=temp_state_file)
+        patch_condition_registry.check.return_value = (True, "Workout checked")
+
+        manager = UnlockManager(
+            mock_config, state, mock_hosts, mock_obsidian, mock_remote_sync
+        )
+        with patch("lib.unlock.time.monotonic", return_value=100.0):
+            manager.check_all_conditions()
+            manager.get_status()
+        assert patch_condition_registry.check.call_count == 1
+
+        with patch("lib.unlock.time.monotonic", return_value=105.0):
+            manager.check_all_conditions()
+        assert patch_condition_registry.check.call_count == 2
+
+        manager.force_block()
+        manager.check_all_conditions()
+        assert patch_condition_registry.check.call_count == 3
+
+
+class TestCheckConditionsFast:
+    """Tests for check_conditions_fast method."""
+
+    def _manager(self, mock_config, mock_hosts, mock_obsidian, mock_remote_sync, temp_state_file):
+        """Build an UnlockManager around a real State."""
+        from lib.state import State
+
+        state = State(state_path=temp_state_file)
+        return UnlockManager(mock_config, state, mock_hosts, mock_obsidian, mock_remote_sync)
+
+    def test_any_mode_stops_at_first_met_cheapest_first(
+        self, mock_config, mock_hosts, mock_obsidian, mock_remote_sync, temp_state_file
+    ):
+        """A cheap met condition should settle "any" mode before slow ones run."""
+        mock_config.conditions = {
+            "run": {"type": "strava"},
+            "workout": {"type": "checkbox", "pattern": "- [x] Workout"},
+        }
+        checkbox = MagicMock()
+        checkbox.check.return_value = (True, "Workout checked")
+        strava = MagicMock()
+
+        manager = self._manager(
+            mock_config, mock_hosts, mock_obsidian, mock_remote_sync, temp_state_file
+        )
+        with patch(
+            "lib.unlock.ConditionRegistry.create",
+            side_effect=lambda t, _: checkbox if t == "checkbox" else strava,
+        ):
+            satisfied, results = manager.check_conditions_fast()
+
+        assert satisfied is True
+        assert results == [("workout", True, "Workout checked")]
+        strava.check.assert_not_called()
+
+    def test_all_mode_stops_at_first_unmet_and_learns_latency(
+        self, mock_config, mock_hosts, mock_obsidian, mock_remote_sync, temp_state_file,
+        patch_condition_registry
+    ):
+        """In "all" mode, the condition that was fastest before should be tried first."""
+        mock_config.condition_mode = "all"
+        mock_config.conditions = {
+            "workout": {"type": "checkbox", "pattern": "- [x] Workout"},
+            "reading": {"type": "checkbox", "pattern": "- [x] Reading"},
+        }
+        patch_condition_registry.check.return_value = (False, "Not checked")
+
+        manager = self._manager(
+            mock_config, mock_hosts, mock_obsidian, mock_remote_sync, temp_state_file
+        )
+        manager._cond_latency = {"workout": 0.5, "reading": 0.01}
+        satisfied, results = manager.check_conditions_fast()
+
+        assert satisfied is False
+        assert results == [("reading", False, "Not checked")]
+        patch_condition_registry.check.assert_called_once_with(
+            mock_config.conditions["reading"]
+        )
+        assert manager._cond_latency["reading"] < 0.01
+
+    def test_uses_check_fast_when_condition_class_defines_it(
+        self, mock_config, mock_hosts, mock_obsidian, mock_remote_sync, temp_state_file
+    ):
+        """Conditions that can stop early should be checked with check_fast."""
+        mock_config.conditions = {"words": {"type": "linked_wordcount", "minimum": 10}}
+
+        class WordsCondition:
+            check = MagicMock(return_value=(True, "Full count"))
+            check_fast = MagicMock(return_value=(True, "Partial count"))
+
+        manager = self._manager(
+            mock_config, mock_hosts, mock_obsidian, mock_remote_sync, temp_state_file
+        )
+        with patch("lib.unlock.ConditionRegistry.create", return_value=WordsCondition()):
+            assert manager.check_conditions_fast() == (True, [("words", True, "Partial count")])
+
+        WordsCondition.check.assert_not_called()
+
 
 class TestGetStatus:
     """Tests for get_status method."""
@@ -0,0 +1,166 @@
+"""Tests for lib/wordcount.py - Word counting in linked files."""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib.wordcount import WordCounter, _read_text
+
+
+class TestCountWords:
+    """Tests for WordCounter.count_words."""
+
+    def test_strips_markdown_syntax(self):
+        """Code, HTML and formatting markers should not be counted."""
+        counter = WordCounter(MagicMock())
+
+        text = (
+            "---\ntags: [draft]\n---\n"
+            "# Title here\n"
+            "- [x] **bold** and _italic_ words\n"
+            "See [the docs](https://example.com) <br> `code`\n"
+            "```\nignored block\n```\n"
+        )
+
+        assert counter.count_words(text) == 9
+
+    def test_long_text_counted_in_chunks(self):
+        """Words should be counted exactly across chunk boundaries."""
+        from lib.wordcount import _SPLIT_CHUNK
+
+        counter = WordCounter(MagicMock())
+        line = "alpha beta gamma\n"
+        text = line * (3 * _SPLIT_CHUNK // len(line)) + "x" * _SPLIT_CHUNK + " tail"
+
+        assert counter.count_words(text) == len(text.split())
+
+    def test_wiki_links_count_alias_or_target(self):
+        """A wiki-link should count as its alias, or its target if it has none."""
+        counter = WordCounter(MagicMock())
+
+        assert counter.count_words("[[Some Note]]") == 2
+        assert counter.count_words("[[Some Note|alias]]") == 1
+
+
+class TestLinkedFilesWordcount:
+    """Tests for WordCounter.get_linked_files_wordcount."""
+
+    def test_unchanged_files_are_not_recounted(self, temp_vault):
+        """A linked file should only be read again once it changes."""
+        from lib.obsidian import ObsidianParser
+
+        (temp_vault / "Essay.md").write_text("one two three")
+        parser = ObsidianParser(temp_vault)
+        parser.read_daily_note_cached = MagicMock(return_value="## Writing\n- [[Essay]]\n")
+        counter = WordCounter(parser)
+
+        with patch.object(counter, "count_words", wraps=counter.count_words) as mock_count:
+            assert counter.get_linked_files_wordcount("Writing") == (3, [("Essay", 3)])
+            assert counter.get_linked_files_wordcount("Writing") == (3, [("Essay", 3)])
+            assert mock_count.call_count == 1
+
+            (temp_vault / "Essay.md").write_text("one two three four")
+            assert counter.get_linked_files_wordcount("Writing") == (4, [("Essay", 4)])
+            assert mock_count.call_count == 2
+
+    def test_missing_files_are_skipped(self, temp_vault):
+        """Links to files that don't exist should not be listed."""
+        from lib.obsidian import ObsidianParser
+
+        parser = ObsidianParser(temp_vault)
+        parser.read_daily_note_cached = MagicMock(return_value="## Writing\n- [[Nowhere]]\n")
+
+        assert WordCounter(parser).get_linked_files_wordcount("Writing") == (0, [])
+
+    def test_reads_several_changed_files(self, temp_vault):
+        """Several linked files should all be counted, in link order."""
+        from lib.obsidian import ObsidianParser
+
+        (temp_vault / "One.md").write_text("a b c")
+        (temp_vault / "Two.md").write_text("a b")
+        # A directory can be stat()ed but not read, so it counts as 0
+        (temp_vault / "Dir.md").mkdir()
+        parser = ObsidianParser(temp_vault)
+        parser.read_daily_note_cached = MagicMock(
+            return_value="## Writing\n[[Two]] [[Dir]] [[One]] [[Two]]\n"
+        )
+
+        assert WordCounter(parser).get_linked_files_wordcount("Writing") == (
+            7, [("Two", 2), ("Dir", 0), ("One", 3), ("Two", 2)]
+        )
+
+    def test_unchanged_file_costs_one_stat(self, temp_vault):
+        """Resolving a link should stat the file once, reusing it for the cache key."""
+        from lib.obsidian import ObsidianParser
+
+        (temp_vault / "Essay.md").write_text("one two three")
+        parser = ObsidianParser(temp_vault)
+        parser.read_daily_note_cached = MagicMock(return_value="## Writing\n- [[Essay]]\n")
+        counter = WordCounter(parser)
+        counter.get_linked_files_wordcount("Writing")
+
+        with patch.object(Path, "stat", autospec=True, side_effect=Path.stat) as mock_stat:
+            assert counter.get_linked_files_wordcount("Writing") == (3, [("Essay", 3)])
+
+        stat_paths = [c.args[0] for c in mock_stat.call_args_list]
+        assert stat_paths.count(temp_vault / "Essay.md") == 1
+
+    def test_missing_link_is_not_resolved_again_right_away(self, temp_vault):
+        """A link to a missing file shouldn't walk the vault on every check."""
+        from lib.obsidian import ObsidianParser
+
+        parser = ObsidianParser(temp_vault)
+        parser.read_daily_note_cached = MagicMock(return_value="## Writing\n- [[Later]]\n")
+        counter = WordCounter(parser)
+
+        with patch.object(parser, "resolve_link_stat", wraps=parser.resolve_link_stat) as mock_resolve:
+            assert counter.get_linked_files_wordcount("Writing") == (0, [])
+            assert counter.get_linked_files_wordcount("Writing") == (0, [])
+            assert mock_resolve.call_count == 1
+
+            # A new file at the vault root changes its mtime, so the link is retried
+            (temp_vault / "Later.md").write_text("now it exists")
+            assert counter.get_linked_files_wordcount("Writing") == (3, [("Later", 3)])
+            assert mock_resolve.call_count == 2
+
+    def test_section_is_sliced_once_per_note(self, temp_vault):
+        """Conditions counting the same section of an unchanged note should share the slicing."""
+        from lib import obsidian
+        from lib.obsidian import ObsidianParser
+
+        (temp_vault / "Draft.md").write_text("one two")
+        parser = ObsidianParser(temp_vault)
+        parser.read_daily_note_cached = MagicMock(
+            return_value="## Drafting\n- [[Draft]]\n## Other\n- [[Elsewhere]]\n"
+        )
+
+        with patch("lib.obsidian._find_heading", wraps=obsidian._find_heading) as mock_find:
+            for counter in (WordCounter(parser), WordCounter(parser)):
+                assert counter.get_linked_files_wordcount("Drafting") == (2, [("Draft", 2)])
+
+        mock_find.assert_called_once()
+
+    def test_stops_reading_once_target_is_reached(self, temp_vault):
+        """With a target, files after the one that reaches it shouldn't be read."""
+        from lib.obsidian import ObsidianParser
+
+        (temp_vault / "One.md").write_text("a b c")
+        (temp_vault / "Two.md").write_text("a b")
+        (temp_vault / "Three.md").write_text("a b c d")
+        parser = ObsidianParser(temp_vault)
+        parser.read_daily_note_cached = MagicMock(
+            return_value="## Writing\n[[One]] [[Two]] [[Three]]\n"
+        )
+        counter = WordCounter(parser)
+
+        with patch("lib.wordcount._read_text", wraps=_read_text) as mock_read:
+            assert counter.get_linked_files_wordcount("Writing", target=5) == (
+                5, [("One", 3), ("Two", 2)]
+            )
+            assert mock_read.call_count == 2
+
+            # Without a target every file is counted, reusing the counts above
+            assert counter.get_linked_files_wordcount("Writing")[0] == 9
+            assert mock_read.call_count == 3
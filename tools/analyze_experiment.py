@@ -23,6 +23,11 @@ from typing import Any
 
 LOG_PATH = Path(__file__).parent.parent / ".logs" / "experiment.log"
 
+# The daemon logs one daemon_cycle event per check, or daemon_check +
+# daemon_check_complete when experiment.split_cycle_events is set
+CHECK_EVENTS = ("daemon_check", "daemon_cycle")
+COMPLETE_EVENTS = ("daemon_check_complete", "daemon_cycle")
+
 
 def parse_log_line(line: str) -> dict[str, Any] | None:
     """Parse a JSON log line."""
@@ -74,7 +79,7 @@ def analyze_auto_unlocks(entries: list[dict]) -> dict[str, Any]:
     """Analyze auto-unlock events for anomalies."""
     auto_unlocks = []
     for entry in entries:
-        if entry.get("event") == "daemon_check":
+        if entry.get("event") in CHECK_EVENTS:
             auto_info = entry.get("auto_unlock", {})
             if auto_info.get("any_conditions_met"):
                 # Check if this led to an actual unlock
@@ -124,38 +129,47 @@ def analyze_auto_unlocks(entries: list[dict]) -> dict[str, Any]:
 
 def analyze_unlock_expiry(entries: list[dict]) -> dict[str, Any]:
     """Analyze unlock expiry behavior."""
+    # Collect state snapshots in order
+    states = []
+    for entry in entries:
+        event = entry.get("event")
+        if event == "daemon_cycle":
+            # A combined cycle carries both the post-sync and final state
+            states.append((entry, entry.get("state_after_sync", {})))
+            states.append((entry, entry.get("state", {})))
+        elif event in ("daemon_check", "daemon_check_complete"):
+            states.append((entry, entry.get("state", entry.get("state_after_sync", {}))))
+
     # Look for state transitions from unlocked to blocked
     state_changes = []
     prev_state = None
 
-    for entry in entries:
-        if entry.get("event") in ("daemon_check", "daemon_check_complete"):
-            state = entry.get("state", entry.get("state_after_sync", {}))
-            is_blocked = state.get("is_blocked", True)
-            unlocked_until = state.get("unlocked_until", 0)
-
-            if prev_state is not None:
-                prev_blocked = prev_state.get("is_blocked", True)
-
-                # Transition: unlocked -> blocked (expiry)
-                if not prev_blocked and is_blocked:
-                    state_changes.append({
-                        "type": "expiry",
-                        "ts": entry.get("ts"),
-                        "prev_unlock_until": prev_state.get("unlocked_until"),
-                        "description": "Unlock expired, now blocked",
-                    })
-
-                # Transition: blocked -> unlocked
-                elif prev_blocked and not is_blocked:
-                    state_changes.append({
-                        "type": "unlock",
-                        "ts": entry.get("ts"),
-                        "unlocked_until": unlocked_until,
-                        "description": "Transitioned from blocked to unlocked",
-                    })
-
-            prev_state = state
+    for entry, state in states:
+        is_blocked = state.get("is_blocked", True)
+        unlocked_until = state.get("unlocked_until", 0)
+
+        if prev_state is not None:
+            prev_blocked = prev_state.get("is_blocked", True)
+
+            # Transition: unlocked -> blocked (expiry)
+            if not prev_blocked and is_blocked:
+                state_changes.append({
+                    "type": "expiry",
+                    "ts": entry.get("ts"),
+                    "prev_unlock_until": prev_state.get("unlocked_until"),
+                    "description": "Unlock expired, now blocked",
+                })
+
+            # Transition: blocked -> unlocked
+            elif prev_blocked and not is_blocked:
+                state_changes.append({
+                    "type": "unlock",
+                    "ts": entry.get("ts"),
+                    "unlocked_until": unlocked_until,
+                    "description": "Transitioned from blocked to unlocked",
+                })
+
+        prev_state = state
 
     return {
         "state_changes": state_changes,
@@ -170,7 +184,7 @@ def analyze_daemon_health(entries: list[dict]) -> dict[str, Any]:
     errors = []
 
     for entry in entries:
-        if entry.get("event") == "daemon_check":
+        if entry.get("event") in CHECK_EVENTS:
             checks.append(entry.get("ts"))
         if "error" in entry.get("event", "").lower():
             errors.append({
@@ -215,7 +229,7 @@ def generate_daily_summary(day: str, entries: list[dict]) -> dict[str, Any]:
         if auto_info.get("any_conditions_met"):
             conditions_met.append(entry.get("ts"))
 
-        if entry.get("event") == "daemon_check_complete":
+        if entry.get("event") in COMPLETE_EVENTS:
             action = entry.get("action", "")
             if action == "auto_unlock":
                 unlocks.append(entry.get("ts"))